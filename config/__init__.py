@@ -26,7 +26,8 @@ from config.settings import (
     DOCS_DIR,
     OUTPUT_DIR,
     DATA_DIR,
-    LOGS_DIR
+    LOGS_DIR,
+    ensure_dirs
 )
 
 __all__ = [
@@ -50,5 +51,6 @@ __all__ = [
     'DOCS_DIR',
     'OUTPUT_DIR',
     'DATA_DIR',
-    'LOGS_DIR'
+    'LOGS_DIR',
+    'ensure_dirs'
 ]
@@ -47,9 +47,17 @@ OUTPUT_DIR: Path = BASE_DIR / "output"
 DATA_DIR: Path = BASE_DIR / "data"
 LOGS_DIR: Path = BASE_DIR / "logs"
 
-# Create directories if they don't exist
-for directory in [OUTPUT_DIR, DATA_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+_DIRS_READY: bool = False
+
+
+def ensure_dirs() -> None:
+    """Create the output, data and logs directories (once per process)."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for directory in (OUTPUT_DIR, DATA_DIR, LOGS_DIR):
+        os.makedirs(directory, exist_ok=True)
+    _DIRS_READY = True
 
 
 # ============================================================================
@@ -83,6 +91,7 @@ class DatabaseConfig:
     - BIBLOS_DB_NAME: Database name
     - BIBLOS_DB_USER: Database user
     - BIBLOS_DB_PASSWORD: Database password
+    - BIBLOS_BATCH_SIZE: Rows per ingestion batch
     """
     host: str = field(default_factory=lambda: os.getenv("BIBLOS_DB_HOST", "localhost"))
     port: int = field(default_factory=lambda: _get_env_int("BIBLOS_DB_PORT", 5432))
@@ -98,6 +107,9 @@ class DatabaseConfig:
     connect_timeout: int = 30
     statement_timeout: int = 300000  # 5 minutes for complex queries
     
+    # Rows buffered per ingestion flush; bounds memory for large source files
+    batch_size: int = field(default_factory=lambda: _get_env_int("BIBLOS_BATCH_SIZE", 2000))
+    
     @property
     def connection_string(self) -> str:
         """Get the PostgreSQL connection string."""
@@ -301,6 +313,7 @@ class APIConfig:
     # Bible API for verse text
     bible_api_key: str = os.getenv("BIBLE_API_KEY", "")
     bible_api_base_url: str = "https://api.scripture.api.bible/v1"
+    bible_api_cache: Path = OUTPUT_DIR / "bible_api_cache.sqlite"
     
     # Request settings
     request_timeout: int = 60
@@ -16,49 +16,89 @@ This module provides pre-computed, hardcoded data to:
 Primary Access Point: BiblosData (from unified.py)
 """
 
-# Legacy providers (for backwards compatibility)
-from .offline_bible import OfflineBibleProvider, get_offline_provider
-from .liturgical_calendar import LiturgicalCalendar, get_liturgical_calendar
-from .patristic_data import PatristicDatabase, get_patristic_database
+from importlib import import_module
+from typing import Any, Dict, List, Tuple
 
-# New pre-computed data modules
+# Book metadata is small and needed by nearly every caller; load it eagerly.
 from .precomputed import (
-    BOOK_METADATA, BookMeta, CANONICAL_ORDER, VERSE_COUNTS,
+    BOOK_METADATA, BOOK_META, BookMeta, CANONICAL_ORDER, VERSE_COUNTS,
     HIGH_THEOLOGICAL_WEIGHT_VERSES, CATEGORY_MATRIX_VALUES,
     get_book_meta, normalize_book_name, is_high_theological_weight
 )
 
-from .orthodox_study_bible import (
-    VerseExegesis, TonalWeight, 
-    get_verse_exegesis, get_book_exegesis, get_statistics as get_exegesis_stats
-)
+from .unified import BiblosData
 
-from .narrative_order import (
-    NarrativeEvent, NarrativePart,
-    get_narrative_order, get_terminal_event, get_events_by_part,
-    find_echoes, find_plantings
-)
+# Everything else is imported on first attribute access (PEP 562), so
+# `from data import get_book_meta` does not execute the exegesis, typology,
+# morphology or patristic tables.
+_LAZY_ATTRS: Dict[str, Tuple[str, str]] = {
+    # Legacy providers (for backwards compatibility)
+    'OfflineBibleProvider': ('offline_bible', 'OfflineBibleProvider'),
+    'get_offline_provider': ('offline_bible', 'get_offline_provider'),
+    'LiturgicalCalendar': ('liturgical_calendar', 'LiturgicalCalendar'),
+    'get_liturgical_calendar': ('liturgical_calendar', 'get_liturgical_calendar'),
+    'PatristicDatabase': ('patristic_data', 'PatristicDatabase'),
+    'get_patristic_database': ('patristic_data', 'get_patristic_database'),
+    # Exegesis
+    'VerseExegesis': ('orthodox_study_bible', 'VerseExegesis'),
+    'TonalWeight': ('orthodox_study_bible', 'TonalWeight'),
+    'get_verse_exegesis': ('orthodox_study_bible', 'get_verse_exegesis'),
+    'get_book_exegesis': ('orthodox_study_bible', 'get_book_exegesis'),
+    'get_exegesis_stats': ('orthodox_study_bible', 'get_statistics'),
+    # Narrative order
+    'NarrativeEvent': ('narrative_order', 'NarrativeEvent'),
+    'NarrativePart': ('narrative_order', 'NarrativePart'),
+    'get_narrative_order': ('narrative_order', 'get_narrative_order'),
+    'get_terminal_event': ('narrative_order', 'get_terminal_event'),
+    'get_events_by_part': ('narrative_order', 'get_events_by_part'),
+    'find_echoes': ('narrative_order', 'find_echoes'),
+    'find_plantings': ('narrative_order', 'find_plantings'),
+    # Character voices
+    'CharacterVoice': ('character_voices', 'CharacterVoice'),
+    'VoiceRegister': ('character_voices', 'VoiceRegister'),
+    'CharacterType': ('character_voices', 'CharacterType'),
+    'get_voice': ('character_voices', 'get_voice'),
+    'get_voices_by_type': ('character_voices', 'get_voices_by_type'),
+    'get_voices_by_register': ('character_voices', 'get_voices_by_register'),
+    'ALL_VOICES': ('character_voices', 'ALL_VOICES'),
+    # Hebrew/Greek morphology
+    'HebrewTerm': ('morphology', 'HebrewTerm'),
+    'GreekTerm': ('morphology', 'GreekTerm'),
+    'Language': ('morphology', 'Language'),
+    'TheologicalWeight': ('morphology', 'TheologicalWeight'),
+    'get_hebrew_term': ('morphology', 'get_hebrew_term'),
+    'get_greek_term': ('morphology', 'get_greek_term'),
+    'get_terms_by_motif': ('morphology', 'get_terms_by_motif'),
+    'get_ultra_terms': ('morphology', 'get_ultra_terms'),
+    'ALL_HEBREW': ('morphology', 'ALL_HEBREW'),
+    'ALL_GREEK': ('morphology', 'ALL_GREEK'),
+    # Cross-references / Typology
+    'TypologicalCorrespondence': ('cross_references', 'TypologicalCorrespondence'),
+    'TypeCategory': ('cross_references', 'TypeCategory'),
+    'CorrespondenceStrength': ('cross_references', 'CorrespondenceStrength'),
+    'get_antitype': ('cross_references', 'get_antitype'),
+    'get_type': ('cross_references', 'get_type'),
+    'get_by_category': ('cross_references', 'get_by_category'),
+    'get_explicit': ('cross_references', 'get_explicit'),
+    'get_sensory_network': ('cross_references', 'get_sensory_network'),
+    'ALL_CORRESPONDENCES': ('cross_references', 'ALL_CORRESPONDENCES'),
+}
 
-# Enhanced modules
-from .character_voices import (
-    CharacterVoice, VoiceRegister, CharacterType,
-    get_voice, get_voices_by_type, get_voices_by_register,
-    ALL_VOICES
-)
 
-from .morphology import (
-    HebrewTerm, GreekTerm, Language, TheologicalWeight,
-    get_hebrew_term, get_greek_term, get_terms_by_motif, get_ultra_terms,
-    ALL_HEBREW, ALL_GREEK
-)
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name's submodule on first access and cache it."""
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f'.{module}', __name__), attr)
+    globals()[name] = value
+    return value
 
-from .cross_references import (
-    TypologicalCorrespondence, TypeCategory, CorrespondenceStrength,
-    get_antitype, get_type, get_by_category, get_explicit, get_sensory_network,
-    ALL_CORRESPONDENCES
-)
 
-from .unified import BiblosData
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Legacy providers
@@ -67,7 +107,7 @@ __all__ = [
     'PatristicDatabase', 'get_patristic_database',
     
     # Book metadata
-    'BOOK_METADATA', 'BookMeta', 'CANONICAL_ORDER', 'VERSE_COUNTS',
+    'BOOK_METADATA', 'BOOK_META', 'BookMeta', 'CANONICAL_ORDER', 'VERSE_COUNTS',
     'get_book_meta', 'normalize_book_name',
     
     # Verse data
@@ -12,6 +12,9 @@ and structural correspondence, not through verbal coincidence."
 THE NARRATIVE ENDS AT THE CROSS.
 """
 
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -792,30 +795,62 @@ ALL_CORRESPONDENCES: List[TypologicalCorrespondence] = (
 )
 
 
+def _group_by(key) -> Dict[object, Tuple[TypologicalCorrespondence, ...]]:
+    """Group ALL_CORRESPONDENCES by key(c), preserving registry order."""
+    groups: Dict[object, List[TypologicalCorrespondence]] = defaultdict(list)
+    for c in ALL_CORRESPONDENCES:
+        groups[key(c)].append(c)
+    return {k: tuple(v) for k, v in groups.items()}
+
+
+# Indexes built once; the registry is fixed at import
+_BY_CATEGORY = _group_by(attrgetter('category'))
+_BY_STRENGTH = _group_by(attrgetter('strength'))
+_sensory: Dict[str, List[TypologicalCorrespondence]] = defaultdict(list)
+for _c in ALL_CORRESPONDENCES:
+    for _term in dict.fromkeys(_c.sensory_links):
+        _sensory[_term].append(_c)
+_BY_SENSORY: Dict[str, Tuple[TypologicalCorrespondence, ...]] = {
+    term: tuple(found) for term, found in _sensory.items()
+}
+del _sensory, _c, _term
+
+
+# Type/antitype lookups are substring matches ("Exodus 12" finds
+# "Exodus 12:3-13"), so they cannot be exact-key dicts; memoize per query.
+@lru_cache(maxsize=1024)
+def _antitypes_of(ot_reference: str) -> Tuple[TypologicalCorrespondence, ...]:
+    return tuple(c for c in ALL_CORRESPONDENCES if ot_reference in c.type_reference)
+
+
+@lru_cache(maxsize=1024)
+def _types_of(nt_reference: str) -> Tuple[TypologicalCorrespondence, ...]:
+    return tuple(c for c in ALL_CORRESPONDENCES if nt_reference in c.antitype_reference)
+
+
 def get_antitype(ot_reference: str) -> List[TypologicalCorrespondence]:
     """Get all correspondences where OT reference is the type."""
-    return [c for c in ALL_CORRESPONDENCES if ot_reference in c.type_reference]
+    return list(_antitypes_of(ot_reference))
 
 
 def get_type(nt_reference: str) -> List[TypologicalCorrespondence]:
     """Get all correspondences where NT reference is the antitype."""
-    return [c for c in ALL_CORRESPONDENCES if nt_reference in c.antitype_reference]
+    return list(_types_of(nt_reference))
 
 
 def get_by_category(category: TypeCategory) -> List[TypologicalCorrespondence]:
     """Get all correspondences of a specific category."""
-    return [c for c in ALL_CORRESPONDENCES if c.category == category]
+    return list(_BY_CATEGORY.get(category, ()))
 
 
 def get_explicit() -> List[TypologicalCorrespondence]:
     """Get all explicit (NT-identified) correspondences."""
-    return [c for c in ALL_CORRESPONDENCES 
-            if c.strength == CorrespondenceStrength.EXPLICIT]
+    return list(_BY_STRENGTH.get(CorrespondenceStrength.EXPLICIT, ()))
 
 
 def get_sensory_network(sensory_term: str) -> List[TypologicalCorrespondence]:
     """Get all correspondences sharing a sensory link."""
-    return [c for c in ALL_CORRESPONDENCES if sensory_term in c.sensory_links]
+    return list(_BY_SENSORY.get(sensory_term, ()))
 
 
 def build_cross_reference_index() -> Dict[str, Set[str]]:
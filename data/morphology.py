@@ -12,6 +12,7 @@ through original language resonance.
 THE NARRATIVE ENDS AT THE CROSS.
 """
 
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -1006,6 +1007,20 @@ ALL_HEBREW: Dict[str, HebrewTerm] = {**HEBREW_ULTRA, **HEBREW_MAJOR, **HEBREW_AD
 ALL_GREEK: Dict[str, GreekTerm] = {**GREEK_ULTRA, **GREEK_MAJOR, **GREEK_ADDITIONAL}
 
 
+def _index_by_motif(terms) -> Dict[str, tuple]:
+    """Invert motif_associations: motif -> terms in registry order."""
+    index: Dict[str, list] = defaultdict(list)
+    for term in terms:
+        for motif in dict.fromkeys(term.motif_associations):
+            index[motif].append(term)
+    return {motif: tuple(found) for motif, found in index.items()}
+
+
+# Motif -> associated terms, built once for get_terms_by_motif()
+_MOTIF_TO_HEBREW: Dict[str, Tuple[HebrewTerm, ...]] = _index_by_motif(ALL_HEBREW.values())
+_MOTIF_TO_GREEK: Dict[str, Tuple[GreekTerm, ...]] = _index_by_motif(ALL_GREEK.values())
+
+
 def get_hebrew_term(term: str) -> Optional[HebrewTerm]:
     """Get a Hebrew term by its Hebrew text."""
     return ALL_HEBREW.get(term)
@@ -1018,9 +1033,7 @@ def get_greek_term(term: str) -> Optional[GreekTerm]:
 
 def get_terms_by_motif(motif: str) -> Tuple[List[HebrewTerm], List[GreekTerm]]:
     """Get all Hebrew and Greek terms associated with a motif."""
-    hebrew = [t for t in ALL_HEBREW.values() if motif in t.motif_associations]
-    greek = [t for t in ALL_GREEK.values() if motif in t.motif_associations]
-    return hebrew, greek
+    return list(_MOTIF_TO_HEBREW.get(motif, ())), list(_MOTIF_TO_GREEK.get(motif, ()))
 
 
 def get_ultra_terms() -> Tuple[List[HebrewTerm], List[GreekTerm]]:
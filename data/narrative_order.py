@@ -33,8 +33,10 @@ Per Hermeneutical.txt:
 FIRST REVISION COMPLETE. SECOND REVISION INTEGRATED.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -1109,31 +1111,89 @@ NARRATIVE_ORDER: List[NarrativeEvent] = [
 # ACCESS FUNCTIONS
 # ============================================================================
 
+# Frozen views of NARRATIVE_ORDER, built once; the ordering is fixed at import
+_NARRATIVE_EVENTS: Tuple[NarrativeEvent, ...] = tuple(NARRATIVE_ORDER)
+_EVENTS_BY_PART: Dict[NarrativePart, Tuple[NarrativeEvent, ...]] = {
+    part: tuple(e for e in _NARRATIVE_EVENTS if e.part == part) for part in NarrativePart
+}
+
+
 def get_narrative_order() -> List[NarrativeEvent]:
     """Get the complete narrative ordering."""
-    return NARRATIVE_ORDER.copy()
+    return list(_NARRATIVE_EVENTS)
+
+
+def get_narrative_events() -> Tuple[NarrativeEvent, ...]:
+    """Get the complete narrative ordering as a shared, read-only tuple."""
+    return _NARRATIVE_EVENTS
 
 
 def get_terminal_event() -> NarrativeEvent:
     """Get the terminal event (the Cross)."""
-    return NARRATIVE_ORDER[-1]
+    return _NARRATIVE_EVENTS[-1]
 
 
 def get_events_by_part(part: NarrativePart) -> List[NarrativeEvent]:
     """Get all events in a specific part."""
-    return [e for e in NARRATIVE_ORDER if e.part == part]
+    return list(_EVENTS_BY_PART.get(part, ()))
+
+
+class _PhraseIndex:
+    """
+    Substring search over one phrase field of NARRATIVE_ORDER.
+    
+    The lower-cased phrases are joined into a single NUL-separated blob, so a
+    query is one C-level str.find scan instead of a per-event loop; event
+    start offsets map hits back to events. Query results are memoized.
+    """
+    
+    __slots__ = ('events', 'phrases', 'blob', 'starts', 'find')
+    
+    _SEP = '\0'
+    
+    def __init__(self, attr: str):
+        self.events: Tuple[NarrativeEvent, ...] = tuple(
+            e for e in NARRATIVE_ORDER if getattr(e, attr)
+        )
+        self.phrases = tuple(getattr(e, attr).lower() for e in self.events)
+        starts, pos = [], 0
+        for phrase in self.phrases:
+            starts.append(pos)
+            pos += len(phrase) + 1
+        self.blob = self._SEP.join(self.phrases)
+        self.starts = starts
+        self.find = lru_cache(maxsize=1024)(self._find)
+    
+    def _find(self, needle: str) -> Tuple[NarrativeEvent, ...]:
+        events, blob, starts = self.events, self.blob, self.starts
+        if not needle:
+            return events
+        if self._SEP in needle:
+            # Could straddle two phrases in the blob; compare one by one
+            return tuple(e for e, p in zip(events, self.phrases) if needle in p)
+        hits: List[NarrativeEvent] = []
+        i = blob.find(needle)
+        while i != -1:
+            idx = bisect_right(starts, i) - 1
+            hits.append(events[idx])
+            if idx + 1 == len(starts):
+                break
+            i = blob.find(needle, starts[idx + 1])
+        return tuple(hits)
+
+
+_ECHO_INDEX = _PhraseIndex('echoes_phrase')
+_PLANT_INDEX = _PhraseIndex('plants_phrase')
 
 
 def find_echoes(phrase: str) -> List[NarrativeEvent]:
     """Find events that echo a specific phrase."""
-    return [e for e in NARRATIVE_ORDER 
-            if e.echoes_phrase and phrase.lower() in e.echoes_phrase.lower()]
+    return list(_ECHO_INDEX.find(phrase.lower()))
 
 
 def find_plantings(phrase: str) -> List[NarrativeEvent]:
     """Find events that plant a specific phrase."""
-    return [e for e in NARRATIVE_ORDER 
-            if e.plants_phrase and phrase.lower() in e.plants_phrase.lower()]
+    return list(_PLANT_INDEX.find(phrase.lower()))
 
 
 def get_statistics() -> dict:
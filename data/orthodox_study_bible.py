@@ -47,7 +47,14 @@ class NarrativeFunction(Enum):
     SEED = "seed"
 
 
-@dataclass(frozen=True)
+# Exegesis records are immutable; on 3.10+ they also drop the per-instance
+# __dict__ (README still supports 3.9, where slots=True is unavailable).
+_RECORD_OPTIONS: Dict[str, bool] = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _RECORD_OPTIONS['slots'] = True
+
+
+@dataclass(**_RECORD_OPTIONS)
 class VerseExegesis:
     """Complete pre-computed exegesis for a single verse."""
     reference: str
@@ -1546,6 +1553,40 @@ ORTHODOX_STUDY_BIBLE: Dict[str, Dict[str, VerseExegesis]] = {
 }
 
 
+# ============================================================================
+# VALUE POOLING
+# ============================================================================
+
+# Tuple-of-string fields repeat heavily across verses (shared cross
+# references, shadows, seed lists). Intern their strings and share one tuple
+# per distinct value; the short label fields are interned as well.
+_POOLED_TUPLE_FIELDS: Tuple[str, ...] = (
+    'typological_shadows', 'typological_fulfillments', 'cross_references',
+    'visual_seeds', 'auditory_seeds', 'tactile_seeds',
+)
+_INTERNED_STR_FIELDS: Tuple[str, ...] = (
+    'reference', 'breath_rhythm', 'plants_phrase', 'echoes_phrase',
+)
+
+
+def _pool_registry() -> None:
+    """Intern and deduplicate the registry's string/tuple fields in place."""
+    pool: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    set_ = object.__setattr__  # VerseExegesis is frozen
+    for book_data in ORTHODOX_STUDY_BIBLE.values():
+        for ex in book_data.values():
+            for name in _POOLED_TUPLE_FIELDS:
+                value = tuple(map(sys.intern, getattr(ex, name)))
+                set_(ex, name, pool.setdefault(value, value))
+            for name in _INTERNED_STR_FIELDS:
+                value = getattr(ex, name)
+                if value:
+                    set_(ex, name, sys.intern(value))
+
+
+_pool_registry()
+
+
 def get_verse_exegesis(reference: str) -> Optional[VerseExegesis]:
     """Get pre-computed exegesis for a verse reference."""
     for book_data in ORTHODOX_STUDY_BIBLE.values():
@@ -6,9 +6,25 @@ Zero runtime computation for deterministic operations.
 """
 
 import sys
+from array import array
+from bisect import bisect_left
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Any, Optional
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+
+# NumPy is optional and only imported by the batch helpers, on first call:
+# importing it costs several times more than the rest of this package.
+NUMPY_AVAILABLE: bool = find_spec('numpy') is not None
+
+
+@lru_cache(maxsize=None)
+def _np() -> Any:
+    """The numpy module, imported on first use. Check NUMPY_AVAILABLE first."""
+    import numpy
+    return numpy
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -69,6 +85,13 @@ VERSE_COUNTS = {
     },
 }
 
+# Flattened (book, chapter) -> verse count for single-probe lookups
+_VERSE_COUNTS_FLAT: Dict[Tuple[str, int], int] = {
+    (book, chapter): count
+    for book, chapters in VERSE_COUNTS.items()
+    for chapter, count in chapters.items()
+}
+
 
 # ============================================================================
 # PRE-COMPUTED BOOK METADATA
@@ -171,6 +194,47 @@ BOOK_METADATA: Dict[str, BookMeta] = {
 CANONICAL_ORDER: Dict[str, int] = {book: meta.canonical_order for book, meta in BOOK_METADATA.items()}
 
 
+# ============================================================================
+# BOOK COLUMNS (Structure-of-Arrays mirror of BOOK_METADATA for aggregates)
+# ============================================================================
+
+TESTAMENTS: Tuple[str, ...] = ('old', 'new', 'deuterocanonical')
+BOOK_CATEGORIES: Tuple[str, ...] = tuple(sorted({m.category for m in BOOK_METADATA.values()}))
+
+_TESTAMENT_CODE: Dict[str, int] = {t: i for i, t in enumerate(TESTAMENTS)}
+_CATEGORY_CODE: Dict[str, int] = {c: i for i, c in enumerate(BOOK_CATEGORIES)}
+
+# One entry per book in BOOK_METADATA order; testament/category as codes into
+# TESTAMENTS / BOOK_CATEGORIES. Only a few dozen rows, so these stay plain
+# arrays and are counted without NumPy.
+_BOOK_TESTAMENT = array('b', [_TESTAMENT_CODE[m.testament] for m in BOOK_METADATA.values()])
+_BOOK_CATEGORY = array('b', [_CATEGORY_CODE[m.category] for m in BOOK_METADATA.values()])
+_BOOK_VERSES = array('l', [m.total_verses for m in BOOK_METADATA.values()])
+
+
+def _code_counts(codes: Any, labels: Tuple[str, ...]) -> Dict[str, int]:
+    """Histogram of a code column, keyed by label."""
+    counts = [0] * len(labels)
+    for c in codes:
+        counts[c] += 1
+    return dict(zip(labels, counts))
+
+
+def get_testament_counts() -> Dict[str, int]:
+    """Number of books per testament."""
+    return _code_counts(_BOOK_TESTAMENT, TESTAMENTS)
+
+
+def get_category_counts() -> Dict[str, int]:
+    """Number of books per category."""
+    return _code_counts(_BOOK_CATEGORY, BOOK_CATEGORIES)
+
+
+def get_total_verses() -> int:
+    """Total verse count across all books."""
+    return sum(_BOOK_VERSES)
+
+
 # ============================================================================
 # PRE-COMPUTED BOOK ALIASES (Normalized Lookup)
 # ============================================================================
@@ -272,20 +336,40 @@ def precompute_harmonic_pages(planting: int, convergence: int) -> Tuple[int, ...
     return tuple(planting + int(distance * r) for r in HARMONIC_RATIOS)
 
 
-# Pre-computed for all primary motifs
+# Pre-computed for all primary motifs: precompute_harmonic_pages(planting, convergence)
+# emitted as literals so module import does no arithmetic.
 MOTIF_HARMONICS: Dict[str, Tuple[int, ...]] = {
-    'The Lamb': precompute_harmonic_pages(50, 2400),      # (1225, 2006, 2253)
-    'Wood': precompute_harmonic_pages(20, 2200),          # (1110, 1836, 2063)
-    'Silence': precompute_harmonic_pages(100, 2200),      # (1150, 1850, 2069)
-    'The Binding': precompute_harmonic_pages(700, 2200),  # (1450, 1950, 2106)
-    'Water': precompute_harmonic_pages(10, 1800),         # (905, 1500, 1688)
-    'Fire': precompute_harmonic_pages(300, 2050),         # (1175, 1758, 1941)
-    'Blood': precompute_harmonic_pages(50, 2200),         # (1125, 1842, 2069)
-    'Bread': precompute_harmonic_pages(400, 2100),        # (1250, 1817, 1994)
-    'Shepherd': precompute_harmonic_pages(50, 1900),      # (975, 1592, 1784)
-    'Stone': precompute_harmonic_pages(750, 2000),        # (1375, 1792, 1922)
+    'The Lamb': (1225, 2007, 2253),     # (50, 2400)
+    'Wood': (1110, 1835, 2063),         # (20, 2200)
+    'Silence': (1150, 1849, 2068),      # (100, 2200)
+    'The Binding': (1450, 1949, 2106),  # (700, 2200)
+    'Water': (905, 1501, 1688),         # (10, 1800)
+    'Fire': (1175, 1757, 1940),         # (300, 2050)
+    'Blood': (1125, 1840, 2065),        # (50, 2200)
+    'Bread': (1250, 1816, 1993),        # (400, 2100)
+    'Shepherd': (975, 1591, 1784),      # (50, 1900)
+    'Stone': (1375, 1791, 1921),        # (750, 2000)
 }
 
+if __debug__:
+    _HARMONIC_SOURCES = {
+        'The Lamb': (50, 2400),
+        'Wood': (20, 2200),
+        'Silence': (100, 2200),
+        'The Binding': (700, 2200),
+        'Water': (10, 1800),
+        'Fire': (300, 2050),
+        'Blood': (50, 2200),
+        'Bread': (400, 2100),
+        'Shepherd': (50, 1900),
+        'Stone': (750, 2000),
+    }
+    assert all(
+        MOTIF_HARMONICS[motif] == precompute_harmonic_pages(*source)
+        for motif, source in _HARMONIC_SOURCES.items()
+    ), "MOTIF_HARMONICS literals out of sync with HARMONIC_RATIOS"
+    del _HARMONIC_SOURCES
+
 
 # ============================================================================
 # PRE-COMPUTED INTENSITY CURVE VALUES
@@ -313,6 +397,39 @@ def get_intensity_for_position(orbital_position: float) -> float:
         return INTENSITY_CURVE['convergence']
 
 
+# Upper bounds (inclusive) of each orbital stage and the matching intensity,
+# in the same order as the branches of get_intensity_for_position().
+_INTENSITY_BOUNDS: Tuple[float, ...] = (0.1, 0.3, 0.6, 0.85)
+_INTENSITY_LEVELS: Tuple[float, ...] = tuple(
+    INTENSITY_CURVE[k] for k in
+    ('planting', 'early_reinforcement', 'mid_trajectory', 'low_point', 'convergence')
+)
+
+
+@lru_cache(maxsize=None)
+def _intensity_arrays() -> Tuple[Any, Any]:
+    """NumPy copies of the stage bounds and levels, built on first batch call."""
+    np = _np()
+    return (np.array(_INTENSITY_BOUNDS, dtype=np.float64),
+            np.array(_INTENSITY_LEVELS, dtype=np.float64))
+
+
+def get_intensities(positions: Any) -> Any:
+    """
+    Batch form of get_intensity_for_position().
+    
+    With NumPy, accepts any array-like and returns a float64 array of the same
+    shape (one searchsorted over the stage bounds). Without NumPy, returns a
+    list of floats from the scalar function.
+    """
+    if NUMPY_AVAILABLE:
+        np = _np()
+        bounds, levels = _intensity_arrays()
+        idx = np.searchsorted(bounds, np.asarray(positions, dtype=np.float64), side='left')
+        return levels[idx]
+    return [get_intensity_for_position(p) for p in positions]
+
+
 # ============================================================================
 # PRE-COMPUTED CATEGORY BASE VALUES FOR NINE-MATRIX
 # ============================================================================
@@ -331,6 +448,25 @@ CATEGORY_MATRIX_VALUES: Dict[str, Dict[str, float]] = {
     'deuterocanonical': {'emotional': 0.55, 'theological': 0.65, 'sensory': 0.55},
 }
 
+# Dense row-per-category layout for vectorized scoring (rows follow
+# CATEGORY_MATRIX_VALUES insertion order, columns follow CATEGORY_DIMENSIONS)
+CATEGORY_DIMENSIONS: Tuple[str, ...] = ('emotional', 'theological', 'sensory')
+_CATEGORY_NAMES: Tuple[str, ...] = tuple(CATEGORY_MATRIX_VALUES)
+_CATEGORY_INDEX: Dict[str, int] = {name: i for i, name in enumerate(_CATEGORY_NAMES)}
+_CATEGORY_ROWS: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(CATEGORY_MATRIX_VALUES[name][dim] for dim in CATEGORY_DIMENSIONS)
+    for name in _CATEGORY_NAMES
+)
+
+
+@lru_cache(maxsize=None)
+def _category_matrix() -> Any:
+    """Read-only float32 matrix of _CATEGORY_ROWS, built on first use."""
+    np = _np()
+    matrix = np.array(_CATEGORY_ROWS, dtype=np.float32)
+    matrix.setflags(write=False)
+    return matrix
+
 
 # ============================================================================
 # PRE-COMPUTED SPECIAL VERSES (High Theological Weight)
@@ -379,11 +515,16 @@ ORTHODOX_PASCHA_DATES: Dict[int, Tuple[int, int]] = {
     2025: (4, 20), 2026: (4, 12), 2027: (5, 2), 2028: (4, 16), 2029: (4, 8),
     2030: (4, 28), 2031: (4, 13), 2032: (5, 2), 2033: (4, 24), 2034: (4, 9),
     2035: (4, 29), 2036: (4, 20), 2037: (4, 5), 2038: (4, 25), 2039: (4, 17),
-    2040: (5, 6), 2041: (4, 21), 2042: (4, 6), 2043: (4, 26), 2044: (4, 17),
-    2045: (5, 7), 2046: (4, 22), 2047: (4, 14), 2048: (5, 3), 2049: (4, 18),
-    2050: (4, 10),
+    2040: (5, 6), 2041: (4, 21), 2042: (4, 13), 2043: (5, 3), 2044: (4, 24),
+    2045: (4, 9), 2046: (4, 29), 2047: (4, 21), 2048: (4, 5), 2049: (4, 25),
+    2050: (4, 17),
 }
 
+# get_pascha_date() computes the date in closed form; the table above is the
+# validated reference it is checked against at import.
+_PASCHA_MIN_YEAR = 1900
+_PASCHA_MAX_YEAR = 2099
+
 
 # ============================================================================
 # PRE-COMPUTED REGISTER MAPPINGS
@@ -404,6 +545,29 @@ CATEGORY_REGISTERS: Dict[str, str] = {
 }
 
 
+# ============================================================================
+# INTERNED LOOKUP KEYS
+# Lookup tables are probed with strings built from user input; interning the
+# keys and string values up front keeps hashes cached and lets downstream
+# equality checks short-circuit on identity.
+# ============================================================================
+
+BOOK_METADATA = {sys.intern(k): v for k, v in BOOK_METADATA.items()}
+BOOK_ALIASES = {sys.intern(k): sys.intern(v) for k, v in BOOK_ALIASES.items()}
+CATEGORY_REGISTERS = {sys.intern(k): sys.intern(v) for k, v in CATEGORY_REGISTERS.items()}
+MOTIF_HARMONICS = {sys.intern(k): v for k, v in MOTIF_HARMONICS.items()}
+
+# One table for every accepted spelling: canonical names map to themselves
+# and lowercase aliases to their canonical name, so an already-canonical
+# input resolves in a single probe without calling str.lower().
+_BOOK_NORMALIZE: Dict[str, str] = {name: name for name in BOOK_METADATA}
+for _name in BOOK_METADATA:
+    _BOOK_NORMALIZE.setdefault(sys.intern(_name.lower()), _name)
+for _alias, _name in BOOK_ALIASES.items():
+    _BOOK_NORMALIZE.setdefault(_alias, _name)
+del _alias, _name
+
+
 # ============================================================================
 # PRE-COMPUTED BREATH RHYTHM PATTERNS
 # ============================================================================
@@ -415,62 +579,132 @@ def get_breath_rhythm(verse_number: int) -> str:
     return BREATH_PATTERNS[verse_number % len(BREATH_PATTERNS)]
 
 
+def get_breath_rhythm_codes(verse_numbers: Any) -> Any:
+    """
+    Batch form of get_breath_rhythm() returning indexes into BREATH_PATTERNS.
+    
+    Returns an intp array with NumPy, otherwise a list of ints.
+    """
+    if NUMPY_AVAILABLE:
+        np = _np()
+        return np.mod(np.asarray(verse_numbers, dtype=np.intp), len(BREATH_PATTERNS))
+    n = len(BREATH_PATTERNS)
+    return [v % n for v in verse_numbers]
+
+
 # ============================================================================
 # PRE-COMPUTED NARRATIVE FUNCTION THRESHOLDS
 # ============================================================================
 
+NARRATIVE_FUNCTIONS: Tuple[str, ...] = (
+    'scene-setting', 'exposition', 'development', 'intensification', 'climax', 'resolution'
+)
+# Inclusive upper verse number of each function except the open-ended last one
+_NARRATIVE_FUNCTION_BOUNDS: Tuple[int, ...] = (3, 8, 15, 20, 25)
+
 def get_narrative_function(verse_number: int) -> str:
     """Determine narrative function. Pre-computed thresholds."""
-    if verse_number <= 3:
-        return 'scene-setting'
-    elif verse_number <= 8:
-        return 'exposition'
-    elif verse_number <= 15:
-        return 'development'
-    elif verse_number <= 20:
-        return 'intensification'
-    elif verse_number <= 25:
-        return 'climax'
-    else:
-        return 'resolution'
+    return NARRATIVE_FUNCTIONS[bisect_left(_NARRATIVE_FUNCTION_BOUNDS, verse_number)]
+
+
+def get_narrative_function_codes(verse_numbers: Any) -> Any:
+    """
+    Batch form of get_narrative_function() returning indexes into
+    NARRATIVE_FUNCTIONS.
+    
+    Returns an intp array with NumPy, otherwise a list of ints.
+    """
+    if NUMPY_AVAILABLE:
+        np = _np()
+        return np.searchsorted(
+            _NARRATIVE_FUNCTION_BOUNDS, np.asarray(verse_numbers, dtype=np.intp), side='left'
+        )
+    return [bisect_left(_NARRATIVE_FUNCTION_BOUNDS, v) for v in verse_numbers]
 
 
 # ============================================================================
 # LOOKUP FUNCTIONS (O(1) access to pre-computed data)
 # ============================================================================
 
+@lru_cache(maxsize=2048)
 def get_book_meta(book_name: str) -> Optional[BookMeta]:
-    """Get book metadata. O(1) lookup."""
-    # Try direct lookup first
-    if book_name in BOOK_METADATA:
-        return BOOK_METADATA[book_name]
-    
-    # Try alias lookup
-    normalized = BOOK_ALIASES.get(book_name.lower())
-    if normalized:
-        return BOOK_METADATA.get(normalized)
-    
-    return None
+    """Get book metadata. O(1) lookup, memoized per input spelling."""
+    canonical = normalize_book_name(book_name)
+    return BOOK_METADATA[canonical] if canonical else None
 
 
+@lru_cache(maxsize=2048)
 def normalize_book_name(name: str) -> Optional[str]:
-    """Normalize book name to canonical form. O(1) lookup."""
-    if name in BOOK_METADATA:
-        return name
-    return BOOK_ALIASES.get(name.lower())
+    """Normalize book name to canonical form. O(1) lookup, memoized per input spelling."""
+    return _BOOK_NORMALIZE.get(name) or _BOOK_NORMALIZE.get(name.lower())
 
 
 def get_verse_count(book: str, chapter: int) -> Optional[int]:
     """Get verse count for a chapter. O(1) lookup."""
-    book_counts = VERSE_COUNTS.get(book)
-    if book_counts:
-        return book_counts.get(chapter)
-    return None
+    return _VERSE_COUNTS_FLAT.get((book, chapter))
+
+
+def get_category_values(category: str) -> Optional[Any]:
+    """
+    Get (emotional, theological, sensory) base values for a category. O(1) lookup.
+    
+    Returns a read-only float32 row view of the category matrix when NumPy is
+    available, otherwise a tuple of floats in the same column order.
+    """
+    idx = _CATEGORY_INDEX.get(category)
+    if idx is None:
+        return None
+    if NUMPY_AVAILABLE:
+        return _category_matrix()[idx]
+    return _CATEGORY_ROWS[idx]
+
+
+def pack_verse(book_id: int, chapter: int, verse: int) -> int:
+    """Pack (canonical book order, chapter, verse) into one int key."""
+    return (book_id << 20) | (chapter << 10) | verse
+
+
+@lru_cache(maxsize=8192)
+def parse_reference(verse_ref: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a "Book C:V" reference into (canonical book order, chapter, verse).
+    
+    Accepts any book alias and stray whitespace. Returns None for references
+    that do not parse or name an unknown book. Memoized per input string.
+    """
+    book, _, cv = ' '.join(verse_ref.split()).rpartition(' ')
+    chapter, _, verse = cv.partition(':')
+    canonical = normalize_book_name(book) if book else None
+    if canonical is None or not chapter.isdigit() or not verse.isdigit():
+        return None
+    return CANONICAL_ORDER[canonical], int(chapter), int(verse)
+
+
+@lru_cache(maxsize=8192)
+def pack_reference(verse_ref: str) -> int:
+    """
+    Pack a "Book C:V" reference (any book alias) into an int key.
+    
+    Returns -1 for references that parse_reference() rejects.
+    """
+    parsed = parse_reference(verse_ref)
+    return pack_verse(*parsed) if parsed else -1
+
+
+# Packed keys of HIGH_THEOLOGICAL_WEIGHT_VERSES; matches any book alias
+# (e.g. "Psalms 22:1" as well as the listed "Psalm 22:1").
+_HIGH_WEIGHT_PACKED: frozenset = frozenset(map(pack_reference, HIGH_THEOLOGICAL_WEIGHT_VERSES))
+assert -1 not in _HIGH_WEIGHT_PACKED, "unparseable high-weight reference"
 
 
 def is_high_theological_weight(verse_ref: str) -> bool:
     """Check if verse has high theological weight. O(1) lookup."""
-    return verse_ref in HIGH_THEOLOGICAL_WEIGHT_VERSES
+    return verse_ref in HIGH_THEOLOGICAL_WEIGHT_VERSES or pack_reference(verse_ref) in _HIGH_WEIGHT_PACKED
+
+
+def is_high_weight_packed(key: int) -> bool:
+    """is_high_theological_weight for a key already packed with pack_verse()."""
+    return key in _HIGH_WEIGHT_PACKED
 
 
 def get_motif_harmonics(motif_name: str) -> Optional[Tuple[int, ...]]:
@@ -479,8 +713,44 @@ def get_motif_harmonics(motif_name: str) -> Optional[Tuple[int, ...]]:
 
 
 def get_pascha_date(year: int) -> Optional[Tuple[int, int]]:
-    """Get pre-computed Pascha date. O(1) lookup."""
-    return ORTHODOX_PASCHA_DATES.get(year)
+    """
+    Get the Orthodox Pascha date (Gregorian month, day) for 1900-2099.
+    
+    Meeus Julian computus shifted by the 13-day Julian-Gregorian offset,
+    which is constant over that range; returns None outside it.
+    """
+    if not _PASCHA_MIN_YEAR <= year <= _PASCHA_MAX_YEAR:
+        return None
+    d = (19 * (year % 19) + 15) % 30
+    e = (2 * (year % 4) + 4 * (year % 7) - d + 34) % 7
+    month, day = divmod(d + e + 114, 31)
+    day += 1 + 13
+    if month == 3 and day > 31:
+        return (4, day - 31)
+    if month == 4 and day > 30:
+        return (5, day - 30)
+    return (month, day)
+
+
+if __debug__:
+    assert all(
+        get_pascha_date(year) == md for year, md in ORTHODOX_PASCHA_DATES.items()
+    ), "get_pascha_date disagrees with ORTHODOX_PASCHA_DATES"
+
+
+# ============================================================================
+# FAST-PATH READ-ONLY VIEWS
+# Hot callers can probe these directly (e.g. BOOK_META.get(name)) and skip
+# the Python-level wrapper frame. Keys are canonical: aliases are lowercase,
+# verse counts are keyed by (book, chapter). The wrapper functions above
+# remain the general entry points and handle normalization.
+# ============================================================================
+
+BOOK_META: Mapping[str, BookMeta] = MappingProxyType(BOOK_METADATA)
+BOOK_ALIAS_MAP: Mapping[str, str] = MappingProxyType(BOOK_ALIASES)
+VERSE_COUNT_MAP: Mapping[Tuple[str, int], int] = MappingProxyType(_VERSE_COUNTS_FLAT)
+MOTIF_HARMONICS_MAP: Mapping[str, Tuple[int, ...]] = MappingProxyType(MOTIF_HARMONICS)
+CATEGORY_REGISTER_MAP: Mapping[str, str] = MappingProxyType(CATEGORY_REGISTERS)
 
 
 # ============================================================================
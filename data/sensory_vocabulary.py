@@ -17,20 +17,49 @@ When the reader reaches John 19:30, their body already knows:
 """
 
 import sys
-from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from array import array
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain
+from operator import attrgetter
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# NumPy is optional and imported only when an aggregate is first computed
+NUMPY_AVAILABLE: bool = find_spec('numpy') is not None
+
+
+@lru_cache(maxsize=None)
+def _np() -> Any:
+    """The numpy module, imported on first use. Check NUMPY_AVAILABLE first."""
+    import numpy
+    return numpy
+
+if TYPE_CHECKING:
+    import argparse
+
+# Registry records are immutable; on 3.10+ they also drop the per-instance
+# __dict__ (README still supports 3.9, where slots=True is unavailable).
+_RECORD_OPTIONS: Dict[str, bool] = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _RECORD_OPTIONS['slots'] = True
 
 
 # ============================================================================
 # SENSORY MODALITIES
 # ============================================================================
 
-class SensoryModality(Enum):
-    """The five sensory channels plus proprioception."""
+class SensoryModality(str, Enum):
+    """
+    The five sensory channels plus proprioception.
+    
+    Subclasses str so members compare and hash as their plain string values
+    (SensoryModality.VISUAL == "visual"), keeping modality filters and
+    modality-keyed dicts on the interned-string fast path.
+    """
     VISUAL = "visual"
     AUDITORY = "auditory"
     TACTILE = "tactile"
@@ -39,7 +68,7 @@ class SensoryModality(Enum):
     PROPRIOCEPTIVE = "proprioceptive"  # Body position, weight, movement
 
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class SensorySeed:
     """A single sensory vocabulary item."""
     term: str
@@ -48,13 +77,25 @@ class SensorySeed:
     hebrew_connection: Optional[str] = None
     greek_connection: Optional[str] = None
     temporal_folding: Optional[str] = None  # Phrase this plants/echoes
+    
+    def __post_init__(self):
+        # Interned so equal terms across motifs share storage and compare by
+        # identity (object.__setattr__ because the dataclass is frozen)
+        set_ = object.__setattr__
+        set_(self, 'term', sys.intern(self.term))
+        if self.hebrew_connection:
+            set_(self, 'hebrew_connection', sys.intern(self.hebrew_connection))
+        if self.greek_connection:
+            set_(self, 'greek_connection', sys.intern(self.greek_connection))
+        if self.temporal_folding:
+            set_(self, 'temporal_folding', sys.intern(self.temporal_folding))
 
 
 # ============================================================================
 # MOTIF SENSORY VOCABULARIES
 # ============================================================================
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class MotifSensory:
     """Complete sensory vocabulary for a motif."""
     motif_name: str
@@ -65,16 +106,41 @@ class MotifSensory:
     gustatory: Tuple[SensorySeed, ...]
     proprioceptive: Tuple[SensorySeed, ...]
     forbidden_terms: Tuple[str, ...]  # Never use these (modern, breaking period)
+    # Seed intensities in iter_all_seeds() order, quantized to 0-255 fixed
+    # point and packed one byte each
+    intensities_u8: Any = field(init=False, repr=False, compare=False)
     
     # Class-level constant for sensory attribute names
     SENSORY_ATTRIBUTES = ('visual', 'auditory', 'tactile', 'olfactory', 'gustatory', 'proprioceptive')
     
+    def __post_init__(self):
+        set_ = object.__setattr__  # frozen dataclass
+        set_(self, 'motif_name', sys.intern(self.motif_name))
+        set_(self, 'forbidden_terms', tuple(sys.intern(t) for t in self.forbidden_terms))
+        set_(self, 'intensities_u8', bytes(
+            min(255, max(0, round(s.intensity * 255))) for s in self.iter_all_seeds()
+        ))
+    
+    def mean_intensity(self) -> float:
+        """Mean seed intensity across all modalities, from the packed array."""
+        if not len(self.intensities_u8):
+            return 0.0
+        if NUMPY_AVAILABLE:
+            np = _np()
+            packed = np.frombuffer(self.intensities_u8, dtype=np.uint8)
+            return float(packed.astype(np.float32).mean() * (1 / 255))
+        return sum(self.intensities_u8) / (len(self.intensities_u8) * 255)
+    
+    def iter_all_seeds(self) -> Iterator[SensorySeed]:
+        """Iterate all sensory seeds from all modalities without building a list."""
+        return chain(
+            self.visual, self.auditory, self.tactile,
+            self.olfactory, self.gustatory, self.proprioceptive,
+        )
+    
     def get_all_seeds(self) -> List[SensorySeed]:
         """Get all sensory seeds from all modalities."""
-        seeds: List[SensorySeed] = []
-        for attr in self.SENSORY_ATTRIBUTES:
-            seeds.extend(getattr(self, attr, ()))
-        return seeds
+        return list(self.iter_all_seeds())
 
 
 LAMB_SENSORY = MotifSensory(
@@ -315,136 +381,281 @@ FIRE_SENSORY = MotifSensory(
 # SENSORY VOCABULARY REGISTRY
 # ============================================================================
 
-MOTIF_SENSORY_REGISTRY: Dict[str, MotifSensory] = {
-    'LAMB': LAMB_SENSORY,
-    'WOOD': WOOD_SENSORY,
-    'BLOOD': BLOOD_SENSORY,
-    'SILENCE': SILENCE_SENSORY,
-    'BREATH': BREATH_SENSORY,
-    'WATER': WATER_SENSORY,
-    'FIRE': FIRE_SENSORY,
+# Read-only view with interned keys: the registry is fixed at import time.
+MOTIF_SENSORY_REGISTRY: Mapping[str, MotifSensory] = MappingProxyType({
+    sys.intern(name): motif for name, motif in {
+        'LAMB': LAMB_SENSORY,
+        'WOOD': WOOD_SENSORY,
+        'BLOOD': BLOOD_SENSORY,
+        'SILENCE': SILENCE_SENSORY,
+        'BREATH': BREATH_SENSORY,
+        'WATER': WATER_SENSORY,
+        'FIRE': FIRE_SENSORY,
+    }.items()
+})
+
+# Temporal-folding seeds per motif, computed once since the registry is fixed
+_HAS_FOLD = attrgetter('temporal_folding')
+_TEMPORAL_CACHE: Dict[str, Tuple[SensorySeed, ...]] = {
+    name: tuple(filter(_HAS_FOLD, motif.iter_all_seeds()))
+    for name, motif in MOTIF_SENSORY_REGISTRY.items()
+}
+
+# Seed count per motif across all modalities (used by the --list CLI)
+_ALL_ATTRS: Tuple[str, ...] = MotifSensory.SENSORY_ATTRIBUTES
+_SEED_TOTALS: Dict[str, int] = {
+    name: sum(len(getattr(motif, attr)) for attr in _ALL_ATTRS)
+    for name, motif in MOTIF_SENSORY_REGISTRY.items()
 }
 
 
+_IntensityIndex = Tuple[array, Tuple[int, ...], Tuple[SensorySeed, ...]]
+
+
+def _build_intensity_index(seeds: Tuple[SensorySeed, ...]) -> _IntensityIndex:
+    """
+    Index seeds by descending intensity for threshold queries.
+    
+    Returns (negated intensities ascending, original positions in that
+    order, the seeds themselves). Bisecting the negated intensities at
+    -threshold gives how many seeds pass; sorting their positions restores
+    registry order.
+    """
+    order = sorted(range(len(seeds)), key=lambda i: -seeds[i].intensity)
+    return (
+        array('d', (-seeds[i].intensity for i in order)),
+        tuple(order),
+        seeds,
+    )
+
+
+# (motif key, modality attribute or None for all) -> intensity index
+_INTENSITY_INDEX: Dict[Tuple[str, Optional[str]], _IntensityIndex] = {}
+for _name, _motif in MOTIF_SENSORY_REGISTRY.items():
+    _INTENSITY_INDEX[(_name, None)] = _build_intensity_index(tuple(_motif.iter_all_seeds()))
+    for _attr in _ALL_ATTRS:
+        _INTENSITY_INDEX[(_name, _attr)] = _build_intensity_index(getattr(_motif, _attr))
+del _name, _motif, _attr
+
+
 # ============================================================================
 # SENSORY SELECTION FUNCTIONS
 # ============================================================================
 
+# Modality -> MotifSensory attribute holding that modality's seeds
+_MODALITY_ATTRS: Dict[SensoryModality, str] = {m: m.value for m in SensoryModality}
+
+# Registry keys are canonical upper-case; get_sensory_vocabulary_fast() and
+# the first probe in _resolve() rely on this invariant.
+assert all(k == k.upper() for k in MOTIF_SENSORY_REGISTRY), "motif keys must be upper-case"
+_REG = MOTIF_SENSORY_REGISTRY
+
+
+def _resolve(motif_name: str, _reg_get=_REG.get) -> Optional[MotifSensory]:
+    """
+    Resolve a motif name against the registry.
+    
+    Canonical upper-case names hit on the first probe without allocating;
+    anything else is upper-cased once and probed again.
+    """
+    motif = _reg_get(motif_name)
+    if motif is None:
+        motif = _reg_get(motif_name.upper())
+    return motif
+
+
 def get_sensory_vocabulary(
     motif_name: str,
     modality: Optional[SensoryModality] = None,
     intensity_threshold: float = 0.0,
 ) -> List[SensorySeed]:
     """Get sensory vocabulary for a motif."""
-    motif = MOTIF_SENSORY_REGISTRY.get(motif_name.upper())
+    motif = _resolve(motif_name)
+    if not motif:
+        return []
+    return _select_seeds(motif, modality, intensity_threshold)
+
+
+def get_sensory_vocabulary_fast(
+    key: str,
+    modality: Optional[SensoryModality] = None,
+    intensity_threshold: float = 0.0,
+    _reg_get=_REG.get,
+) -> List[SensorySeed]:
+    """
+    get_sensory_vocabulary() for callers that already hold a canonical key.
+    
+    ``key`` must be exactly a MOTIF_SENSORY_REGISTRY key; every registry key
+    is upper-case (checked at import). No case normalization is done, so
+    e.g. 'lamb' finds nothing here while get_sensory_vocabulary('lamb') does.
+    """
+    motif = _reg_get(key)
     if not motif:
         return []
+    return _select_seeds(motif, modality, intensity_threshold)
+
+
+def _select_seeds(
+    motif: MotifSensory,
+    modality: Optional[SensoryModality],
+    intensity_threshold: float,
+) -> List[SensorySeed]:
+    """Seeds of ``motif`` in one modality (or all) at or above the threshold."""
+    if modality is None:
+        attr = None
+    else:
+        attr = _MODALITY_ATTRS.get(modality)
+        if attr is None:
+            return []
     
-    seeds: List[SensorySeed] = []
+    # Intensities are never negative, so the default threshold keeps everything
+    if intensity_threshold <= 0.0:
+        return list(motif.iter_all_seeds() if attr is None else getattr(motif, attr))
     
-    if modality is None or modality == SensoryModality.VISUAL:
-        seeds.extend(motif.visual)
-    if modality is None or modality == SensoryModality.AUDITORY:
-        seeds.extend(motif.auditory)
-    if modality is None or modality == SensoryModality.TACTILE:
-        seeds.extend(motif.tactile)
-    if modality is None or modality == SensoryModality.OLFACTORY:
-        seeds.extend(motif.olfactory)
-    if modality is None or modality == SensoryModality.GUSTATORY:
-        seeds.extend(motif.gustatory)
-    if modality is None or modality == SensoryModality.PROPRIOCEPTIVE:
-        seeds.extend(motif.proprioceptive)
+    neg_intensities, positions, seeds = _INTENSITY_INDEX[(motif.motif_name, attr)]
+    cut = bisect_right(neg_intensities, -intensity_threshold)
+    return [seeds[i] for i in sorted(positions[:cut])]
+
+
+def seeds_for(motif_name: str, modality: SensoryModality) -> Tuple[SensorySeed, ...]:
+    """
+    Get the seeds of a single modality for a motif. O(1) lookup.
     
-    return [s for s in seeds if s.intensity >= intensity_threshold]
+    Returns the stored per-modality tuple directly; no filtering or copying.
+    """
+    motif = _resolve(motif_name)
+    if not motif:
+        return ()
+    return getattr(motif, SensoryModality(modality).value)
 
 
 def get_forbidden_terms(motif_name: str) -> Tuple[str, ...]:
     """Get terms that must NEVER be used for a motif."""
-    motif = MOTIF_SENSORY_REGISTRY.get(motif_name.upper())
+    motif = _resolve(motif_name)
     return motif.forbidden_terms if motif else ()
 
 
 def get_temporal_folding_seeds(motif_name: str) -> List[SensorySeed]:
     """Get seeds that participate in temporal folding (plant/echo phrases)."""
-    motif = MOTIF_SENSORY_REGISTRY.get(motif_name.upper())
-    if not motif:
-        return []
-    
-    # Use class method for cleaner code
-    all_seeds = motif.get_all_seeds()
-    return [s for s in all_seeds if s.temporal_folding]
+    seeds = _TEMPORAL_CACHE.get(motif_name)
+    if seeds is None:
+        seeds = _TEMPORAL_CACHE.get(motif_name.upper(), ())
+    return list(seeds)
+
+
+def _write_seeds(append, seeds: Tuple[SensorySeed, ...], indent: str = "    ") -> None:
+    """Append one formatted line per seed to a buffer (``seeds`` is non-empty)."""
+    first = True
+    for s in seeds:
+        if not first:
+            append("\n")
+        first = False
+        append(indent)
+        append("• \"")
+        append(s.term)
+        append("\" (intensity: ")
+        append(f"{s.intensity:.1f}")
+        append(")")
+        if s.hebrew_connection:
+            append(" [")
+            append(s.hebrew_connection)
+            append("]")
+        if s.greek_connection:
+            append(" [")
+            append(s.greek_connection)
+            append("]")
+        if s.temporal_folding:
+            append(" → FOLDS: '")
+            append(s.temporal_folding)
+            append("'")
+
+
+_NONE_BLOCK = "    (none)"
+
+
+def _render_seeds(seeds: Tuple[SensorySeed, ...]) -> str:
+    """Render a seed tuple as the indented bullet block used in specifications."""
+    if not seeds:
+        return _NONE_BLOCK
+    buf: List[str] = []
+    _write_seeds(buf.append, seeds)
+    return "".join(buf)
+
+
+# Static skeleton of the specification document; only the motif name and the
+# seed blocks are interpolated per call.
+_RULER = "═" * 68
+_SPEC_TEMPLATE = (
+    "\n" + _RULER + "\nSENSORY VOCABULARY SPECIFICATION: {name}\n" + _RULER +
+    "\n\nVISUAL (what the reader's eyes simulate):\n{visual}"
+    "\n\nAUDITORY (what the reader's ears simulate):\n{auditory}"
+    "\n\nTACTILE (what the reader's body simulates):\n{tactile}"
+    "\n\nOLFACTORY (what the reader smells):\n{olfactory}"
+    "\n\nGUSTATORY (what the reader tastes):\n{gustatory}"
+    "\n\nPROPRIOCEPTIVE (body position, weight, movement):\n{proprioceptive}"
+    "\n\nFORBIDDEN TERMS (never use):\n    {forbidden}"
+    "\n\nTEMPORAL FOLDING PHRASES:\n{temporal}"
+    "\n\n" + _RULER + "\n"
+)
+
+
+@lru_cache(maxsize=None)
+def _render_specification(motif_key: str) -> str:
+    """Render the specification for a registry key once; the registry is immutable."""
+    motif = _REG[motif_key]
+    return _SPEC_TEMPLATE.format(
+        name=motif.motif_name,
+        visual=_render_seeds(motif.visual),
+        auditory=_render_seeds(motif.auditory),
+        tactile=_render_seeds(motif.tactile),
+        olfactory=_render_seeds(motif.olfactory),
+        gustatory=_render_seeds(motif.gustatory),
+        proprioceptive=_render_seeds(motif.proprioceptive),
+        forbidden=", ".join(motif.forbidden_terms) if motif.forbidden_terms else "(none)",
+        temporal=_render_seeds(_TEMPORAL_CACHE.get(motif.motif_name, ())),
+    )
 
 
 def format_sensory_specification(motif_name: str) -> str:
     """Format sensory vocabulary as specification document."""
-    motif = MOTIF_SENSORY_REGISTRY.get(motif_name.upper())
+    motif = _resolve(motif_name)
     if not motif:
         return f"No sensory vocabulary registered for motif: {motif_name}"
-    
-    def format_seeds(seeds: Tuple[SensorySeed, ...], indent: str = "    ") -> str:
-        if not seeds:
-            return f"{indent}(none)"
-        lines = []
-        for s in seeds:
-            hebrew = f" [{s.hebrew_connection}]" if s.hebrew_connection else ""
-            greek = f" [{s.greek_connection}]" if s.greek_connection else ""
-            fold = f" → FOLDS: '{s.temporal_folding}'" if s.temporal_folding else ""
-            lines.append(f"{indent}• \"{s.term}\" (intensity: {s.intensity:.1f}){hebrew}{greek}{fold}")
-        return "\n".join(lines)
-    
-    return f"""
-════════════════════════════════════════════════════════════════════
-SENSORY VOCABULARY SPECIFICATION: {motif.motif_name}
-════════════════════════════════════════════════════════════════════
-
-VISUAL (what the reader's eyes simulate):
-{format_seeds(motif.visual)}
-
-AUDITORY (what the reader's ears simulate):
-{format_seeds(motif.auditory)}
-
-TACTILE (what the reader's body simulates):
-{format_seeds(motif.tactile)}
-
-OLFACTORY (what the reader smells):
-{format_seeds(motif.olfactory)}
-
-GUSTATORY (what the reader tastes):
-{format_seeds(motif.gustatory)}
-
-PROPRIOCEPTIVE (body position, weight, movement):
-{format_seeds(motif.proprioceptive)}
-
-FORBIDDEN TERMS (never use):
-    {', '.join(motif.forbidden_terms) if motif.forbidden_terms else '(none)'}
-
-TEMPORAL FOLDING PHRASES:
-{format_seeds(tuple(get_temporal_folding_seeds(motif_name)))}
-
-════════════════════════════════════════════════════════════════════
-"""
+    return _render_specification(motif.motif_name)
 
 
 # ============================================================================
 # CLI
 # ============================================================================
 
-if __name__ == "__main__":
+@lru_cache(maxsize=1)
+def _parser() -> "argparse.ArgumentParser":
+    """Build the CLI argument parser once."""
     import argparse
     
     parser = argparse.ArgumentParser(description='Sensory Vocabulary Architecture')
     parser.add_argument('--motif', type=str, default='LAMB', help='Motif name')
     parser.add_argument('--list', action='store_true', help='List all motifs')
     parser.add_argument('--modality', type=str, help='Filter by modality')
+    return parser
+
+
+def _print_motif_list() -> None:
+    """Print every registered motif with its seed total."""
+    print("\nRegistered Motif Sensory Vocabularies:")
+    for name, total in _SEED_TOTALS.items():
+        print(f"  • {name}: {total} sensory seeds")
+
+
+if __name__ == "__main__":
+    # `--list` alone is the common scripted call; answer it without argparse.
+    if sys.argv[1:] == ['--list']:
+        _print_motif_list()
+        sys.exit(0)
     
-    args = parser.parse_args()
+    args = _parser().parse_args()
     
     if args.list:
-        print("\nRegistered Motif Sensory Vocabularies:")
-        for name in MOTIF_SENSORY_REGISTRY:
-            motif = MOTIF_SENSORY_REGISTRY[name]
-            total = (len(motif.visual) + len(motif.auditory) + len(motif.tactile) +
-                    len(motif.olfactory) + len(motif.gustatory) + len(motif.proprioceptive))
-            print(f"  • {name}: {total} sensory seeds")
+        _print_motif_list()
     else:
         print(format_sensory_specification(args.motif))
@@ -13,68 +13,226 @@ All data serves this terminus. All lookups return data oriented toward
 the blood-red sky that emerges from arrangement, not from repainting.
 """
 
+from __future__ import annotations
+
+import copy
 import sys
+import warnings
+from importlib import import_module
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Any, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+if __name__ == '__main__' and not __package__:
+    # Executed as a script (python data/unified.py). Importing the package
+    # runs data/__init__, which imports data.unified; delegate to that copy
+    # instead of initializing this module a second time as __main__.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from data.unified import main
+    sys.exit(main())
 
-# Import from our pre-computed modules
-from data.precomputed import (
-    BOOK_METADATA, BookMeta, BOOK_ALIASES, CANONICAL_ORDER,
+# Book/verse tables are cheap and needed by nearly every lookup; everything
+# else is imported on first use (see _LAZY_ATTRS and the local imports below).
+from .precomputed import (
+    BOOK_METADATA, BOOK_META, BookMeta, BOOK_ALIASES, CANONICAL_ORDER,
     VERSE_COUNTS, HIGH_THEOLOGICAL_WEIGHT_VERSES,
     CATEGORY_MATRIX_VALUES, CATEGORY_REGISTERS,
-    MOTIF_HARMONICS, INTENSITY_CURVE, HARMONIC_RATIOS,
+    MOTIF_HARMONICS, MOTIF_HARMONICS_MAP, INTENSITY_CURVE, HARMONIC_RATIOS,
     ORTHODOX_PASCHA_DATES, BREATH_PATTERNS,
     get_book_meta, normalize_book_name, get_verse_count,
     is_high_theological_weight, get_motif_harmonics,
-    get_intensity_for_position, get_breath_rhythm, get_narrative_function
+    get_intensity_for_position, get_intensities, get_breath_rhythm, get_narrative_function,
+    NARRATIVE_FUNCTIONS, get_breath_rhythm_codes, get_narrative_function_codes,
+    get_testament_counts, get_total_verses, get_pascha_date,
+    NUMPY_AVAILABLE, _np
 )
 
-from data.orthodox_study_bible import (
-    VerseExegesis, TonalWeight, NarrativeFunction as ExegesisNarrativeFunction,
-    get_verse_exegesis, get_book_exegesis, get_statistics as get_exegesis_stats
-)
+if TYPE_CHECKING:
+    import argparse
+    from .orthodox_study_bible import VerseExegesis
+    from .narrative_order import NarrativeEvent, NarrativePart
+    from .nine_matrix import NineMatrixSpec, Register, FourfoldDistribution
+    from .sensory_vocabulary import SensorySeed, SensoryModality
+    from .character_voices import CharacterVoice, CharacterType
+    from .morphology import HebrewTerm, GreekTerm
+    from .cross_references import TypologicalCorrespondence, TypeCategory
 
-from data.narrative_order import (
-    NarrativeEvent, NarrativePart,
-    get_narrative_order, get_terminal_event, get_events_by_part,
-    find_echoes, find_plantings
-)
 
-# Import the Higher Ambition modules
-from data.nine_matrix import (
-    NineMatrixSpec, generate_nine_matrix, format_matrix_specification,
-    Register, REGISTER_SPECS, FourfoldDistribution, FOURFOLD_PRESETS,
-    MotifWeight, ActiveMotif, BreathPattern, BREATH_PATTERNS as NINE_MATRIX_BREATH_PATTERNS
-)
+# ============================================================================
+# LAZY RE-EXPORTS
+# ============================================================================
 
-from data.sensory_vocabulary import (
-    SensorySeed, SensoryModality, MotifSensory,
-    get_sensory_vocabulary, get_forbidden_terms, get_temporal_folding_seeds,
-    format_sensory_specification, MOTIF_SENSORY_REGISTRY
-)
+# Names this module has always re-exported, mapped to (submodule, attribute).
+# Resolved by __getattr__ on first access and then cached in globals().
+_LAZY_ATTRS: Dict[str, Tuple[str, str]] = {
+    # orthodox_study_bible
+    'VerseExegesis': ('orthodox_study_bible', 'VerseExegesis'),
+    'TonalWeight': ('orthodox_study_bible', 'TonalWeight'),
+    'ExegesisNarrativeFunction': ('orthodox_study_bible', 'NarrativeFunction'),
+    'get_verse_exegesis': ('orthodox_study_bible', 'get_verse_exegesis'),
+    'get_book_exegesis': ('orthodox_study_bible', 'get_book_exegesis'),
+    'get_exegesis_stats': ('orthodox_study_bible', 'get_statistics'),
+    # narrative_order
+    'NarrativeEvent': ('narrative_order', 'NarrativeEvent'),
+    'NarrativePart': ('narrative_order', 'NarrativePart'),
+    'get_narrative_order': ('narrative_order', 'get_narrative_order'),
+    'get_narrative_events': ('narrative_order', 'get_narrative_events'),
+    'get_terminal_event': ('narrative_order', 'get_terminal_event'),
+    'get_events_by_part': ('narrative_order', 'get_events_by_part'),
+    'find_echoes': ('narrative_order', 'find_echoes'),
+    'find_plantings': ('narrative_order', 'find_plantings'),
+    'get_narrative': ('narrative_order', 'get_narrative_order'),
+    'get_terminal': ('narrative_order', 'get_terminal_event'),
+    # nine_matrix
+    'NineMatrixSpec': ('nine_matrix', 'NineMatrixSpec'),
+    'generate_nine_matrix': ('nine_matrix', 'generate_nine_matrix'),
+    'format_matrix_specification': ('nine_matrix', 'format_matrix_specification'),
+    'Register': ('nine_matrix', 'Register'),
+    'REGISTER_SPECS': ('nine_matrix', 'REGISTER_SPECS'),
+    'FourfoldDistribution': ('nine_matrix', 'FourfoldDistribution'),
+    'FOURFOLD_PRESETS': ('nine_matrix', 'FOURFOLD_PRESETS'),
+    'MotifWeight': ('nine_matrix', 'MotifWeight'),
+    'ActiveMotif': ('nine_matrix', 'ActiveMotif'),
+    'BreathPattern': ('nine_matrix', 'BreathPattern'),
+    'NINE_MATRIX_BREATH_PATTERNS': ('nine_matrix', 'BREATH_PATTERNS'),
+    # sensory_vocabulary
+    'SensorySeed': ('sensory_vocabulary', 'SensorySeed'),
+    'SensoryModality': ('sensory_vocabulary', 'SensoryModality'),
+    'MotifSensory': ('sensory_vocabulary', 'MotifSensory'),
+    'get_sensory_vocabulary': ('sensory_vocabulary', 'get_sensory_vocabulary'),
+    'get_sensory_vocabulary_fast': ('sensory_vocabulary', 'get_sensory_vocabulary_fast'),
+    'get_forbidden_terms': ('sensory_vocabulary', 'get_forbidden_terms'),
+    'get_temporal_folding_seeds': ('sensory_vocabulary', 'get_temporal_folding_seeds'),
+    'format_sensory_specification': ('sensory_vocabulary', 'format_sensory_specification'),
+    'MOTIF_SENSORY_REGISTRY': ('sensory_vocabulary', 'MOTIF_SENSORY_REGISTRY'),
+    # character_voices
+    'CharacterVoice': ('character_voices', 'CharacterVoice'),
+    'VoiceRegister': ('character_voices', 'VoiceRegister'),
+    'CharacterType': ('character_voices', 'CharacterType'),
+    'get_voice': ('character_voices', 'get_voice'),
+    'get_voices_by_type': ('character_voices', 'get_voices_by_type'),
+    'get_voices_by_register': ('character_voices', 'get_voices_by_register'),
+    'ALL_VOICES': ('character_voices', 'ALL_VOICES'),
+    'get_voice_stats': ('character_voices', 'get_statistics'),
+    # morphology
+    'HebrewTerm': ('morphology', 'HebrewTerm'),
+    'GreekTerm': ('morphology', 'GreekTerm'),
+    'MorphWeight': ('morphology', 'TheologicalWeight'),
+    'get_hebrew_term': ('morphology', 'get_hebrew_term'),
+    'get_greek_term': ('morphology', 'get_greek_term'),
+    'get_terms_by_motif': ('morphology', 'get_terms_by_motif'),
+    'get_ultra_terms': ('morphology', 'get_ultra_terms'),
+    'ALL_HEBREW': ('morphology', 'ALL_HEBREW'),
+    'ALL_GREEK': ('morphology', 'ALL_GREEK'),
+    'get_morphology_stats': ('morphology', 'get_statistics'),
+    # cross_references
+    'TypologicalCorrespondence': ('cross_references', 'TypologicalCorrespondence'),
+    'TypeCategory': ('cross_references', 'TypeCategory'),
+    'CorrespondenceStrength': ('cross_references', 'CorrespondenceStrength'),
+    'get_antitype': ('cross_references', 'get_antitype'),
+    'get_type': ('cross_references', 'get_type'),
+    'get_by_category': ('cross_references', 'get_by_category'),
+    'get_explicit': ('cross_references', 'get_explicit'),
+    'get_sensory_network': ('cross_references', 'get_sensory_network'),
+    'build_cross_reference_index': ('cross_references', 'build_cross_reference_index'),
+    'ALL_CORRESPONDENCES': ('cross_references', 'ALL_CORRESPONDENCES'),
+    'get_crossref_stats': ('cross_references', 'get_statistics'),
+}
 
-# Import new enhanced modules
-from data.character_voices import (
-    CharacterVoice, VoiceRegister, CharacterType,
-    get_voice, get_voices_by_type, get_voices_by_register,
-    ALL_VOICES, get_statistics as get_voice_stats
-)
 
-from data.morphology import (
-    HebrewTerm, GreekTerm, TheologicalWeight as MorphWeight,
-    get_hebrew_term, get_greek_term, get_terms_by_motif, get_ultra_terms,
-    ALL_HEBREW, ALL_GREEK, get_statistics as get_morphology_stats
-)
+def __getattr__(name: str) -> Any:
+    """Import heavyweight re-exports on first access (PEP 562)."""
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f'.{module}', __package__), attr)
+    globals()[name] = value
+    return value
 
-from data.cross_references import (
-    TypologicalCorrespondence, TypeCategory, CorrespondenceStrength,
-    get_antitype, get_type, get_by_category, get_explicit, get_sensory_network,
-    build_cross_reference_index, ALL_CORRESPONDENCES,
-    get_statistics as get_crossref_stats
-)
+
+@lru_cache(maxsize=None)
+def _readonly_registry(name: str) -> Union[Mapping[str, Any], Tuple[Any, ...]]:
+    """
+    Read-only view of a lazily imported registry, built once per name.
+    
+    Dicts are wrapped in a MappingProxyType (zero-copy, reflects the source);
+    lists are frozen into a tuple.
+    """
+    value = __getattr__(name)
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    return tuple(value)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+# ============================================================================
+# EXEGESIS LOOKUP CACHE
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def _exegesis_by_canonical_ref() -> Dict[Tuple[str, str], VerseExegesis]:
+    """Index every exegesis entry by (canonical book name, "chapter:verse")."""
+    from .orthodox_study_bible import ORTHODOX_STUDY_BIBLE
+    index: Dict[Tuple[str, str], VerseExegesis] = {}
+    for book_data in ORTHODOX_STUDY_BIBLE.values():
+        for ref, ex in book_data.items():
+            book, _, cv = ref.rpartition(' ')
+            index[(normalize_book_name(book) or book, cv)] = ex
+    return index
+
+
+@lru_cache(maxsize=8192)
+def _cached_exegesis(reference: str) -> Optional[VerseExegesis]:
+    """
+    Memoized get_verse_exegesis; the exegesis tables are fixed at import.
+    
+    References that miss verbatim are retried with the book name normalized
+    (aliases, case, surrounding whitespace), so "gen 1:1" and "Psalms 22:1"
+    resolve to the "Genesis 1:1" and "Psalm 22:1" entries.
+    """
+    from .orthodox_study_bible import get_verse_exegesis
+    ex = get_verse_exegesis(reference)
+    if ex is None:
+        book, _, cv = ' '.join(reference.split()).rpartition(' ')
+        canonical = normalize_book_name(book) if book else None
+        if canonical:
+            ex = _exegesis_by_canonical_ref().get((canonical, cv))
+    return ex
+
+
+@lru_cache(maxsize=32768)
+def _cached_nine_matrix(
+    verse_ref: str,
+    book_category: str,
+    verse_number: int,
+    chapter: int,
+    current_page: int,
+    narrative_context: str,
+    active_motifs: Optional[Tuple[str, ...]],
+) -> NineMatrixSpec:
+    """
+    Memoized generate_nine_matrix; the generator is a pure function of its
+    arguments. Motifs stay in caller order because it sets the order of
+    spec.active_motifs.
+    """
+    from .nine_matrix import generate_nine_matrix
+    return generate_nine_matrix(
+        verse_ref=verse_ref,
+        book_category=book_category,
+        verse_number=verse_number,
+        chapter=chapter,
+        current_page=current_page,
+        narrative_context=narrative_context,
+        active_motif_names=list(active_motifs) if active_motifs else None,
+    )
 
 
 # ============================================================================
@@ -87,6 +245,10 @@ class BiblosData:
     
     This is the single entry point for all data access in the system.
     All methods return pre-computed data with O(1) complexity.
+    
+    Pure pass-throughs to data.precomputed are bound as staticmethod(func),
+    so BiblosData.get_book is get_book_meta itself (no wrapper frame).
+    Accessors backed by lazily imported modules keep thin wrappers.
     """
     
     # Terminal verse - the narrative ends here
@@ -97,20 +259,13 @@ class BiblosData:
     # BOOK DATA
     # ========================================================================
     
-    @staticmethod
-    def get_book(name: str) -> Optional[BookMeta]:
-        """Get book metadata by name (canonical or alias)."""
-        return get_book_meta(name)
+    get_book = staticmethod(get_book_meta)
+    normalize_book = staticmethod(normalize_book_name)
     
     @staticmethod
-    def normalize_book(name: str) -> Optional[str]:
-        """Normalize any book name/alias to canonical form."""
-        return normalize_book_name(name)
-    
-    @staticmethod
-    def get_all_books() -> Dict[str, BookMeta]:
-        """Get all book metadata."""
-        return BOOK_METADATA.copy()
+    def get_all_books() -> Mapping[str, BookMeta]:
+        """Get all book metadata as a read-only view (use dict(...) to mutate)."""
+        return BOOK_META
     
     @staticmethod
     def get_canonical_order(book: str) -> Optional[int]:
@@ -127,25 +282,33 @@ class BiblosData:
     # VERSE DATA
     # ========================================================================
     
-    @staticmethod
-    def get_verse_count(book: str, chapter: int) -> Optional[int]:
-        """Get verse count for a chapter."""
-        return get_verse_count(book, chapter)
-    
-    @staticmethod
-    def is_high_weight(reference: str) -> bool:
-        """Check if a verse has high theological weight."""
-        return is_high_theological_weight(reference)
+    get_verse_count = staticmethod(get_verse_count)
+    is_high_weight = staticmethod(is_high_theological_weight)
+    get_exegesis = staticmethod(_cached_exegesis)
     
     @staticmethod
-    def get_exegesis(reference: str) -> Optional[VerseExegesis]:
-        """Get pre-computed exegesis for a verse."""
-        return get_verse_exegesis(reference)
+    def get_verse_bundle(reference: str) -> Optional[Dict[str, Any]]:
+        """Get the commonly displayed exegesis fields for a verse in one lookup."""
+        ex = _cached_exegesis(reference)
+        if ex is None:
+            return None
+        return {
+            'text': ex.text,
+            'literal': ex.literal,
+            'allegorical': ex.allegorical,
+            'tropological': ex.tropological,
+            'anagogical': ex.anagogical,
+            'tonal_weight': ex.tonal_weight.value,
+            'native_mood': ex.native_mood,
+            'dread_amplification': ex.dread_amplification,
+            'plants_phrase': ex.plants_phrase,
+            'echoes_phrase': ex.echoes_phrase,
+        }
     
     @staticmethod
     def get_fourfold_sense(reference: str) -> Optional[Dict[str, str]]:
         """Get fourfold sense for a verse if available."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         if ex:
             return {
                 'literal': ex.literal,
@@ -169,34 +332,24 @@ class BiblosData:
         """Get register for a book category."""
         return CATEGORY_REGISTERS.get(category, 'narrative-standard')
     
-    @staticmethod
-    def get_breath_rhythm(verse_number: int) -> str:
-        """Get breath rhythm for verse number."""
-        return get_breath_rhythm(verse_number)
-    
-    @staticmethod
-    def get_narrative_function(verse_number: int) -> str:
-        """Get narrative function for verse number."""
-        return get_narrative_function(verse_number)
+    get_breath_rhythm = staticmethod(get_breath_rhythm)
+    get_narrative_function = staticmethod(get_narrative_function)
+    get_breath_rhythm_codes = staticmethod(get_breath_rhythm_codes)
+    get_narrative_function_codes = staticmethod(get_narrative_function_codes)
     
     # ========================================================================
     # MOTIF DATA
     # ========================================================================
     
-    @staticmethod
-    def get_harmonics(motif: str) -> Optional[Tuple[int, ...]]:
-        """Get pre-computed harmonic pages for a motif."""
-        return get_motif_harmonics(motif)
+    get_harmonics = staticmethod(get_motif_harmonics)
     
     @staticmethod
-    def get_all_motif_harmonics() -> Dict[str, Tuple[int, ...]]:
-        """Get all pre-computed motif harmonics."""
-        return MOTIF_HARMONICS.copy()
+    def get_all_motif_harmonics() -> Mapping[str, Tuple[int, ...]]:
+        """Get all pre-computed motif harmonics as a read-only view (use dict(...) to mutate)."""
+        return MOTIF_HARMONICS_MAP
     
-    @staticmethod
-    def get_intensity(position: float) -> float:
-        """Get intensity for orbital position (0.0-1.0)."""
-        return get_intensity_for_position(position)
+    get_intensity = staticmethod(get_intensity_for_position)
+    get_intensities = staticmethod(get_intensities)
     
     # ========================================================================
     # NARRATIVE ORDER
@@ -205,26 +358,31 @@ class BiblosData:
     @staticmethod
     def get_narrative_order() -> List[NarrativeEvent]:
         """Get the complete narrative ordering."""
+        from .narrative_order import get_narrative_order
         return get_narrative_order()
     
     @staticmethod
     def get_terminal() -> NarrativeEvent:
         """Get the terminal event (the Cross)."""
+        from .narrative_order import get_terminal_event
         return get_terminal_event()
     
     @staticmethod
     def get_events_for_part(part: NarrativePart) -> List[NarrativeEvent]:
         """Get events for a specific narrative part."""
+        from .narrative_order import get_events_by_part
         return get_events_by_part(part)
     
     @staticmethod
     def find_phrase_echoes(phrase: str) -> List[NarrativeEvent]:
         """Find events that echo a phrase."""
+        from .narrative_order import find_echoes
         return find_echoes(phrase)
     
     @staticmethod
     def find_phrase_plantings(phrase: str) -> List[NarrativeEvent]:
         """Find events that plant a phrase."""
+        from .narrative_order import find_plantings
         return find_plantings(phrase)
     
     # ========================================================================
@@ -234,13 +392,13 @@ class BiblosData:
     @staticmethod
     def get_planted_phrase(reference: str) -> Optional[str]:
         """Get phrase planted by a verse (if any)."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.plants_phrase if ex else None
     
     @staticmethod
     def get_echoed_phrase(reference: str) -> Optional[str]:
         """Get phrase echoed by a verse (if any)."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.echoes_phrase if ex else None
     
     # ========================================================================
@@ -250,29 +408,58 @@ class BiblosData:
     @staticmethod
     def get_tonal_weight(reference: str) -> Optional[str]:
         """Get tonal weight for a verse."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.tonal_weight.value if ex else None
     
     @staticmethod
     def get_native_mood(reference: str) -> Optional[str]:
         """Get native mood for a verse."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.native_mood if ex else None
     
     @staticmethod
     def get_dread_amplification(reference: str) -> Optional[float]:
         """Get dread amplification for a verse."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.dread_amplification if ex else None
     
+    @staticmethod
+    def get_exegeses(references: Iterable[str]) -> List[Optional[VerseExegesis]]:
+        """Get exegesis for many verses in one call (None where missing)."""
+        lookup = _cached_exegesis
+        return [lookup(ref) for ref in references]
+    
+    @staticmethod
+    def get_tonal_weights(references: Iterable[str]) -> List[Optional[str]]:
+        """Get tonal weights for many verses (None where missing)."""
+        return [ex.tonal_weight.value if ex else None
+                for ex in BiblosData.get_exegeses(references)]
+    
+    @staticmethod
+    def get_dread_amplifications(references: Iterable[str]) -> Any:
+        """
+        Get dread amplification for many verses.
+        
+        Returns a float64 array with NaN where no exegesis exists when NumPy
+        is available, otherwise a list with None in those positions.
+        """
+        exegeses = BiblosData.get_exegeses(references)
+        if NUMPY_AVAILABLE:
+            np = _np()
+            return np.fromiter(
+                (ex.dread_amplification if ex else np.nan for ex in exegeses),
+                dtype=np.float64, count=len(exegeses),
+            )
+        return [ex.dread_amplification if ex else None for ex in exegeses]
+    
     # ========================================================================
     # SENSORY VOCABULARY
     # ========================================================================
     
     @staticmethod
-    def get_sensory_seeds(reference: str) -> Optional[Dict[str, Tuple[str, ...]]]:
+    def get_verse_sensory_seeds(reference: str) -> Optional[Dict[str, Tuple[str, ...]]]:
         """Get sensory vocabulary seeds for a verse."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         if ex:
             return {
                 'visual': ex.visual_seeds,
@@ -287,8 +474,8 @@ class BiblosData:
     
     @staticmethod
     def get_pascha(year: int) -> Optional[Tuple[int, int]]:
-        """Get pre-computed Pascha date for a year."""
-        return ORTHODOX_PASCHA_DATES.get(year)
+        """Get the Pascha date (month, day) for a year in 1900-2099."""
+        return get_pascha_date(year)
     
     # ========================================================================
     # CROSS REFERENCES
@@ -297,19 +484,19 @@ class BiblosData:
     @staticmethod
     def get_cross_references(reference: str) -> Optional[Tuple[str, ...]]:
         """Get cross-references for a verse."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.cross_references if ex else None
     
     @staticmethod
     def get_typological_shadows(reference: str) -> Optional[Tuple[str, ...]]:
         """Get OT shadows (antecedents) for a verse."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.typological_shadows if ex else None
     
     @staticmethod
     def get_typological_fulfillments(reference: str) -> Optional[Tuple[str, ...]]:
         """Get typological fulfillments for a verse."""
-        ex = get_verse_exegesis(reference)
+        ex = _cached_exegesis(reference)
         return ex.typological_fulfillments if ex else None
     
     # ========================================================================
@@ -326,25 +513,27 @@ class BiblosData:
         narrative_context: str = 'historical_narrative',
         active_motifs: Optional[List[str]] = None,
     ) -> NineMatrixSpec:
-        """Generate complete Nine-Matrix specification for a verse."""
-        return generate_nine_matrix(
-            verse_ref=verse_ref,
-            book_category=book_category,
-            verse_number=verse_number,
-            chapter=chapter,
-            current_page=current_page,
-            narrative_context=narrative_context,
-            active_motif_names=active_motifs,
-        )
+        """
+        Generate complete Nine-Matrix specification for a verse.
+        
+        Results are memoized per argument set; each caller gets its own
+        deep copy, so modifying a returned spec never affects later calls.
+        """
+        return copy.deepcopy(_cached_nine_matrix(
+            verse_ref, book_category, verse_number, chapter, current_page,
+            narrative_context, tuple(active_motifs) if active_motifs else None,
+        ))
     
     @staticmethod
     def get_register_spec(register: Register) -> Any:
         """Get specification for a register."""
+        from .nine_matrix import REGISTER_SPECS
         return REGISTER_SPECS.get(register)
     
     @staticmethod
     def get_fourfold_preset(context: str) -> Optional[FourfoldDistribution]:
         """Get fourfold distribution preset for a narrative context."""
+        from .nine_matrix import FOURFOLD_PRESETS
         return FOURFOLD_PRESETS.get(context)
     
     # ========================================================================
@@ -352,22 +541,45 @@ class BiblosData:
     # ========================================================================
     
     @staticmethod
-    def get_sensory_seeds(
+    def get_motif_sensory_seeds(
         motif_name: str,
         modality: Optional[SensoryModality] = None,
     ) -> List[SensorySeed]:
         """Get sensory vocabulary seeds for a motif."""
+        from .sensory_vocabulary import get_sensory_vocabulary
         return get_sensory_vocabulary(motif_name, modality)
     
+    @staticmethod
+    def get_sensory_seeds(
+        name: str,
+        modality: Optional[SensoryModality] = None,
+    ) -> Union[List[SensorySeed], Optional[Dict[str, Tuple[str, ...]]]]:
+        """
+        Deprecated: use get_verse_sensory_seeds or get_motif_sensory_seeds.
+        
+        A verse reference ("Book C:V") goes to the verse variant; anything
+        else, or any call with a modality, goes to the motif variant.
+        """
+        warnings.warn(
+            "BiblosData.get_sensory_seeds is deprecated; use "
+            "get_verse_sensory_seeds or get_motif_sensory_seeds",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if modality is None and ':' in name:
+            return BiblosData.get_verse_sensory_seeds(name)
+        return BiblosData.get_motif_sensory_seeds(name, modality)
+    
     @staticmethod
     def get_motif_forbidden_terms(motif_name: str) -> Tuple[str, ...]:
         """Get terms that must never be used for a motif."""
+        from .sensory_vocabulary import get_forbidden_terms
         return get_forbidden_terms(motif_name)
     
     @staticmethod
-    def get_all_motif_sensory() -> Dict[str, Any]:
-        """Get all registered motif sensory vocabularies."""
-        return MOTIF_SENSORY_REGISTRY.copy()
+    def get_all_motif_sensory() -> Mapping[str, Any]:
+        """Get all registered motif sensory vocabularies as a read-only view (use dict(...) to mutate)."""
+        return _readonly_registry('MOTIF_SENSORY_REGISTRY')
     
     # ========================================================================
     # CHARACTER VOICES (Enhanced)
@@ -376,17 +588,19 @@ class BiblosData:
     @staticmethod
     def get_character_voice(name: str) -> Optional[CharacterVoice]:
         """Get a character's voice specification."""
+        from .character_voices import get_voice
         return get_voice(name)
     
     @staticmethod
     def get_voices_for_type(char_type: CharacterType) -> List[CharacterVoice]:
         """Get all voices of a specific character type."""
+        from .character_voices import get_voices_by_type
         return get_voices_by_type(char_type)
     
     @staticmethod
-    def get_all_voices() -> Dict[str, CharacterVoice]:
-        """Get all registered character voices."""
-        return ALL_VOICES.copy()
+    def get_all_voices() -> Mapping[str, CharacterVoice]:
+        """Get all registered character voices as a read-only view (use dict(...) to mutate)."""
+        return _readonly_registry('ALL_VOICES')
     
     # ========================================================================
     # HEBREW/GREEK MORPHOLOGY (Enhanced)
@@ -395,27 +609,30 @@ class BiblosData:
     @staticmethod
     def get_hebrew(term: str) -> Optional[HebrewTerm]:
         """Get Hebrew term morphological data."""
+        from .morphology import get_hebrew_term
         return get_hebrew_term(term)
     
     @staticmethod
     def get_greek(term: str) -> Optional[GreekTerm]:
         """Get Greek term morphological data."""
+        from .morphology import get_greek_term
         return get_greek_term(term)
     
     @staticmethod
     def get_morphology_for_motif(motif: str) -> Tuple[List[HebrewTerm], List[GreekTerm]]:
         """Get Hebrew and Greek terms associated with a motif."""
+        from .morphology import get_terms_by_motif
         return get_terms_by_motif(motif)
     
     @staticmethod
-    def get_all_hebrew() -> Dict[str, HebrewTerm]:
-        """Get all Hebrew terms."""
-        return ALL_HEBREW.copy()
+    def get_all_hebrew() -> Mapping[str, HebrewTerm]:
+        """Get all Hebrew terms as a read-only view (use dict(...) to mutate)."""
+        return _readonly_registry('ALL_HEBREW')
     
     @staticmethod
-    def get_all_greek() -> Dict[str, GreekTerm]:
-        """Get all Greek terms."""
-        return ALL_GREEK.copy()
+    def get_all_greek() -> Mapping[str, GreekTerm]:
+        """Get all Greek terms as a read-only view (use dict(...) to mutate)."""
+        return _readonly_registry('ALL_GREEK')
     
     # ========================================================================
     # CROSS-REFERENCES / TYPOLOGY (Enhanced)
@@ -424,27 +641,31 @@ class BiblosData:
     @staticmethod
     def get_typological_antitype(ot_ref: str) -> List[TypologicalCorrespondence]:
         """Get NT fulfillments for an OT type."""
+        from .cross_references import get_antitype
         return get_antitype(ot_ref)
     
     @staticmethod
     def get_typological_type(nt_ref: str) -> List[TypologicalCorrespondence]:
         """Get OT types for an NT passage."""
+        from .cross_references import get_type
         return get_type(nt_ref)
     
     @staticmethod
     def get_correspondences_by_category(category: TypeCategory) -> List[TypologicalCorrespondence]:
         """Get all typological correspondences of a category."""
+        from .cross_references import get_by_category
         return get_by_category(category)
     
     @staticmethod
     def get_explicit_types() -> List[TypologicalCorrespondence]:
         """Get all NT-identified explicit types."""
+        from .cross_references import get_explicit
         return get_explicit()
     
     @staticmethod
-    def get_all_correspondences() -> List[TypologicalCorrespondence]:
-        """Get all typological correspondences."""
-        return ALL_CORRESPONDENCES.copy()
+    def get_all_correspondences() -> Tuple[TypologicalCorrespondence, ...]:
+        """Get all typological correspondences as a tuple (use list(...) to mutate)."""
+        return _readonly_registry('ALL_CORRESPONDENCES')
     
     # ========================================================================
     # STATISTICS
@@ -453,62 +674,78 @@ class BiblosData:
     @staticmethod
     def get_statistics() -> Dict[str, Any]:
         """Get comprehensive statistics about all pre-computed data."""
-        exegesis_stats = get_exegesis_stats()
-        
-        return {
-            'books': {
-                'total': len(BOOK_METADATA),
-                'old_testament': sum(1 for m in BOOK_METADATA.values() if m.testament == 'old'),
-                'new_testament': sum(1 for m in BOOK_METADATA.values() if m.testament == 'new'),
-                'deuterocanonical': sum(1 for m in BOOK_METADATA.values() if m.testament == 'deuterocanonical'),
-            },
-            'verses': {
-                'total': sum(m.total_verses for m in BOOK_METADATA.values()),
-                'high_theological_weight': len(HIGH_THEOLOGICAL_WEIGHT_VERSES),
-                'with_exegesis': exegesis_stats['total_verses'],
-            },
-            'motifs': {
-                'with_harmonics': len(MOTIF_HARMONICS),
-                'with_sensory_vocabulary': len(MOTIF_SENSORY_REGISTRY),
-            },
-            'narrative': {
-                'total_events': len(get_narrative_order()),
-                'terminal_event': BiblosData.TERMINAL_TEXT,
-            },
-            'higher_ambition': {
-                'registers': len(REGISTER_SPECS),
-                'fourfold_presets': len(FOURFOLD_PRESETS),
-                'sensory_modalities': len(SensoryModality),
-            },
-            'character_voices': get_voice_stats(),
-            'morphology': get_morphology_stats(),
-            'typological_correspondences': get_crossref_stats(),
-            'aliases': len(BOOK_ALIASES),
-        }
+        # Deep copy so callers may mutate the result without touching the cache
+        return copy.deepcopy(_compute_statistics())
+
+
+@lru_cache(maxsize=None)
+def _compute_statistics() -> Dict[str, Any]:
+    """Build the statistics dict once; every source registry is fixed at import."""
+    from .orthodox_study_bible import get_statistics as get_exegesis_stats
+    from .narrative_order import get_narrative_events
+    from .nine_matrix import REGISTER_SPECS, FOURFOLD_PRESETS
+    from .sensory_vocabulary import SensoryModality, MOTIF_SENSORY_REGISTRY
+    from .character_voices import get_statistics as get_voice_stats
+    from .morphology import get_statistics as get_morphology_stats
+    from .cross_references import get_statistics as get_crossref_stats
+    
+    testaments = get_testament_counts()
+    
+    return {
+        'books': {
+            'total': len(BOOK_METADATA),
+            'old_testament': testaments['old'],
+            'new_testament': testaments['new'],
+            'deuterocanonical': testaments['deuterocanonical'],
+        },
+        'verses': {
+            'total': get_total_verses(),
+            'high_theological_weight': len(HIGH_THEOLOGICAL_WEIGHT_VERSES),
+            'with_exegesis': get_exegesis_stats()['total_verses'],
+        },
+        'motifs': {
+            'with_harmonics': len(MOTIF_HARMONICS),
+            'with_sensory_vocabulary': len(MOTIF_SENSORY_REGISTRY),
+        },
+        'narrative': {
+            'total_events': len(get_narrative_events()),
+            'terminal_event': BiblosData.TERMINAL_TEXT,
+        },
+        'higher_ambition': {
+            'registers': len(REGISTER_SPECS),
+            'fourfold_presets': len(FOURFOLD_PRESETS),
+            'sensory_modalities': len(SensoryModality),
+        },
+        'character_voices': get_voice_stats(),
+        'morphology': get_morphology_stats(),
+        'typological_correspondences': get_crossref_stats(),
+        'aliases': len(BOOK_ALIASES),
+    }
 
 
 # ============================================================================
 # CONVENIENCE FUNCTIONS (Module-level access)
 # ============================================================================
 
-# Create singleton instance
-_data = BiblosData()
-
-# Export commonly used functions at module level
-get_book = _data.get_book
-get_exegesis = _data.get_exegesis
-get_fourfold_sense = _data.get_fourfold_sense
-get_narrative = _data.get_narrative_order
-get_terminal = _data.get_terminal
-get_statistics = _data.get_statistics
+# Export commonly used functions at module level. Pure pass-throughs bind the
+# underlying function directly so callers skip the class attribute lookup
+# and the wrapper frame. get_narrative / get_terminal resolve lazily through
+# _LAZY_ATTRS so importing this module does not load narrative_order.
+get_book = get_book_meta
+get_exegesis = _cached_exegesis
+get_verse_bundle = BiblosData.get_verse_bundle
+get_fourfold_sense = BiblosData.get_fourfold_sense
+get_statistics = BiblosData.get_statistics
+is_high_weight = is_high_theological_weight
 
 
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
 
-def main():
-    """CLI interface for exploring unified data."""
+@lru_cache(maxsize=1)
+def _parser() -> "argparse.ArgumentParser":
+    """Build the CLI argument parser once."""
     import argparse
     
     parser = argparse.ArgumentParser(description='ΒΊΒΛΟΣ ΛΌΓΟΥ Unified Data Access')
@@ -518,99 +755,165 @@ def main():
     parser.add_argument('--terminal', action='store_true', help='Show terminal event')
     parser.add_argument('--phrase', type=str, help='Find phrase echoes and plantings')
     
-    args = parser.parse_args()
-    
-    if args.verse:
-        print(f"\n{'='*60}")
-        print(f"Data for: {args.verse}")
-        print(f"{'='*60}")
-        
-        ex = get_exegesis(args.verse)
-        if ex:
-            print(f"\nText: {ex.text}")
-            print(f"\nLiteral: {ex.literal}")
-            print(f"\nAllegorical: {ex.allegorical}")
-            print(f"\nTropological: {ex.tropological}")
-            print(f"\nAnagogical: {ex.anagogical}")
-            print(f"\nTonal Weight: {ex.tonal_weight.value}")
-            print(f"Native Mood: {ex.native_mood}")
-            print(f"Dread Amplification: {ex.dread_amplification}")
-            if ex.plants_phrase:
-                print(f"Plants Phrase: '{ex.plants_phrase}'")
-            if ex.echoes_phrase:
-                print(f"Echoes Phrase: '{ex.echoes_phrase}'")
-        else:
-            print(f"No pre-computed exegesis for: {args.verse}")
-            
-            # Show what we do have
-            high_weight = BiblosData.is_high_weight(args.verse)
-            print(f"High Theological Weight: {high_weight}")
-    
-    elif args.book:
-        meta = get_book(args.book)
-        if meta:
-            print(f"\nBook: {meta.name}")
-            print(f"Canonical Order: {meta.canonical_order}")
-            print(f"Testament: {meta.testament}")
-            print(f"Category: {meta.category}")
-            print(f"Chapters: {meta.chapters}")
-            print(f"Verses: {meta.total_verses}")
-        else:
-            print(f"Unknown book: {args.book}")
-    
-    elif args.stats:
-        stats = get_statistics()
-        print("\n" + "="*60)
-        print("ΒΊΒΛΟΣ ΛΌΓΟΥ Data Statistics")
-        print("="*60)
-        print(f"\nBooks:")
-        print(f"  Total: {stats['books']['total']}")
-        print(f"  Old Testament: {stats['books']['old_testament']}")
-        print(f"  New Testament: {stats['books']['new_testament']}")
-        print(f"  Deuterocanonical: {stats['books']['deuterocanonical']}")
-        print(f"\nVerses:")
-        print(f"  Total in Bible: {stats['verses']['total']:,}")
-        print(f"  High Theological Weight: {stats['verses']['high_theological_weight']}")
-        print(f"  With Full Exegesis: {stats['verses']['with_exegesis']}")
-        print(f"\nNarrative:")
-        print(f"  Total Events: {stats['narrative']['total_events']}")
-        print(f"  Terminal: \"{stats['narrative']['terminal_event']}\"")
-    
-    elif args.terminal:
-        terminal = get_terminal()
-        print(f"\n{'='*60}")
-        print("THE NARRATIVE ENDS HERE")
-        print(f"{'='*60}")
-        print(f"\nEvent: {terminal.event_text}")
-        print(f"Reference: {terminal.verse_reference}")
-        print(f"Part: {terminal.part.value}")
-        print(f"Mood: {terminal.native_mood}")
-        if terminal.echoes_phrase:
-            print(f"Echoes: '{terminal.echoes_phrase}'")
-        if terminal.breath_note:
-            print(f"\n{terminal.breath_note}")
-    
-    elif args.phrase:
-        print(f"\nSearching for phrase: '{args.phrase}'")
-        
-        plantings = BiblosData.find_phrase_plantings(args.phrase)
-        echoes = BiblosData.find_phrase_echoes(args.phrase)
-        
-        if plantings:
-            print(f"\nPlanted in:")
-            for e in plantings:
-                print(f"  {e.verse_reference}: {e.event_text[:50]}...")
-        
-        if echoes:
-            print(f"\nEchoed in:")
-            for e in echoes:
-                print(f"  {e.verse_reference}: {e.event_text[:50]}...")
+    # Subcommand spellings of the flags above; each handler imports only
+    # the data modules its own path needs.
+    sub = parser.add_subparsers(dest='cmd', metavar='command')
+    sub.add_parser('verse', help='Get all data for a verse').add_argument('ref')
+    sub.add_parser('book', help='Get book metadata').add_argument('name')
+    sub.add_parser('stats', help='Show statistics')
+    sub.add_parser('terminal', help='Show terminal event')
+    sub.add_parser('phrase', help='Find phrase echoes and plantings').add_argument('text')
+    return parser
+
+
+def _emit(out: List[str]) -> None:
+    """Write the collected lines to stdout in one call."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+# ============================================================================
+# CLI COMMANDS
+# Each handler appends its lines to ``out``; main() writes them once.
+# ============================================================================
+
+def _cmd_verse(ref: str, out: List[str]) -> None:
+    """All pre-computed data for one verse."""
+    out += [f"\n{'='*60}", f"Data for: {ref}", f"{'='*60}"]
+    
+    bundle = get_verse_bundle(ref)
+    if bundle:
+        out += [
+            f"\nText: {bundle['text']}",
+            f"\nLiteral: {bundle['literal']}",
+            f"\nAllegorical: {bundle['allegorical']}",
+            f"\nTropological: {bundle['tropological']}",
+            f"\nAnagogical: {bundle['anagogical']}",
+            f"\nTonal Weight: {bundle['tonal_weight']}",
+            f"Native Mood: {bundle['native_mood']}",
+            f"Dread Amplification: {bundle['dread_amplification']}",
+        ]
+        if bundle['plants_phrase']:
+            out.append(f"Plants Phrase: '{bundle['plants_phrase']}'")
+        if bundle['echoes_phrase']:
+            out.append(f"Echoes Phrase: '{bundle['echoes_phrase']}'")
+    else:
+        out.append(f"No pre-computed exegesis for: {ref}")
         
-        if not plantings and not echoes:
-            print("No matches found.")
+        # Show what we do have
+        high_weight = is_high_weight(ref)
+        out.append(f"High Theological Weight: {high_weight}")
+
+
+def _cmd_book(name: str, out: List[str]) -> None:
+    """Book metadata; touches only the precomputed tables."""
+    meta = get_book(name)
+    if meta:
+        out += [
+            f"\nBook: {meta.name}",
+            f"Canonical Order: {meta.canonical_order}",
+            f"Testament: {meta.testament}",
+            f"Category: {meta.category}",
+            f"Chapters: {meta.chapters}",
+            f"Verses: {meta.total_verses}",
+        ]
+    else:
+        out.append(f"Unknown book: {name}")
+
+
+def _cmd_stats(out: List[str]) -> None:
+    """Append the --stats summary to ``out``."""
+    stats = get_statistics()
+    books, verses, narrative = stats['books'], stats['verses'], stats['narrative']
+    out += [
+        "\n" + "="*60,
+        "ΒΊΒΛΟΣ ΛΌΓΟΥ Data Statistics",
+        "="*60,
+        "\nBooks:",
+        f"  Total: {books['total']}",
+        f"  Old Testament: {books['old_testament']}",
+        f"  New Testament: {books['new_testament']}",
+        f"  Deuterocanonical: {books['deuterocanonical']}",
+        "\nVerses:",
+        f"  Total in Bible: {verses['total']:,}",
+        f"  High Theological Weight: {verses['high_theological_weight']}",
+        f"  With Full Exegesis: {verses['with_exegesis']}",
+        "\nNarrative:",
+        f"  Total Events: {narrative['total_events']}",
+        f"  Terminal: \"{narrative['terminal_event']}\"",
+    ]
+
+
+def _cmd_terminal(out: List[str]) -> None:
+    """The terminal narrative event."""
+    from .narrative_order import get_terminal_event
+    terminal = get_terminal_event()
+    out += [
+        f"\n{'='*60}",
+        "THE NARRATIVE ENDS HERE",
+        f"{'='*60}",
+        f"\nEvent: {terminal.event_text}",
+        f"Reference: {terminal.verse_reference}",
+        f"Part: {terminal.part.value}",
+        f"Mood: {terminal.native_mood}",
+    ]
+    if terminal.echoes_phrase:
+        out.append(f"Echoes: '{terminal.echoes_phrase}'")
+    if terminal.breath_note:
+        out.append(f"\n{terminal.breath_note}")
+
+
+def _cmd_phrase(phrase: str, out: List[str]) -> None:
+    """Narrative events that plant or echo a phrase."""
+    out.append(f"\nSearching for phrase: '{phrase}'")
+    
+    from .narrative_order import find_echoes, find_plantings
+    plantings = find_plantings(phrase)
+    echoes = find_echoes(phrase)
+    
+    if plantings:
+        out.append("\nPlanted in:")
+        out += [f"  {e.verse_reference}: {e.event_text[:50]}..." for e in plantings]
+    
+    if echoes:
+        out.append("\nEchoed in:")
+        out += [f"  {e.verse_reference}: {e.event_text[:50]}..." for e in echoes]
     
+    if not plantings and not echoes:
+        out.append("No matches found.")
+
+
+def _print_stats() -> None:
+    """Print the --stats summary."""
+    out: List[str] = []
+    _cmd_stats(out)
+    _emit(out)
+
+
+def main():
+    """CLI interface for exploring unified data."""
+    # `--stats` alone is the common scripted call; answer it without argparse.
+    if sys.argv[1:] in (['--stats'], ['stats']):
+        return _print_stats()
+    
+    parser = _parser()
+    args = parser.parse_args()
+    out: List[str] = []
+    
+    if args.cmd == 'verse' or args.verse:
+        _cmd_verse(args.ref if args.cmd == 'verse' else args.verse, out)
+    elif args.cmd == 'book' or args.book:
+        _cmd_book(args.name if args.cmd == 'book' else args.book, out)
+    elif args.cmd == 'stats' or args.stats:
+        _cmd_stats(out)
+    elif args.cmd == 'terminal' or args.terminal:
+        _cmd_terminal(out)
+    elif args.cmd == 'phrase' or args.phrase:
+        _cmd_phrase(args.text if args.cmd == 'phrase' else args.phrase, out)
     else:
         parser.print_help()
+    
+    _emit(out)
 
 
 if __name__ == "__main__":
@@ -13,78 +13,188 @@ A comprehensive Orthodox Exegetical Commentary System implementing:
 - Typological Network Building
 """
 
+import io
+import re
 import sys
-import argparse
+import atexit
 import logging
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 from datetime import datetime
+from contextlib import contextmanager, redirect_stderr
+from functools import lru_cache
+from importlib import import_module
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from queue import SimpleQueue
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from config.settings import config, BASE_DIR, OUTPUT_DIR, LOGS_DIR
-from scripts.database import init_db, close_db, get_db
+if TYPE_CHECKING:
+    import argparse
 
-# Ensure directories exist
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+class _LogFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory only when the file is first opened."""
+    
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+# Log file path with date, fixed once per process (set by _bootstrap())
+_TODAY = datetime.now().strftime('%Y%m%d')
+LOG_FILE: Optional[Path] = None
 
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-def setup_logging(verbose: bool = False):
-    """Configure logging"""
+# Drains the log queue into the buffered file handler; see setup_logging().
+_log_listener: Optional[QueueListener] = None
+
+
+def setup_logging(verbose: bool = False, file: bool = True):
+    """
+    Configure logging.
+    
+    Console output stays synchronous. File records go through a queue to a
+    background listener, which batches them in a MemoryHandler and writes
+    them out every 1024 records, on any ERROR, and on stop_logging().
+    With ``file=False`` (read-only commands) only the console is used.
+    """
+    global _log_listener
     level = logging.DEBUG if verbose else logging.INFO
     
-    # Create log file path with date
-    log_file = LOGS_DIR / f"biblos_logou_{datetime.now().strftime('%Y%m%d')}.log"
+    if not file:
+        logging.basicConfig(level=level, format=_LOG_FORMAT)
+        return
+    
+    file_handler = _LogFileHandler(LOG_FILE, delay=True)
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    buffered = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    
+    log_queue = SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # The listener's handler applies the real format; the queue only needs
+    # the merged message so it is not formatted twice.
+    queue_handler.setFormatter(logging.Formatter())
+    
+    stop_logging()
+    _log_listener = QueueListener(log_queue, buffered)
+    _log_listener.start()
+    atexit.register(stop_logging)
     
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=_LOG_FORMAT,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler(log_file)
+            queue_handler
         ]
     )
 
 
+def stop_logging() -> None:
+    """Drain queued log records and flush them to the log file."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.flush()
+        _log_listener = None
+
+
+def _bootstrap() -> None:
+    """
+    Import settings and the database layer.
+    
+    Called by main() only once a real command has been parsed, so --help
+    and usage errors never pay for them.
+    """
+    global config, BASE_DIR, OUTPUT_DIR, LOGS_DIR, LOG_FILE, ensure_dirs
+    global init_db, close_db, get_db
+    from config.settings import config, BASE_DIR, OUTPUT_DIR, LOGS_DIR, ensure_dirs
+    from scripts.database import init_db, close_db, get_db
+    LOG_FILE = LOGS_DIR / f"biblos_logou_{_TODAY}.log"
+
+
+@lru_cache(maxsize=None)
+def _load(module: str, name: str) -> Any:
+    """Import ``name`` from ``module`` the first time a handler asks for it."""
+    return getattr(import_module(module), name)
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write report lines to stdout in one call instead of one print() each."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+@lru_cache(maxsize=None)
+def _orchestrator(cls):
+    """
+    Return the process-wide ``cls(get_db())`` instance (orchestrators and
+    repositories alike).
+    
+    The cached instances hold the current database manager, so the cache
+    must be cleared whenever close_db() discards it (main() does this).
+    """
+    return cls(get_db())
+
+
+@contextmanager
+def _bulk_load():
+    """
+    One transaction for a bulk load.
+    
+    The commit does not wait for the WAL flush (synchronous_commit off for
+    this transaction only): a crash can lose the load but never corrupt the
+    database, and a lost load is simply re-run.
+    """
+    db = get_db()
+    with db.transaction():
+        db.execute("SET LOCAL synchronous_commit = OFF")
+        yield
+
+
 def cmd_init(args):
     """Initialize the database"""
-    from scripts.ingestion import IngestionOrchestrator
-    
-    db = get_db()
-    orchestrator = IngestionOrchestrator(db)
-    
-    # Run schema if provided
-    schema_path = args.schema or (BASE_DIR / 'bible_refinement_db.sql')
-    if schema_path.exists():
-        print(f"Running schema from {schema_path}...")
-        if orchestrator.run_schema(schema_path):
-            print("Schema executed successfully")
-        else:
-            print("Schema execution failed")
-            return 1
-    
-    # Initialize motifs
-    if args.motifs or args.all:
-        print("Initializing motifs...")
-        stats = orchestrator.initialize_system()
-        print(f"Initialized {stats.get('motifs', 0)} motifs")
+    IngestionOrchestrator = _load('scripts.ingestion', 'IngestionOrchestrator')
+    
+    orchestrator = _orchestrator(IngestionOrchestrator)
+    
+    # Schema and seed data commit together; their inner statements run as
+    # savepoints of this one transaction.
+    with _bulk_load():
+        # Run schema if provided
+        schema_path = args.schema or (BASE_DIR / 'bible_refinement_db.sql')
+        if schema_path.exists():
+            print(f"Running schema from {schema_path}...")
+            if orchestrator.run_schema(schema_path):
+                print("Schema executed successfully")
+            else:
+                print("Schema execution failed")
+                return 1
+        
+        # Initialize motifs
+        if args.motifs or args.all:
+            print("Initializing motifs...")
+            stats = orchestrator.initialize_system()
+            print(f"Initialized {stats.get('motifs', 0)} motifs")
     
     return 0
 
 
 def cmd_ingest(args):
     """Ingest data into the database"""
-    from scripts.ingestion import IngestionOrchestrator
+    IngestionOrchestrator = _load('scripts.ingestion', 'IngestionOrchestrator')
     
-    db = get_db()
-    orchestrator = IngestionOrchestrator(db)
+    orchestrator = _orchestrator(IngestionOrchestrator)
     
     if args.verses:
         print(f"Ingesting verses from {args.verses}...")
-        count = orchestrator.ingest_verses_from_file(Path(args.verses))
+        # One commit for the whole file rather than one per batch or row
+        with _bulk_load():
+            count = orchestrator.ingest_verses_from_file(Path(args.verses), args.full_rebuild)
         print(f"Ingested {count} verses")
     
     return 0
@@ -92,7 +202,7 @@ def cmd_ingest(args):
 
 def cmd_process(args):
     """Process verses through the refinement pipeline"""
-    from scripts.processing import VerseProcessor
+    VerseProcessor = _load('scripts.processing', 'VerseProcessor')
     
     db = get_db()
     processor = VerseProcessor(db)
@@ -112,160 +222,230 @@ def cmd_process(args):
     return 0
 
 
+def _run_action(actions, target, args) -> int:
+    """
+    Run the first action in ``actions`` whose flag is set on ``args``.
+    
+    ``actions`` is a tuple of (attribute, function) pairs, checked in order
+    (the precedence of the old if/elif chains). The function is called as
+    ``function(target, args)``.
+    """
+    for name, action in actions:
+        if getattr(args, name, None):
+            action(target, args)
+            break
+    return 0
+
+
+_EXPORT_FORMATS = {
+    'both': ['markdown', 'json'],
+    'all': ['markdown', 'json', 'html'],
+}
+
+
+def _export_formats(args) -> List[str]:
+    """Expand the --format option into the list of formats to write."""
+    return _EXPORT_FORMATS.get(args.format) or [args.format]
+
+
+def _export_book(orchestrator, args):
+    print(f"Exporting {args.book}...")
+    results = orchestrator.export_book(args.book, _export_formats(args))
+    for fmt, path in results.items():
+        if path:
+            print(f"  {fmt}: {path}")
+
+
+def _export_dashboard(orchestrator, args):
+    print("Generating dashboard...")
+    path = orchestrator.markdown.export_progress_dashboard()
+    print(f"Dashboard (Markdown): {path}")
+    if 'html' in _export_formats(args):
+        html_path = orchestrator.html.export_progress_dashboard()
+        print(f"Dashboard (HTML): {html_path}")
+
+
+def _export_all(orchestrator, args):
+    print("Exporting all outputs...")
+    results = orchestrator.export_all(_export_formats(args))
+    for fmt, paths in results.items():
+        for path in paths:
+            if path:
+                print(f"  {fmt}: {path}")
+
+
+_EXPORT_ACTIONS = (
+    ('book', _export_book),
+    ('dashboard', _export_dashboard),
+    ('all', _export_all),
+)
+
+
 def cmd_export(args):
     """Export data to various formats"""
-    from scripts.output_generator import OutputOrchestrator
+    OutputOrchestrator = _load('scripts.output_generator', 'OutputOrchestrator')
     
     db = get_db()
     orchestrator = OutputOrchestrator(db)
     
-    # Parse format options
-    if args.format == 'both':
-        formats = ['markdown', 'json']
-    elif args.format == 'all':
-        formats = ['markdown', 'json', 'html']
-    else:
-        formats = [args.format]
-    
-    if args.book:
-        print(f"Exporting {args.book}...")
-        results = orchestrator.export_book(args.book, formats)
-        for fmt, path in results.items():
-            if path:
-                print(f"  {fmt}: {path}")
-    elif args.dashboard:
-        print("Generating dashboard...")
-        path = orchestrator.markdown.export_progress_dashboard()
-        print(f"Dashboard (Markdown): {path}")
-        if 'html' in formats:
-            html_path = orchestrator.html.export_progress_dashboard()
-            print(f"Dashboard (HTML): {html_path}")
-    elif args.all:
-        print("Exporting all outputs...")
-        results = orchestrator.export_all(formats)
-        for fmt, paths in results.items():
-            for path in paths:
-                if path:
-                    print(f"  {fmt}: {path}")
-    
-    return 0
+    return _run_action(_EXPORT_ACTIONS, orchestrator, args)
+
+
+# Status counts are reused across invocations for this long (see --no-cache)
+_STATUS_CACHE_SECONDS = 30.0
+
+
+def _status_cache_path() -> Path:
+    """Per-database file holding the last status counts."""
+    db = config.database
+    return OUTPUT_DIR / '.cache' / f"status_{db.host}_{db.port}_{db.database}.json"
+
+
+def _cached_status(args) -> Optional[Dict[str, Dict[Any, int]]]:
+    """Fresh cached status counts, or None if they must be queried."""
+    if args.no_cache:
+        return None
+    cached = _load('scripts.query_cache', 'read_json_cache')(
+        _status_cache_path(), _STATUS_CACHE_SECONDS)
+    if cached is None:
+        return None
+    # Stored as pairs: a NULL verse status is not a valid JSON object key
+    return {part: dict(pairs) for part, pairs in cached.items()}
 
 
 def cmd_status(args):
     """Show system status"""
-    from scripts.ingestion import IngestionOrchestrator
-    
-    db = get_db()
-    orchestrator = IngestionOrchestrator(db)
-    
-    status = orchestrator.get_ingestion_status()
+    counts = _cached_status(args)
+    if counts is None:
+        VerseRepository = _load('scripts.database', 'VerseRepository')
+        STATUS_TABLES = _load('scripts.ingestion', 'STATUS_TABLES')
+        
+        # Table counts and verse status counts come back from one aggregate query
+        verse_repo = _orchestrator(VerseRepository)
+        counts = verse_repo.get_all_counts(STATUS_TABLES)
+        _load('scripts.query_cache', 'write_json_cache')(
+            _status_cache_path(), {part: list(c.items()) for part, c in counts.items()})
+    status = counts['tables']
     
-    print("\n" + "=" * 50)
-    print("ΒΊΒΛΟΣ ΛΌΓΟΥ System Status")
-    print("=" * 50)
+    lines = ["\n" + "=" * 50, "ΒΊΒΛΟΣ ΛΌΓΟΥ System Status", "=" * 50]
     
-    print("\nTable Counts:")
-    for table, count in status.items():
-        print(f"  {table}: {count:,}")
+    lines.append("\nTable Counts:")
+    lines.extend(f"  {table}: {count:,}" for table, count in status.items())
     
     # Get processing stats
-    from scripts.database import VerseRepository
-    verse_repo = VerseRepository(db)
-    stats = verse_repo.get_completion_stats()
+    stats = counts['status']
     
-    print("\nProcessing Status:")
+    lines.append("\nProcessing Status:")
+    total = refined = 0
     for status_name, count in stats.items():
-        print(f"  {status_name}: {count:,}")
+        lines.append(f"  {status_name}: {count:,}")
+        total += count
+        if status_name == 'refined':
+            refined = count
     
-    total = sum(stats.values())
-    refined = stats.get('refined', 0)
     if total > 0:
-        print(f"\nCompletion: {refined/total*100:.1f}%")
+        lines.append(f"\nCompletion: {refined/total*100:.1f}%")
     
-    print("=" * 50 + "\n")
+    lines.append("=" * 50 + "\n")
+    _write_lines(lines)
     
     return 0
 
 
+# "<book> <chapter>:<verse>", e.g. "1 John 4:8"
+_VERSE_RE = re.compile(r'^\s*(?P<book>\S.*?)\s+(?P<chapter>\d+):(?P<verse>\d+)\s*$')
+
+
 def cmd_fetch(args):
     """Fetch verse text from Bible API"""
-    from tools.bible_api import VerseFetcher
+    VerseFetcher = _load('tools.bible_api', 'VerseFetcher')
     
     db = get_db()
     fetcher = VerseFetcher(db)
     
     if args.populate:
         print(f"Populating missing verse text (limit: {args.limit})...")
-        count = fetcher.populate_missing_verses(args.book, args.limit)
+        import asyncio
+        count = asyncio.run(fetcher.populate_missing_verses_async(args.book, args.limit))
         print(f"Updated {count} verses")
     elif args.verse:
-        parts = args.verse.split()
-        if len(parts) >= 2:
-            book = ' '.join(parts[:-1])
-            ref = parts[-1].split(':')
-            if len(ref) == 2:
-                text = fetcher.fetch_verse(book, int(ref[0]), int(ref[1]))
-                if text:
-                    print(f"\n{args.verse}:\n{text}\n")
-                else:
-                    print("Verse not found")
+        m = _VERSE_RE.match(args.verse)
+        if not m:
+            print(f"Invalid verse reference: {args.verse!r} (expected e.g. \"John 3:16\")")
+            return 1
+        text = fetcher.fetch_verse(m['book'], int(m['chapter']), int(m['verse']))
+        if text:
+            print(f"\n{args.verse}:\n{text}\n")
+        else:
+            print("Verse not found")
     
     return 0
 
 
+# Per-type cell formatters for the validation report; unknown types use str
+_FMT = {float: '{:.3f}'.format, int: str, str: str, bool: str}
+
+
+def _validate_full(orchestrator, args):
+    print("Running full validation suite...")
+    results = orchestrator.run_full_validation(args.sample_size)
+    
+    lines = ["\n" + "=" * 60, "VALIDATION RESULTS", "=" * 60]
+    
+    for check_name, check_data in results['checks'].items():
+        lines.append(f"\n{check_name.upper()}:")
+        lines.extend(f"  {key}: {_FMT.get(type(value), str)(value)}"
+                     for key, value in check_data.items())
+    
+    lines.append(f"\nOVERALL STATUS: {results['overall']['status']}")
+    lines.append("=" * 60)
+    _write_lines(lines)
+
+
+def _validate_verse(orchestrator, args):
+    result = orchestrator.invisibility.verify_verse(args.verse_id)
+    status = 'PASS' if result.get('passes') else 'FAIL'
+    print(f"\nVerse {args.verse_id}: {status}")
+    
+    if result.get('checks'):
+        for field, check in result['checks'].items():
+            icon = '✓' if check['passes'] else '✗'
+            print(f"  {icon} {field}: score={check['score']:.2f}")
+
+
+def _validate_density(orchestrator, args):
+    recommendations = orchestrator.density.get_density_recommendations(args.density_page)
+    print(f"\nThread Density at page {args.density_page}:")
+    for rec in recommendations:
+        print(f"  • {rec}")
+
+
+_VALIDATE_ACTIONS = (
+    ('full', _validate_full),
+    ('verse_id', _validate_verse),
+    ('density_page', _validate_density),
+)
+
+
 def cmd_validate(args):
     """Run validation checks"""
-    from scripts.validation import ValidationOrchestrator
+    ValidationOrchestrator = _load('scripts.validation', 'ValidationOrchestrator')
     
     db = get_db()
     orchestrator = ValidationOrchestrator(db)
     
-    if args.full:
-        print("Running full validation suite...")
-        results = orchestrator.run_full_validation(args.sample_size)
-        
-        print("\n" + "=" * 60)
-        print("VALIDATION RESULTS")
-        print("=" * 60)
-        
-        for check_name, check_data in results['checks'].items():
-            print(f"\n{check_name.upper()}:")
-            for key, value in check_data.items():
-                if isinstance(value, float):
-                    print(f"  {key}: {value:.3f}")
-                else:
-                    print(f"  {key}: {value}")
-        
-        print(f"\nOVERALL STATUS: {results['overall']['status']}")
-        print("=" * 60)
-    
-    elif args.verse_id:
-        result = orchestrator.invisibility.verify_verse(args.verse_id)
-        status = 'PASS' if result.get('passes') else 'FAIL'
-        print(f"\nVerse {args.verse_id}: {status}")
-        
-        if result.get('checks'):
-            for field, check in result['checks'].items():
-                icon = '✓' if check['passes'] else '✗'
-                print(f"  {icon} {field}: score={check['score']:.2f}")
-    
-    elif args.density_page:
-        recommendations = orchestrator.density.get_density_recommendations(args.density_page)
-        print(f"\nThread Density at page {args.density_page}:")
-        for rec in recommendations:
-            print(f"  • {rec}")
-    
-    return 0
+    return _run_action(_VALIDATE_ACTIONS, orchestrator, args)
 
 
 def cmd_analytics(args):
     """Generate analytics reports"""
-    from scripts.analytics import AnalyticsDashboard
+    AnalyticsDashboard = _load('scripts.analytics', 'AnalyticsDashboard')
     
     db = get_db()
     dashboard = AnalyticsDashboard(db)
     
     if args.report:
+        ensure_dirs()
         print("Generating analytics report...")
         
         if args.format in ['json', 'both']:
@@ -277,7 +457,7 @@ def cmd_analytics(args):
             print(f"  Markdown: {path}")
     
     elif args.processing:
-        from scripts.analytics import ProcessingAnalytics
+        ProcessingAnalytics = _load('scripts.analytics', 'ProcessingAnalytics')
         analytics = ProcessingAnalytics(db)
         
         velocity = analytics.get_processing_velocity()
@@ -287,28 +467,31 @@ def cmd_analytics(args):
         print(f"  Trend: {velocity.get('trend', 'N/A')}")
     
     elif args.motifs:
-        from scripts.analytics import MotifAnalytics
+        MotifAnalytics = _load('scripts.analytics', 'MotifAnalytics')
         analytics = MotifAnalytics(db)
         
         overview = analytics.get_motif_status_overview()
-        print("\nMotif Status Overview:")
+        lines = ["\nMotif Status Overview:"]
         for layer, statuses in overview.get('by_layer', {}).items():
-            print(f"  {layer}:")
-            for status, count in statuses.items():
-                print(f"    {status}: {count}")
+            lines.append(f"  {layer}:")
+            lines.extend(f"    {status}: {count}" for status, count in statuses.items())
         
         approaching = analytics.get_approaching_convergences()
         if approaching['approaching']:
-            print("\nApproaching Convergences:")
-            for m in approaching['approaching'][:5]:
-                print(f"  • {m['name']}: {m['pages_remaining']} pages remaining")
+            lines.append("\nApproaching Convergences:")
+            lines.extend(f"  • {m['name']}: {m['pages_remaining']} pages remaining"
+                         for m in approaching['approaching'][:5])
+        _write_lines(lines)
     
     return 0
 
 
 def cmd_orchestrate(args):
     """Batch orchestration operations"""
-    from scripts.orchestration import BatchProcessor, OrchestrationScheduler, CheckpointManager, BatchConfig
+    BatchProcessor = _load('scripts.orchestration', 'BatchProcessor')
+    OrchestrationScheduler = _load('scripts.orchestration', 'OrchestrationScheduler')
+    CheckpointManager = _load('scripts.orchestration', 'CheckpointManager')
+    BatchConfig = _load('scripts.orchestration', 'BatchConfig')
     
     db = get_db()
     
@@ -316,26 +499,26 @@ def cmd_orchestrate(args):
         manager = CheckpointManager()
         checkpoints = manager.list_checkpoints()
         
-        print("\nAvailable Checkpoints:")
-        print("=" * 60)
+        lines = ["\nAvailable Checkpoints:", "=" * 60]
         if checkpoints:
-            for cp in checkpoints:
-                print(f"  {cp['batch_id']}: {cp['processed']}/{cp['total']} ({cp['timestamp']})")
+            lines.extend(f"  {cp['batch_id']}: {cp['processed']}/{cp['total']} ({cp['timestamp']})"
+                         for cp in checkpoints)
         else:
-            print("  No checkpoints found")
+            lines.append("  No checkpoints found")
+        _write_lines(lines)
         return 0
     
     if args.plan:
         scheduler = OrchestrationScheduler(db)
         plan = scheduler.create_processing_plan(args.plan)
         
-        print(f"\nProcessing Plan ({args.plan}):")
-        print("=" * 60)
+        lines = [f"\nProcessing Plan ({args.plan}):", "=" * 60]
         total_verses = 0
         for item in plan:
-            print(f"  {item['type']}: {item['name']} ({item['verse_count']} verses) [{item['priority']}]")
+            lines.append(f"  {item['type']}: {item['name']} ({item['verse_count']} verses) [{item['priority']}]")
             total_verses += item['verse_count']
-        print(f"\nTotal: {total_verses:,} verses across {len(plan)} items")
+        lines.append(f"\nTotal: {total_verses:,} verses across {len(plan)} items")
+        _write_lines(lines)
         return 0
     
     if args.execute:
@@ -348,7 +531,7 @@ def cmd_orchestrate(args):
         )
         
         print(f"Executing plan: {args.execute}")
-        results = scheduler.execute_plan(plan, batch_config)
+        results = scheduler.execute_plan_parallel(plan, batch_config, processes=args.workers)
         
         print(f"\nPlan Execution Complete:")
         print(f"  Completed: {results['completed']}/{results['plan_items']}")
@@ -376,115 +559,145 @@ def cmd_orchestrate(args):
     return 0
 
 
+def _patristic_list_fathers(manager, args):
+    fathers = manager.get_all_fathers()
+    lines = ["\nChurch Fathers by Era:", "=" * 60]
+    for era, father_list in fathers.items():
+        lines.append(f"\n{era.upper().replace('_', ' ')}:")
+        lines.extend(f"  • {f['name']} ({f['dates']}) - {f['tradition']}" for f in father_list)
+    _write_lines(lines)
+
+
+def _patristic_father(manager, args):
+    info = manager.get_father_info(args.father)
+    if info:
+        print(f"\n{info['name']}")
+        print("=" * 40)
+        print(f"Dates: {info['dates']}")
+        print(f"Tradition: {info['tradition']}")
+        print(f"Era: {info['era']}")
+        print(f"Emphases: {', '.join(info.get('emphases', []))}")
+    else:
+        print(f"Father not found: {args.father}")
+
+
+def _patristic_verse(manager, args):
+    commentaries = manager.get_commentary_for_verse(args.verse)
+    print(f"\nPatristic commentary for {args.verse}:")
+    if commentaries:
+        for c in commentaries:
+            print(f"\n  {c.get('father_name', 'Unknown')}:")
+            text = c.get('condensed_summary', c.get('original_text', ''))
+            print(f"    {text[:200]}...")
+    else:
+        print("  No commentary found")
+
+
+def _patristic_catena(manager, args):
+    CatenaGenerator = _load('tools.patristic_integration', 'CatenaGenerator')
+    
+    generator = CatenaGenerator(manager.db)
+    catena = generator.generate_catena(args.catena)
+    print(f"\nCatena for {args.catena}:")
+    print("=" * 60)
+    if catena['entries']:
+        for entry in catena['entries']:
+            print(f"\n{entry['father']} ({entry['work']}):")
+            print(f"  {entry['text'][:250]}...")
+    else:
+        print("  No catena entries found")
+
+
+_PATRISTIC_ACTIONS = (
+    ('list_fathers', _patristic_list_fathers),
+    ('father', _patristic_father),
+    ('verse', _patristic_verse),
+    ('catena', _patristic_catena),
+)
+
+
 def cmd_patristic(args):
     """Patristic integration operations"""
-    from tools.patristic_integration import PatristicSourceManager, CatenaGenerator
+    PatristicSourceManager = _load('tools.patristic_integration', 'PatristicSourceManager')
     
     db = get_db()
     manager = PatristicSourceManager(db)
     
-    if args.list_fathers:
-        fathers = manager.get_all_fathers()
-        print("\nChurch Fathers by Era:")
-        print("=" * 60)
-        for era, father_list in fathers.items():
-            print(f"\n{era.upper().replace('_', ' ')}:")
-            for f in father_list:
-                print(f"  • {f['name']} ({f['dates']}) - {f['tradition']}")
-    
-    elif args.father:
-        info = manager.get_father_info(args.father)
-        if info:
-            print(f"\n{info['name']}")
-            print("=" * 40)
-            print(f"Dates: {info['dates']}")
-            print(f"Tradition: {info['tradition']}")
-            print(f"Era: {info['era']}")
-            print(f"Emphases: {', '.join(info.get('emphases', []))}")
-        else:
-            print(f"Father not found: {args.father}")
-    
-    elif args.verse:
-        commentaries = manager.get_commentary_for_verse(args.verse)
-        print(f"\nPatristic commentary for {args.verse}:")
-        if commentaries:
-            for c in commentaries:
-                print(f"\n  {c.get('father_name', 'Unknown')}:")
-                text = c.get('condensed_summary', c.get('original_text', ''))
-                print(f"    {text[:200]}...")
-        else:
-            print("  No commentary found")
-    
-    elif args.catena:
-        generator = CatenaGenerator(db)
-        catena = generator.generate_catena(args.catena)
-        print(f"\nCatena for {args.catena}:")
-        print("=" * 60)
-        if catena['entries']:
-            for entry in catena['entries']:
-                print(f"\n{entry['father']} ({entry['work']}):")
-                print(f"  {entry['text'][:250]}...")
-        else:
-            print("  No catena entries found")
+    return _run_action(_PATRISTIC_ACTIONS, manager, args)
+
+
+def _crossref_init_typology(db, args):
+    TypologicalNetworkBuilder = _load('tools.cross_references', 'TypologicalNetworkBuilder')
     
-    return 0
+    builder = TypologicalNetworkBuilder(db)
+    count = builder.initialize_core_typologies()
+    print(f"Initialized {count} typological correspondences")
+
+
+def _crossref_analyze(db, args):
+    CrossReferenceAnalyzer = _load('tools.cross_references', 'CrossReferenceAnalyzer')
+    
+    analyzer = CrossReferenceAnalyzer(db)
+    refs = analyzer.find_references_for_verse(args.analyze)
+    
+    outgoing = refs.get('outgoing', [])
+    incoming = refs.get('incoming', [])
+    lines = [f"\nReferences for {args.analyze}:", f"  Outgoing ({len(outgoing)}):"]
+    lines.extend(f"    → {r['target']} ({r['relationship_type']})" for r in outgoing[:5])
+    lines.append(f"  Incoming ({len(incoming)}):")
+    lines.extend(f"    ← {r['source']} ({r['relationship_type']})" for r in incoming[:5])
+    _write_lines(lines)
+
+
+def _crossref_suggest(db, args):
+    ReferenceSuggester = _load('tools.cross_references', 'ReferenceSuggester')
+    
+    suggester = ReferenceSuggester(db)
+    suggestions = suggester.suggest_for_verse(args.suggest)
+    
+    lines = [f"\nSuggestions for {args.suggest}:",
+             f"  Existing references: {len(suggestions['existing_references'])}"]
+    if suggestions['suggested_additions']:
+        lines.append("  Suggested additions:")
+        lines.extend(f"    • {s['reference']} ({s['reason']})"
+                     for s in suggestions['suggested_additions'][:5])
+    if suggestions['typological_opportunities']:
+        lines.append("  Typological opportunities:")
+        lines.extend(f"    • {t['reference']} (confidence: {t['confidence']:.2f})"
+                     for t in suggestions['typological_opportunities'][:5])
+    _write_lines(lines)
+
+
+def _crossref_stats(db, args):
+    TypologicalNetworkBuilder = _load('tools.cross_references', 'TypologicalNetworkBuilder')
+    
+    builder = TypologicalNetworkBuilder(db)
+    stats = builder.get_network_statistics()
+    
+    print("\nTypological Network Statistics:")
+    print(f"  Total Correspondences: {stats['total_correspondences']}")
+    print(f"  Average Distance: {stats['average_distance']}")
+    print("  By Type:")
+    for t, c in stats.get('by_type', {}).items():
+        print(f"    {t}: {c}")
+
+
+_CROSSREF_ACTIONS = (
+    ('init_typology', _crossref_init_typology),
+    ('analyze', _crossref_analyze),
+    ('suggest', _crossref_suggest),
+    ('stats', _crossref_stats),
+)
 
 
 def cmd_crossref(args):
     """Cross-reference operations"""
-    from tools.cross_references import CrossReferenceAnalyzer, TypologicalNetworkBuilder, ReferenceSuggester
-    
-    db = get_db()
-    
-    if args.init_typology:
-        builder = TypologicalNetworkBuilder(db)
-        count = builder.initialize_core_typologies()
-        print(f"Initialized {count} typological correspondences")
-    
-    elif args.analyze:
-        analyzer = CrossReferenceAnalyzer(db)
-        refs = analyzer.find_references_for_verse(args.analyze)
-        
-        print(f"\nReferences for {args.analyze}:")
-        print(f"  Outgoing ({len(refs.get('outgoing', []))}):")
-        for r in refs.get('outgoing', [])[:5]:
-            print(f"    → {r['target']} ({r['relationship_type']})")
-        print(f"  Incoming ({len(refs.get('incoming', []))}):")
-        for r in refs.get('incoming', [])[:5]:
-            print(f"    ← {r['source']} ({r['relationship_type']})")
-    
-    elif args.suggest:
-        suggester = ReferenceSuggester(db)
-        suggestions = suggester.suggest_for_verse(args.suggest)
-        
-        print(f"\nSuggestions for {args.suggest}:")
-        print(f"  Existing references: {len(suggestions['existing_references'])}")
-        if suggestions['suggested_additions']:
-            print("  Suggested additions:")
-            for s in suggestions['suggested_additions'][:5]:
-                print(f"    • {s['reference']} ({s['reason']})")
-        if suggestions['typological_opportunities']:
-            print("  Typological opportunities:")
-            for t in suggestions['typological_opportunities'][:5]:
-                print(f"    • {t['reference']} (confidence: {t['confidence']:.2f})")
-    
-    elif args.stats:
-        builder = TypologicalNetworkBuilder(db)
-        stats = builder.get_network_statistics()
-        
-        print("\nTypological Network Statistics:")
-        print(f"  Total Correspondences: {stats['total_correspondences']}")
-        print(f"  Average Distance: {stats['average_distance']}")
-        print("  By Type:")
-        for t, c in stats.get('by_type', {}).items():
-            print(f"    {t}: {c}")
-    
-    return 0
+    return _run_action(_CROSSREF_ACTIONS, get_db(), args)
 
 
 def cmd_populate(args):
     """Populate verses for all 73 canonical books"""
-    from scripts.population import VersePopulator
+    VersePopulator = _load('scripts.population', 'VersePopulator')
     
     db = get_db()
     populator = VersePopulator(db)
@@ -554,7 +767,7 @@ def cmd_populate(args):
 
 def cmd_web(args):
     """Start the web interface server"""
-    from web.app import run_server
+    run_server = _load('web.app', 'run_server')
     
     print(f"Starting ΒΊΒΛΟΣ ΛΌΓΟΥ Web Interface...")
     print(f"  Host: {args.host}")
@@ -567,12 +780,14 @@ def cmd_web(args):
     return 0
 
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description='ΒΊΒΛΟΣ ΛΌΓΟΥ - Orthodox Exegetical Commentary System',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# ============================================================================
+# ARGUMENT PARSERS
+# Options are declared once in COMMANDS. Ordinary command lines are parsed
+# straight from that table; argparse is only built for help, errors and
+# anything unusual, and then only for the invoked command when it is known.
+# ============================================================================
+
+_EPILOG = """
 Examples:
   python main.py init --schema bible_refinement_db.sql --all
   python main.py ingest --verses data/verses.txt
@@ -590,143 +805,264 @@ Examples:
   python main.py web                   # Start web interface
   python main.py web --port 8080       # Start web interface on port 8080
         """
+
+
+class Command(NamedTuple):
+    """A subcommand: its handler, --help text, options and database use."""
+    handler: Callable[[Any], int]
+    help: str
+    # (flag, kind, default, help). ``kind`` is bool for store_true switches,
+    # a tuple for a fixed set of string choices, or the callable that
+    # converts the value (str, int, Path).
+    options: Tuple[Tuple[str, Any, Any, Optional[str]], ...] = ()
+    # Whether main() must open the database first; a callable decides from
+    # the parsed flags for commands where only some actions touch it.
+    needs_db: Union[bool, Callable[[Any], bool]] = True
+    # Whether to write the log file; read-only queries log to the console only
+    log_file: Union[bool, Callable[[Any], bool]] = True
+    
+    def requires_db(self, args) -> bool:
+        """Resolve needs_db for this invocation."""
+        return self.needs_db(args) if callable(self.needs_db) else self.needs_db
+    
+    def logs_to_file(self, args) -> bool:
+        """Resolve log_file for this invocation."""
+        return self.log_file(args) if callable(self.log_file) else self.log_file
+
+
+# The single registry of subcommands, used for parsing, --help and dispatch.
+# Registration order is the order shown in --help.
+COMMANDS: Dict[str, Command] = {
+    'init': Command(cmd_init, 'Initialize database', (
+        ('--schema', Path, None, 'Path to SQL schema file'),
+        ('--motifs', bool, False, 'Initialize motifs'),
+        ('--all', bool, False, 'Initialize everything'),
+    )),
+    'ingest': Command(cmd_ingest, 'Ingest data', (
+        ('--verses', str, None, 'Path to verses file'),
+        ('--full-rebuild', bool, False, 'Verses table is empty (fresh init); insert without conflict checks'),
+    )),
+    'process': Command(cmd_process, 'Process verses', (
+        ('--batch', int, 100, 'Batch size'),
+        ('--continuous', bool, False, 'Run continuously'),
+        ('--verse-id', int, None, 'Process specific verse'),
+    )),
+    'export': Command(cmd_export, 'Export data', (
+        ('--book', str, None, 'Export specific book'),
+        ('--dashboard', bool, False, 'Generate dashboard'),
+        ('--all', bool, False, 'Export all'),
+        ('--format', ('markdown', 'json', 'html', 'both', 'all'), 'markdown',
+         'Output format (markdown, json, html, both for md+json, all for all formats)'),
+    )),
+    'status': Command(cmd_status, 'Show system status', (
+        ('--no-cache', bool, False, 'Query the database even if counts from the last 30s are cached'),
+    ), needs_db=lambda a: _cached_status(a) is None, log_file=False),
+    'fetch': Command(cmd_fetch, 'Fetch verse text from API', (
+        ('--verse', str, None, 'Fetch specific verse (e.g., "Genesis 1:1")'),
+        ('--populate', bool, False, 'Populate missing verses'),
+        ('--book', str, None, 'Limit to specific book'),
+        ('--limit', int, 100, 'Limit number of verses'),
+    )),
+    'validate': Command(cmd_validate, 'Run validation checks', (
+        ('--full', bool, False, 'Run full validation suite'),
+        ('--sample-size', int, 100, 'Sample size for validation'),
+        ('--verse-id', int, None, 'Validate specific verse'),
+        ('--density-page', int, None, 'Check density at page'),
+    )),
+    'analytics': Command(cmd_analytics, 'Generate analytics', (
+        ('--report', bool, False, 'Generate full report'),
+        ('--format', ('markdown', 'json', 'both'), 'markdown', None),
+        ('--processing', bool, False, 'Show processing analytics'),
+        ('--motifs', bool, False, 'Show motif analytics'),
+    ), log_file=lambda args: args.report),
+    'orchestrate': Command(cmd_orchestrate, 'Batch orchestration', (
+        ('--run', bool, False, 'Run batch processing'),
+        ('--plan', ('sequential', 'by_category', 'incomplete_first'), None, 'Show processing plan'),
+        ('--execute', ('sequential', 'by_category', 'incomplete_first'), None, 'Execute processing plan'),
+        ('--list-checkpoints', bool, False, 'List checkpoints'),
+        ('--batch-size', int, 100, 'Batch size'),
+        ('--workers', int, 4, 'Number of workers'),
+    ), needs_db=lambda args: not args.list_checkpoints,
+       log_file=lambda args: not (args.list_checkpoints or args.plan)),
+    'patristic': Command(cmd_patristic, 'Patristic integration', (
+        ('--list-fathers', bool, False, 'List Church Fathers'),
+        ('--father', str, None, 'Get info about Father'),
+        ('--verse', str, None, 'Get commentary for verse'),
+        ('--catena', str, None, 'Generate catena for verse'),
+    ), needs_db=lambda args: not (args.list_fathers or args.father),
+       log_file=lambda args: not (args.list_fathers or args.father)),
+    'crossref': Command(cmd_crossref, 'Cross-reference operations', (
+        ('--init-typology', bool, False, 'Initialize typological pairs'),
+        ('--analyze', str, None, 'Analyze references for verse'),
+        ('--suggest', str, None, 'Suggest references for verse'),
+        ('--stats', bool, False, 'Show network statistics'),
+    ), log_file=lambda args: not args.stats),
+    # Full 73-book verse population
+    'populate': Command(cmd_populate, 'Populate verses for all 73 canonical books', (
+        ('--status', bool, False, 'Show population status'),
+        ('--all', bool, False, 'Populate all 73 books'),
+        ('--book', str, None, 'Populate specific book'),
+        ('--text-only', bool, False, 'Only populate text for existing records'),
+        ('--no-text', bool, False, 'Create records without text'),
+        ('--use-api', bool, False, 'Use API for missing text'),
+        ('--missing', bool, False, 'Show verses missing text'),
+        ('--limit', int, None, 'Limit verses to process'),
+    )),
+    'web': Command(cmd_web, 'Start the web interface server', (
+        ('--host', str, '0.0.0.0', 'Host to bind to (default: 0.0.0.0)'),
+        ('--port', int, 5000, 'Port to bind to (default: 5000)'),
+        ('--debug', bool, False, 'Enable debug mode'),
+    ), needs_db=False),
+}
+
+
+def _dest(flag: str) -> str:
+    return flag[2:].replace('-', '_')
+
+
+def _add_command_parser(subparsers, command: str) -> None:
+    """Register one subcommand and its options from COMMANDS."""
+    sub = subparsers.add_parser(command, help=COMMANDS[command].help)
+    for flag, kind, default, help_text in COMMANDS[command].options:
+        if kind is bool:
+            sub.add_argument(flag, action='store_true', help=help_text)
+        elif isinstance(kind, tuple):
+            sub.add_argument(flag, choices=list(kind), default=default, help=help_text)
+        else:
+            sub.add_argument(flag, type=kind, default=default, help=help_text)
+
+
+def _peek_command(argv) -> Optional[str]:
+    """Return the subcommand token in argv, if any (top-level flags take no values)."""
+    for arg in argv:
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
+def _fast_parse(argv) -> Optional[SimpleNamespace]:
+    """
+    Parse a well-formed ``[-v] command [--flag [value] ...]`` line directly
+    from COMMANDS, without constructing argparse.
+    
+    Returns None for anything else (help, unknown flags, bad values, no
+    command) so the caller can fall back to argparse for its messages.
+    """
+    verbose = False
+    i = 0
+    while i < len(argv) and argv[i] in ('-v', '--verbose'):
+        verbose = True
+        i += 1
+    if i == len(argv) or argv[i] not in COMMANDS:
+        return None
+    
+    command = argv[i]
+    specs = {flag: (kind, default) for flag, kind, default, _ in COMMANDS[command].options}
+    values = {_dest(flag): default for flag, (kind, default) in specs.items()}
+    
+    args = iter(argv[i + 1:])
+    for token in args:
+        spec = specs.get(token)
+        if spec is None:
+            return None
+        kind = spec[0]
+        if kind is bool:
+            values[_dest(token)] = True
+            continue
+        value = next(args, None)
+        if value is None or value.startswith('-'):
+            return None
+        if isinstance(kind, tuple):
+            if value not in kind:
+                return None
+        else:
+            try:
+                value = kind(value)
+            except ValueError:
+                return None
+        values[_dest(token)] = value
+    
+    return SimpleNamespace(verbose=verbose, command=command, **values)
+
+
+def build_parser(command: Optional[str] = None) -> "argparse.ArgumentParser":
+    """Build the CLI parser, registering only ``command``'s subparser when it is known."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='ΒΊΒΛΟΣ ΛΌΓΟΥ - Orthodox Exegetical Commentary System',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize database')
-    init_parser.add_argument('--schema', type=Path, help='Path to SQL schema file')
-    init_parser.add_argument('--motifs', action='store_true', help='Initialize motifs')
-    init_parser.add_argument('--all', action='store_true', help='Initialize everything')
-    
-    # Ingest command
-    ingest_parser = subparsers.add_parser('ingest', help='Ingest data')
-    ingest_parser.add_argument('--verses', type=str, help='Path to verses file')
-    
-    # Process command
-    process_parser = subparsers.add_parser('process', help='Process verses')
-    process_parser.add_argument('--batch', type=int, default=100, help='Batch size')
-    process_parser.add_argument('--continuous', action='store_true', help='Run continuously')
-    process_parser.add_argument('--verse-id', type=int, help='Process specific verse')
-    
-    # Export command
-    export_parser = subparsers.add_parser('export', help='Export data')
-    export_parser.add_argument('--book', type=str, help='Export specific book')
-    export_parser.add_argument('--dashboard', action='store_true', help='Generate dashboard')
-    export_parser.add_argument('--all', action='store_true', help='Export all')
-    export_parser.add_argument('--format', choices=['markdown', 'json', 'html', 'both', 'all'], 
-                              default='markdown', 
-                              help='Output format (markdown, json, html, both for md+json, all for all formats)')
-    
-    # Status command
-    subparsers.add_parser('status', help='Show system status')
-    
-    # Fetch command
-    fetch_parser = subparsers.add_parser('fetch', help='Fetch verse text from API')
-    fetch_parser.add_argument('--verse', type=str, help='Fetch specific verse (e.g., "Genesis 1:1")')
-    fetch_parser.add_argument('--populate', action='store_true', help='Populate missing verses')
-    fetch_parser.add_argument('--book', type=str, help='Limit to specific book')
-    fetch_parser.add_argument('--limit', type=int, default=100, help='Limit number of verses')
-    
-    # Validate command
-    validate_parser = subparsers.add_parser('validate', help='Run validation checks')
-    validate_parser.add_argument('--full', action='store_true', help='Run full validation suite')
-    validate_parser.add_argument('--sample-size', type=int, default=100, help='Sample size for validation')
-    validate_parser.add_argument('--verse-id', type=int, help='Validate specific verse')
-    validate_parser.add_argument('--density-page', type=int, help='Check density at page')
-    
-    # Analytics command
-    analytics_parser = subparsers.add_parser('analytics', help='Generate analytics')
-    analytics_parser.add_argument('--report', action='store_true', help='Generate full report')
-    analytics_parser.add_argument('--format', choices=['markdown', 'json', 'both'], default='markdown')
-    analytics_parser.add_argument('--processing', action='store_true', help='Show processing analytics')
-    analytics_parser.add_argument('--motifs', action='store_true', help='Show motif analytics')
-    
-    # Orchestrate command
-    orch_parser = subparsers.add_parser('orchestrate', help='Batch orchestration')
-    orch_parser.add_argument('--run', action='store_true', help='Run batch processing')
-    orch_parser.add_argument('--plan', choices=['sequential', 'by_category', 'incomplete_first'],
-                            help='Show processing plan')
-    orch_parser.add_argument('--execute', choices=['sequential', 'by_category', 'incomplete_first'],
-                            help='Execute processing plan')
-    orch_parser.add_argument('--list-checkpoints', action='store_true', help='List checkpoints')
-    orch_parser.add_argument('--batch-size', type=int, default=100, help='Batch size')
-    orch_parser.add_argument('--workers', type=int, default=4, help='Number of workers')
-    
-    # Patristic command
-    patristic_parser = subparsers.add_parser('patristic', help='Patristic integration')
-    patristic_parser.add_argument('--list-fathers', action='store_true', help='List Church Fathers')
-    patristic_parser.add_argument('--father', type=str, help='Get info about Father')
-    patristic_parser.add_argument('--verse', type=str, help='Get commentary for verse')
-    patristic_parser.add_argument('--catena', type=str, help='Generate catena for verse')
-    
-    # Cross-reference command
-    xref_parser = subparsers.add_parser('crossref', help='Cross-reference operations')
-    xref_parser.add_argument('--init-typology', action='store_true', help='Initialize typological pairs')
-    xref_parser.add_argument('--analyze', type=str, help='Analyze references for verse')
-    xref_parser.add_argument('--suggest', type=str, help='Suggest references for verse')
-    xref_parser.add_argument('--stats', action='store_true', help='Show network statistics')
-    
-    # Populate command - Full 73-book verse population
-    populate_parser = subparsers.add_parser('populate', help='Populate verses for all 73 canonical books')
-    populate_parser.add_argument('--status', action='store_true', help='Show population status')
-    populate_parser.add_argument('--all', action='store_true', help='Populate all 73 books')
-    populate_parser.add_argument('--book', type=str, help='Populate specific book')
-    populate_parser.add_argument('--text-only', action='store_true', help='Only populate text for existing records')
-    populate_parser.add_argument('--no-text', action='store_true', help='Create records without text')
-    populate_parser.add_argument('--use-api', action='store_true', help='Use API for missing text')
-    populate_parser.add_argument('--missing', action='store_true', help='Show verses missing text')
-    populate_parser.add_argument('--limit', type=int, help='Limit verses to process')
-    
-    # Web command - Start web interface
-    web_parser = subparsers.add_parser('web', help='Start the web interface server')
-    web_parser.add_argument('--host', default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
-    web_parser.add_argument('--port', type=int, default=5000, help='Port to bind to (default: 5000)')
-    web_parser.add_argument('--debug', action='store_true', help='Enable debug mode')
-    
-    args = parser.parse_args()
-    
-    if not args.command:
-        parser.print_help()
-        return 0
+    for name in ((command,) if command in COMMANDS else COMMANDS):
+        _add_command_parser(subparsers, name)
     
-    # Setup
-    setup_logging(args.verbose)
+    return parser
+
+
+def _parse_args(argv) -> Tuple["argparse.ArgumentParser", Any]:
+    """
+    Parse argv with argparse, registering only the invoked subcommand.
+    
+    If that fails, argv is parsed again with every subcommand registered,
+    so usage errors print the same usage line and choices as always.
+    """
+    command = _peek_command(argv)
+    if command in COMMANDS:
+        parser = build_parser(command)
+        try:
+            with redirect_stderr(io.StringIO()):
+                return parser, parser.parse_args(argv)
+        except SystemExit as e:
+            if not e.code:  # --help
+                raise
+    parser = build_parser()
+    return parser, parser.parse_args(argv)
+
+
+def main():
+    """Main entry point"""
+    argv = sys.argv[1:]
+    args = _fast_parse(argv)
+    if args is None:
+        parser, args = _parse_args(argv)
+        
+        if not args.command:
+            parser.print_help()
+            return 0
     
-    # Web command handles database initialization internally
-    if args.command == 'web':
-        return cmd_web(args)
+    # Setup
+    _bootstrap()
+    command = COMMANDS[args.command]
+    setup_logging(args.verbose, file=command.logs_to_file(args))
+    
+    # Commands (or actions) that never touch the database skip opening it;
+    # web handles database initialization internally
+    if not command.requires_db(args):
+        try:
+            return command.handler(args)
+        finally:
+            stop_logging()
     
     # Initialize database for other commands
-    if not init_db():
+    # ThreadedConnectionPool raises rather than blocks when exhausted, so
+    # size it for every batch worker plus the coordinating thread.
+    if not init_db(max_connections=getattr(args, 'workers', 0) + 1):
         print("Failed to initialize database connection")
         print("Check your database configuration in config/settings.py or .env")
         return 1
     
     try:
-        # Execute command
-        commands = {
-            'init': cmd_init,
-            'ingest': cmd_ingest,
-            'process': cmd_process,
-            'export': cmd_export,
-            'status': cmd_status,
-            'fetch': cmd_fetch,
-            'validate': cmd_validate,
-            'analytics': cmd_analytics,
-            'orchestrate': cmd_orchestrate,
-            'patristic': cmd_patristic,
-            'crossref': cmd_crossref,
-            'populate': cmd_populate,
-            'web': cmd_web
-        }
-        
-        return commands[args.command](args)
+        return command.handler(args)
     finally:
+        _orchestrator.cache_clear()
         close_db()
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -336,7 +336,10 @@ def get_logger() -> Logger:
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+_REF_RE = re.compile(r'((?:\d\s+)?[A-Za-z\s]+?)\s+(\d+):(\d+)')
+
+
+@dataclass(frozen=True)
 class VerseReference:
     """Parsed verse reference with book, chapter, and verse"""
     book: str
@@ -346,24 +349,8 @@ class VerseReference:
     
     @classmethod
     def parse(cls, verse_ref: str) -> 'VerseReference':
-        """Parse a verse reference string"""
-        match = re.match(r'((?:\d\s+)?[A-Za-z\s]+?)\s+(\d+):(\d+)', verse_ref)
-        if match:
-            book = match.group(1).strip()
-            chapter = int(match.group(2))
-            verse = int(match.group(3))
-            return cls(book=book, chapter=chapter, verse=verse, original=verse_ref)
-        
-        # Fallback parsing
-        parts = verse_ref.split()
-        if len(parts) >= 2:
-            book = ' '.join(parts[:-1]) if any(c.isdigit() for c in parts[0]) else parts[0]
-            chapter_verse = parts[-1]. split(':')
-            chapter = int(chapter_verse[0]) if chapter_verse[0].isdigit() else 1
-            verse = int(chapter_verse[1]) if len(chapter_verse) > 1 and chapter_verse[1].isdigit() else 1
-            return cls(book=book, chapter=chapter, verse=verse, original=verse_ref)
-        
-        return cls(book=verse_ref, chapter=1, verse=1, original=verse_ref)
+        """Parse a verse reference string (cached; instances are immutable)"""
+        return _parse_ref(verse_ref)
     
     @property
     def category(self) -> BookCategory:
@@ -381,6 +368,28 @@ class VerseReference:
         return self.original
 
 
+@lru_cache(maxsize=65536)
+def _parse_ref(verse_ref: str) -> VerseReference:
+    """Parse a verse reference string"""
+    match = _REF_RE.match(verse_ref)
+    if match:
+        book = match.group(1).strip()
+        chapter = int(match.group(2))
+        verse = int(match.group(3))
+        return VerseReference(book=book, chapter=chapter, verse=verse, original=verse_ref)
+    
+    # Fallback parsing
+    parts = verse_ref.split()
+    if len(parts) >= 2:
+        book = ' '.join(parts[:-1]) if any(c.isdigit() for c in parts[0]) else parts[0]
+        chapter_verse = parts[-1]. split(':')
+        chapter = int(chapter_verse[0]) if chapter_verse[0].isdigit() else 1
+        verse = int(chapter_verse[1]) if len(chapter_verse) > 1 and chapter_verse[1].isdigit() else 1
+        return VerseReference(book=book, chapter=chapter, verse=verse, original=verse_ref)
+    
+    return VerseReference(book=verse_ref, chapter=1, verse=1, original=verse_ref)
+
+
 @dataclass
 class MatrixElements:
     """Nine-matrix theological elements"""
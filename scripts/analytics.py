@@ -17,6 +17,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import config, CANONICAL_ORDER
 from scripts.database import get_db, DatabaseManager
+from scripts.query_cache import ttl_cache
+from scripts.output_generator import json_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -50,14 +52,19 @@ class ProcessingAnalytics:
         if not results:
             return {'error': 'No processing data available'}
         
-        total_processed = sum(r['verses_processed'] for r in results)
+        counts = [r['verses_processed'] for r in results]
+        total_processed = sum(counts)
         avg_per_day = total_processed / len(results) if results else 0
         
-        # Calculate trend
+        # Trend: sign of the least-squares slope of count against day, using
+        # real day offsets so days with no processing are not skipped over
         if len(results) >= 2:
-            first_half = sum(r['verses_processed'] for r in results[:len(results)//2])
-            second_half = sum(r['verses_processed'] for r in results[len(results)//2:])
-            trend = 'increasing' if second_half > first_half else 'decreasing' if second_half < first_half else 'stable'
+            first = results[0]['process_date']
+            xs = [(r['process_date'] - first).days for r in results]
+            x_mean = sum(xs) / len(xs)
+            # The slope has the sign of this covariance term
+            covariance = sum((x - x_mean) * c for x, c in zip(xs, counts))
+            trend = 'increasing' if covariance > 0 else 'decreasing' if covariance < 0 else 'stable'
         else:
             trend = 'insufficient_data'
         
@@ -526,8 +533,14 @@ class AnalyticsDashboard:
         self.motif = MotifAnalytics(self.db)
         self.typology = TypologicalAnalytics(self.db)
     
+    @ttl_cache(seconds=30)
     def generate_full_report(self) -> Dict[str, Any]:
-        """Generate comprehensive analytics report"""
+        """
+        Generate comprehensive analytics report.
+        
+        Cached briefly so that exporting JSON and Markdown together runs
+        the report queries once.
+        """
         logger.info("Generating analytics report...")
         
         report = {
@@ -568,8 +581,7 @@ class AnalyticsDashboard:
         """Export analytics to JSON file"""
         report = self.generate_full_report()
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        output_path.write_bytes(json_bytes(report))
         
         logger.info(f"Analytics exported to {output_path}")
         return output_path
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+ΒΊΒΛΟΣ ΛΌΓΟΥ Batch Inserter
+Accumulates rows and writes them as multi-row INSERT ... VALUES statements.
+"""
+
+import sys
+import logging
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Sequence, Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL caps bind parameters per statement at 65535; stay well below it
+DEFAULT_MAX_PARAMS = 32767
+
+Row = Union[Sequence[Any], Mapping[str, Any]]
+
+
+class BatchInserter:
+    """
+    Buffer rows for one table and flush them as a single
+    ``INSERT INTO t (cols) VALUES (...), (...), ...`` statement.
+
+    A flush happens automatically once a statement would exceed
+    ``max_params`` parameters, and on leaving a ``with`` block.
+
+    Example:
+        with BatchInserter(db, 'motifs', ('name', 'description')) as ins:
+            for motif in motifs:
+                ins.insert((motif['name'], motif['description']))
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        table: str,
+        cols: Sequence[str],
+        max_params: int = DEFAULT_MAX_PARAMS,
+        suffix: str = ""
+    ) -> None:
+        """
+        Args:
+            db: Database manager used to execute the statements.
+            table: Target table name.
+            cols: Target column names; mapping rows are read in this order.
+            max_params: Maximum bind parameters per statement.
+            suffix: Clause appended to every statement, e.g. ``ON CONFLICT ...``.
+        """
+        self.db = db
+        self.cols = tuple(cols)
+        # Placeholder strings are built once, not per flush
+        self._row_sql = "(" + ", ".join(["%s"] * len(self.cols)) + ")"
+        self.rows_per_statement = max(1, max_params // len(self.cols))
+        self._prefix = f"INSERT INTO {table} ({', '.join(self.cols)}) VALUES "
+        self._suffix = f" {suffix}" if suffix else ""
+        self._full_sql = self._statement(self.rows_per_statement)
+        self.batch: List[Row] = []
+        self.inserted = 0
+
+    def _statement(self, n: int) -> str:
+        """SQL text for a batch of ``n`` rows."""
+        return self._prefix + ", ".join([self._row_sql] * n) + self._suffix
+
+    def insert(self, row: Row) -> None:
+        """Queue one row, flushing if the statement is full."""
+        self.batch.append(row)
+        if len(self.batch) >= self.rows_per_statement:
+            self.flush()
+
+    def insert_many(self, rows: Iterable[Row]) -> None:
+        """Queue several rows."""
+        for row in rows:
+            self.insert(row)
+
+    def flush(self) -> int:
+        """
+        Write the queued rows.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            QueryError: If the statement fails. The queued rows are discarded
+                either way; callers that need per-row recovery keep their own
+                copy.
+        """
+        batch, self.batch = self.batch, []
+        if not batch:
+            return 0
+
+        sql = self._full_sql if len(batch) == self.rows_per_statement else self._statement(len(batch))
+        args: List[Any] = []
+        for row in batch:
+            if isinstance(row, Mapping):
+                args.extend(row[col] for col in self.cols)
+            else:
+                args.extend(row)
+
+        self.db.execute(sql, args)
+        self.inserted += len(batch)
+        return len(batch)
+
+    def __enter__(self) -> "BatchInserter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
@@ -10,12 +10,16 @@ This module provides:
 - Repository classes for domain-specific queries
 """
 
+import os
+import re
 import sys
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Generator, Union, Tuple
+from typing import Optional, List, Dict, Any, Generator, Iterable, Union, Tuple
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -99,21 +103,29 @@ class DatabaseManager:
         self.config: DatabaseConfig = db_config or config.database
         self._pool: Optional[pool.ThreadedConnectionPool] = None
         self._initialized: bool = False
+        # Per-thread open transaction: ``conn`` and its SAVEPOINT depth
+        self._local = threading.local()
     
     @property
     def is_initialized(self) -> bool:
         """Check if the database pool is initialized."""
         return self._initialized
     
-    def initialize(self) -> bool:
+    def initialize(self, max_connections: Optional[int] = None) -> bool:
         """
         Initialize the connection pool.
         
+        Args:
+            max_connections: Minimum pool ceiling required by the caller,
+                e.g. one connection per batch worker plus the coordinator.
+                The configured max_connections is used if it is larger.
+        
         Returns:
             True if initialization succeeded, False otherwise.
             
         Note:
             This method is idempotent - calling it multiple times is safe.
+            An already-initialized pool is not resized.
         """
         if self._initialized:
             return True
@@ -125,7 +137,7 @@ class DatabaseManager:
         try:
             self._pool = pool.ThreadedConnectionPool(
                 minconn=self.config.min_connections,
-                maxconn=self.config.max_connections,
+                maxconn=max(self.config.max_connections, max_connections or 0),
                 host=self.config.host,
                 port=self.config.port,
                 database=self.config.database,
@@ -175,7 +187,16 @@ class DatabaseManager:
             
         Raises:
             ConnectionError: If unable to get a connection from the pool.
+            
+        Note:
+            Inside transaction() the calling thread's transaction connection
+            is yielded, so reads see the transaction's uncommitted writes.
         """
+        active = getattr(self._local, 'conn', None)
+        if active is not None:
+            yield active
+            return
+        
         self._ensure_initialized()
         
         conn: Optional[PgConnection] = None
@@ -199,13 +220,25 @@ class DatabaseManager:
         """
         Context manager for transactions with automatic commit/rollback.
         
+        Nested calls on the same thread (including execute() and friends)
+        join the outer transaction through a SAVEPOINT, so an inner failure
+        rolls back only its own work and nothing commits until the
+        outermost block exits.
+        
         Yields:
             A database connection in a transaction context.
             
         Raises:
             TransactionError: If the transaction fails.
         """
+        active = getattr(self._local, 'conn', None)
+        if active is not None:
+            with self._savepoint(active):
+                yield active
+            return
+        
         with self.get_connection() as conn:
+            self._local.conn = conn
             try:
                 yield conn
                 conn.commit()
@@ -216,6 +249,50 @@ class DatabaseManager:
                     logger.error(f"Error during rollback: {rollback_error}")
                 logger.error(f"Transaction rolled back: {e}")
                 raise TransactionError(f"Transaction failed: {e}") from e
+            finally:
+                self._local.conn = None
+    
+    @contextmanager
+    def _savepoint(self, conn: PgConnection) -> Generator[None, None, None]:
+        """Run a nested transaction block as a SAVEPOINT on ``conn``."""
+        depth = getattr(self._local, 'depth', 0) + 1
+        self._local.depth = depth
+        name = f"biblos_sp_{depth}"
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"SAVEPOINT {name}")
+            try:
+                yield
+            except Exception as e:
+                with conn.cursor() as cur:
+                    cur.execute(f"ROLLBACK TO SAVEPOINT {name}")
+                logger.error(f"Rolled back to savepoint {name}: {e}")
+                raise TransactionError(f"Transaction failed: {e}") from e
+            except BaseException:
+                # e.g. GeneratorExit when a fetch_batch() consumer stops early
+                with conn.cursor() as cur:
+                    cur.execute(f"ROLLBACK TO SAVEPOINT {name}")
+                raise
+            with conn.cursor() as cur:
+                cur.execute(f"RELEASE SAVEPOINT {name}")
+        finally:
+            self._local.depth = depth - 1
+    
+    @contextmanager
+    def _reading(self) -> Generator[PgConnection, None, None]:
+        """
+        Connection for the fetch helpers.
+        
+        Inside transaction() the read runs in its own SAVEPOINT, so a failed
+        (and caught) query does not leave the outer transaction aborted.
+        """
+        active = getattr(self._local, 'conn', None)
+        if active is None:
+            with self.get_connection() as conn:
+                yield conn
+        else:
+            with self._savepoint(active):
+                yield active
     
     def execute(self, query: str, params: Optional[Union[Tuple, Dict[str, Any]]] = None) -> int:
         """
@@ -268,6 +345,43 @@ class DatabaseManager:
         except Exception as e:
             raise QueryError(f"Failed to execute batch query: {e}") from e
     
+    def execute_batch(
+        self, 
+        query: str, 
+        params_list: List[Union[Tuple[Any, ...], Dict[str, Any]]], 
+        page_size: int = 1000
+    ) -> int:
+        """
+        Execute a query for many parameter sets in a single transaction.
+        
+        Unlike execute_many, statements are sent to the server ``page_size``
+        at a time (psycopg2.extras.execute_batch) instead of one round trip
+        per parameter set.
+        
+        Args:
+            query: SQL query to execute.
+            params_list: Parameter tuples or dicts.
+            page_size: Statements per round trip.
+            
+        Returns:
+            Number of parameter sets executed.
+            
+        Raises:
+            QueryError: If the batch fails; nothing is committed.
+        """
+        if not params_list:
+            return 0
+            
+        try:
+            with self.transaction() as conn:
+                with conn.cursor() as cur:
+                    extras.execute_batch(cur, query, params_list, page_size=page_size)
+            return len(params_list)
+        except TransactionError:
+            raise
+        except Exception as e:
+            raise QueryError(f"Failed to execute batch query: {e}") from e
+    
     def fetch_one(self, query: str, params: Optional[Union[Tuple, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
         """
         Fetch a single row as dictionary.
@@ -283,7 +397,7 @@ class DatabaseManager:
             QueryError: If the query fails to execute.
         """
         try:
-            with self.get_connection() as conn:
+            with self._reading() as conn:
                 with conn.cursor(cursor_factory=extras.RealDictCursor) as cur:
                     cur.execute(query, params)
                     row = cur.fetchone()
@@ -308,7 +422,7 @@ class DatabaseManager:
             QueryError: If the query fails to execute.
         """
         try:
-            with self.get_connection() as conn:
+            with self._reading() as conn:
                 with conn.cursor(cursor_factory=extras.RealDictCursor) as cur:
                     cur.execute(query, params)
                     return [dict(row) for row in cur.fetchall()]
@@ -341,7 +455,7 @@ class DatabaseManager:
             raise ValueError("batch_size must be at least 1")
             
         try:
-            with self.get_connection() as conn:
+            with self._reading() as conn:
                 with conn.cursor(
                     cursor_factory=extras.RealDictCursor, 
                     name='batch_cursor'
@@ -759,6 +873,49 @@ class VerseRepository:
             return {row['status']: row['count'] for row in rows}
         except QueryError:
             return {}
+    
+    def get_all_counts(self, tables: Iterable[str]) -> Dict[str, Dict[Any, int]]:
+        """
+        Get row counts for several tables plus verse counts by status.
+        
+        Uses two round trips (one existence check, one UNION ALL) instead of
+        two queries per table.
+        
+        Args:
+            tables: Table names to count. Missing tables count as 0.
+            
+        Returns:
+            {'tables': {table: count}, 'status': {status: count}}
+        """
+        tables = tuple(tables)
+        counts: Dict[str, Dict[Any, int]] = {'tables': dict.fromkeys(tables, 0), 'status': {}}
+        try:
+            rows = self.db.fetch_all(_EXISTING_TABLES_SQL, (list(tables),))
+            existing = {row['table_name'] for row in rows}
+            present = tuple(t for t in tables if t in existing and _IDENTIFIER_RE.match(t))
+            if present:
+                for row in self.db.fetch_all(_all_counts_sql(present)):
+                    counts[row['kind']][row['name']] = row['count']
+        except QueryError as e:
+            logger.warning(f"Failed to count tables: {e}")
+        return counts
+
+
+_IDENTIFIER_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+
+_EXISTING_TABLES_SQL = """
+    SELECT table_name FROM information_schema.tables
+    WHERE table_schema = 'public' AND table_name = ANY(%s)
+"""
+
+
+@lru_cache(maxsize=32)
+def _all_counts_sql(tables: Tuple[str, ...]) -> str:
+    """UNION ALL of per-table counts (and verse status counts), built once per table set."""
+    parts = [f"SELECT 'tables' AS kind, '{t}' AS name, COUNT(*) AS count FROM {t}" for t in tables]
+    if 'verses' in tables:
+        parts.append("SELECT 'status', status::text, COUNT(*) FROM verses GROUP BY status")
+    return "\nUNION ALL\n".join(parts)
 
 
 # ============================================================================
@@ -934,19 +1091,43 @@ def get_db() -> DatabaseManager:
     return _db_manager
 
 
-def init_db() -> bool:
+def init_db(max_connections: Optional[int] = None) -> bool:
     """
     Initialize the global database manager.
     
+    Args:
+        max_connections: Minimum pool ceiling; see DatabaseManager.initialize().
+    
     Returns:
         True if initialization succeeded, False otherwise.
     """
-    return get_db().initialize()
+    return get_db().initialize(max_connections)
 
 
 def close_db() -> None:
-    """Close the global database manager."""
+    """
+    Close the global database manager.
+    
+    The next get_db() call creates a fresh manager, so anything cached with
+    a reference to the old one (e.g. main._orchestrator) must be cleared too.
+    """
     global _db_manager
     if _db_manager is not None:
         _db_manager.close()
         _db_manager = None
+
+
+def _forget_db_after_fork() -> None:
+    """
+    Drop the inherited manager in a forked child.
+    
+    The pool's sockets belong to the parent; closing them here would break
+    the parent's connections, so the child just starts a fresh manager on
+    its next get_db().
+    """
+    global _db_manager
+    _db_manager = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_db_after_fork)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+ΒΊΒΛΟΣ ΛΌΓΟΥ Flat Combiner
+Collects writes from many worker threads and commits them together.
+"""
+
+import sys
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.database import DatabaseManager, DatabaseError, QueryError
+
+logger = logging.getLogger(__name__)
+
+
+class Combiner:
+    """
+    Flat-combining write buffer for one parameterized statement.
+
+    Each worker thread appends parameter sets to its own deque, so
+    submit() never contends with other workers. A single background
+    thread drains every deque every ``flush_ms`` milliseconds and runs
+    the collected rows as one batched transaction of at most
+    ``max_batch`` rows.
+
+    Example:
+        with Combiner(db, "UPDATE verses SET status = %s WHERE id = %s") as combiner:
+            combiner.submit(('refined', verse_id))
+    """
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        query: str,
+        flush_ms: int = 20,
+        max_batch: int = 500,
+        on_error: Optional[Callable[[Sequence[Any], Exception], None]] = None
+    ) -> None:
+        """
+        Args:
+            db: Database manager used for the writes.
+            query: Statement run once per submitted parameter set.
+            flush_ms: Background flush interval in milliseconds.
+            max_batch: Maximum rows per transaction.
+            on_error: Called with the parameters and error of any row that
+                still fails when retried on its own.
+        """
+        self.db = db
+        self.query = query
+        self.flush_interval = flush_ms / 1000.0
+        self.max_batch = max_batch
+        self.on_error = on_error
+        self._local = threading.local()
+        # (owner thread, its deque); pruned once the owner has exited
+        self._buffers: List[Tuple[threading.Thread, Deque[Sequence[Any]]]] = []
+        self._buffers_lock = threading.Lock()
+        # Serializes flushes from the background thread and callers
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {'committed': 0, 'failed': 0}
+
+    def start(self) -> "Combiner":
+        """Start the background flush thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="combiner", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the background thread and write anything still buffered."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def submit(self, params: Sequence[Any]) -> None:
+        """Queue one parameter set from the calling thread."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = deque()
+            with self._buffers_lock:
+                self._buffers.append((threading.current_thread(), buffer))
+        buffer.append(params)
+
+    def _drain(self) -> List[Sequence[Any]]:
+        """
+        Take everything currently queued, oldest first per worker, and
+        forget the deques of worker threads that have exited.
+        """
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        rows: List[Sequence[Any]] = []
+        finished = set()
+        for owner, buffer in buffers:
+            # Checked before draining: a dead owner cannot append afterwards
+            alive = owner.is_alive()
+            # Workers only append; popleft from this thread is safe
+            while buffer:
+                rows.append(buffer.popleft())
+            if not alive:
+                finished.add(id(buffer))
+        if finished:
+            with self._buffers_lock:
+                self._buffers = [entry for entry in self._buffers
+                                 if id(entry[1]) not in finished]
+        return rows
+
+    def flush(self) -> int:
+        """
+        Write all queued rows now.
+
+        Rows are sent ``max_batch`` per transaction. If a transaction
+        fails, its rows are retried one at a time so that one bad row does
+        not discard the rest.
+
+        Returns:
+            Number of rows written.
+        """
+        with self._flush_lock:
+            rows = self._drain()
+            written = 0
+            for start in range(0, len(rows), self.max_batch):
+                written += self._write(rows[start:start + self.max_batch])
+            return written
+
+    def _write(self, rows: List[Sequence[Any]]) -> int:
+        """Write one batch, falling back to row-by-row on failure."""
+        try:
+            self.db.execute_batch(self.query, rows, page_size=self.max_batch)
+            self.stats['committed'] += len(rows)
+            return len(rows)
+        except (DatabaseError, QueryError) as e:
+            logger.warning(f"Combined write failed, retrying row by row: {e}")
+
+        written = 0
+        for params in rows:
+            try:
+                self.db.execute(self.query, params)
+                written += 1
+            except (DatabaseError, QueryError) as e:
+                logger.error(f"Combined write failed for row: {e}")
+                self.stats['failed'] += 1
+                if self.on_error is not None:
+                    self.on_error(params, e)
+        self.stats['committed'] += written
+        return written
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Combiner flush error: {e}")
+
+    def __enter__(self) -> "Combiner":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -15,15 +15,21 @@ import re
 import json
 import hashlib
 import logging
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import config, CANONICAL_ORDER, PRIMARY_MOTIFS, DATA_DIR
-from scripts.database import get_db, DatabaseManager, DatabaseError, QueryError
+from scripts.database import get_db, DatabaseManager, DatabaseError, QueryError, VerseRepository
+from scripts.batch_inserter import BatchInserter
+
+# Tables reported by get_ingestion_status() and `main.py status`
+STATUS_TABLES: Tuple[str, ...] = ('canonical_books', 'verses', 'events', 'motifs',
+                                  'patristic_sources', 'cross_references')
 
 logger = logging.getLogger(__name__)
 
@@ -252,11 +258,31 @@ class VerseIngester(BaseIngester):
     duplicate detection via checksums.
     """
     
+    # Rows parsed and upserted per batch during ingest (BIBLOS_BATCH_SIZE)
+    BATCH_SIZE: int = config.database.batch_size
+    
+    _UPSERT_VERSE_SQL = """
+        INSERT INTO verses (book_id, chapter, verse_number, verse_reference, text_kjv, status)
+        VALUES (%(book_id)s, %(chapter)s, %(verse_number)s, %(verse_reference)s, %(text_kjv)s, 'raw')
+        ON CONFLICT (book_id, chapter, verse_number) 
+        DO UPDATE SET 
+            text_kjv = COALESCE(EXCLUDED.text_kjv, verses.text_kjv),
+            updated_at = CURRENT_TIMESTAMP
+    """
+    _VERSE_COLUMNS = ('book_id', 'chapter', 'verse_number', 'verse_reference', 'text_kjv')
+    
     def __init__(self, db: Optional[DatabaseManager] = None) -> None:
         """Initialize the verse ingester."""
         super().__init__(db)
         self._book_id_cache: Dict[str, int] = {}
         self._load_book_ids()
+        # Multi-row form of _UPSERT_VERSE_SQL (status takes its 'raw' default),
+        # keyed by full_rebuild: a freshly created table needs no conflict clause
+        upsert_clause = self._UPSERT_VERSE_SQL[self._UPSERT_VERSE_SQL.index('ON CONFLICT'):].strip()
+        self._verse_inserters: Dict[bool, BatchInserter] = {
+            False: BatchInserter(self.db, 'verses', self._VERSE_COLUMNS, suffix=upsert_clause),
+            True: BatchInserter(self.db, 'verses', self._VERSE_COLUMNS),
+        }
     
     def _load_book_ids(self) -> None:
         """Cache book IDs for fast lookup."""
@@ -283,23 +309,17 @@ class VerseIngester(BaseIngester):
         normalized = normalize_book_name(book_name)
         return self._book_id_cache.get(normalized.lower())
     
-    def ingest_from_text(self, content: str, format_type: str = 'standard') -> int:
+    def _parse_lines(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
         """
-        Ingest verses from text content.
+        Parse verse rows from text lines.
         
         Args:
-            content: Text content containing verses.
-            format_type: Format type (currently unused).
+            lines: Lines of the form "<reference><separator><text>".
             
-        Returns:
-            Number of verses ingested.
+        Yields:
+            Verse dictionaries ready for _bulk_upsert_verses.
         """
-        if not content:
-            return 0
-            
-        verses_data: List[Dict[str, Any]] = []
-        
-        for line in content.split('\n'):
+        for line in lines:
             line = line.strip()
             if not line or line.startswith('#'):
                 continue
@@ -317,32 +337,68 @@ class VerseIngester(BaseIngester):
                         book_id = self._get_book_id(book)
                         
                         if book_id:
-                            verses_data.append({
+                            self.stats.processed += 1
+                            yield {
                                 'book_id': book_id,
                                 'chapter': chapter,
                                 'verse_number': verse,
                                 'verse_reference': f"{book} {chapter}:{verse}",
                                 'text_kjv': text if text and '[Text not found]' not in text else None
-                            })
-                            self.stats.processed += 1
+                            }
                     break
+    
+    def _ingest_lines(self, lines: Iterable[str], full_rebuild: bool = False) -> int:
+        """
+        Parse and upsert verses BATCH_SIZE rows at a time.
         
-        # Bulk insert/update
-        if verses_data:
+        Args:
+            lines: Text lines; may be a file object, which is read lazily.
+            full_rebuild: Passed through to _bulk_upsert_verses.
+            
+        Returns:
+            Number of verses ingested.
+        """
+        rows = self._parse_lines(lines)
+        total = 0
+        while True:
+            batch = list(islice(rows, self.BATCH_SIZE))
+            if not batch:
+                return total
+            total += len(batch)
+            logger.debug(f"Flushing {len(batch)} verses ({total} so far)")
             try:
-                self._bulk_upsert_verses(verses_data)
+                self._bulk_upsert_verses(batch, full_rebuild)
             except DatabaseError as e:
                 logger.error(f"Failed to upsert verses: {e}")
-                self.stats.errors += len(verses_data)
+                self.stats.errors += len(batch)
+    
+    def ingest_from_text(self, content: str, format_type: str = 'standard') -> int:
+        """
+        Ingest verses from text content.
         
-        return len(verses_data)
+        Args:
+            content: Text content containing verses.
+            format_type: Format type (currently unused).
+            
+        Returns:
+            Number of verses ingested.
+        """
+        if not content:
+            return 0
+        return self._ingest_lines(content.split('\n'))
     
-    def ingest_from_file(self, file_path: Path) -> int:
+    def ingest_from_file(self, file_path: Path, full_rebuild: bool = False) -> int:
         """
         Ingest verses from a file.
         
+        The file is streamed line by line, so memory use is bounded by
+        BATCH_SIZE rather than the file size.
+        
         Args:
             file_path: Path to the file.
+            full_rebuild: The verses table is known to be empty (e.g. the
+                schema was just created), so rows are inserted without the
+                ON CONFLICT index probe. The caller must guarantee this.
             
         Returns:
             Number of verses ingested.
@@ -357,36 +413,39 @@ class VerseIngester(BaseIngester):
         
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+                count = self._ingest_lines(f, full_rebuild)
         except IOError as e:
             raise IngestionError(f"Failed to read file {file_path}: {e}") from e
         
-        count = self.ingest_from_text(content)
         self.log_stats("Verse")
         return count
     
-    def _bulk_upsert_verses(self, verses_data: List[Dict[str, Any]]) -> None:
+    def _bulk_upsert_verses(self, verses_data: List[Dict[str, Any]], full_rebuild: bool = False) -> None:
         """
         Bulk insert/update verses.
         
+        The whole batch is sent as multi-row INSERT statements. If that
+        fails (e.g. the same verse appears twice in the batch), the rows
+        are retried one at a time as upserts so that a single bad row does
+        not discard the rest.
+        
         Args:
             verses_data: List of verse dictionaries.
+            full_rebuild: Use plain INSERT; the table must be empty.
         """
-        query = """
-            INSERT INTO verses (book_id, chapter, verse_number, verse_reference, text_kjv, status)
-            VALUES (%(book_id)s, %(chapter)s, %(verse_number)s, %(verse_reference)s, %(text_kjv)s, 'raw')
-            ON CONFLICT (book_id, chapter, verse_number) 
-            DO UPDATE SET 
-                text_kjv = COALESCE(EXCLUDED.text_kjv, verses.text_kjv),
-                updated_at = CURRENT_TIMESTAMP
-        """
+        inserter = self._verse_inserters[full_rebuild]
+        try:
+            with self.db.transaction():
+                inserter.insert_many(verses_data)
+                inserter.flush()
+            self.stats.inserted += len(verses_data)
+            return
+        except (DatabaseError, QueryError) as e:
+            logger.warning(f"Batch upsert failed, retrying row by row: {e}")
         
         for verse in verses_data:
             try:
-                self.db.execute(query, (
-                    verse['book_id'], verse['chapter'], verse['verse_number'],
-                    verse['verse_reference'], verse['text_kjv']
-                ))
+                self.db.execute(self._UPSERT_VERSE_SQL, verse)
                 self.stats.inserted += 1
             except (DatabaseError, QueryError) as e:
                 logger.error(f"Error inserting verse {verse['verse_reference']}: {e}")
@@ -666,6 +725,7 @@ class IngestionOrchestrator:
         self.patristic_ingester = PatristicIngester(self.db)
         self.motif_initializer = MotifInitializer(self.db)
         self.xref_ingester = CrossReferenceIngester(self.db)
+        self.verse_repo = VerseRepository(self.db)
     
     def run_schema(self, schema_path: Path) -> bool:
         """Execute the database schema"""
@@ -682,25 +742,18 @@ class IngestionOrchestrator:
         
         return stats
     
-    def ingest_verses_from_file(self, file_path: Path) -> int:
-        """Ingest verses from a file"""
-        return self.verse_ingester.ingest_from_file(file_path)
+    def ingest_verses_from_file(self, file_path: Path, full_rebuild: bool = False) -> int:
+        """
+        Ingest verses from a file.
+        
+        full_rebuild skips conflict handling; callers must guarantee the
+        verses table is empty.
+        """
+        return self.verse_ingester.ingest_from_file(file_path, full_rebuild)
     
     def get_ingestion_status(self) -> Dict[str, Any]:
         """Get current ingestion status"""
-        status = {}
-        
-        # Check table counts
-        tables = ['canonical_books', 'verses', 'events', 'motifs', 
-                  'patristic_sources', 'cross_references']
-        
-        for table in tables:
-            if self.db.table_exists(table):
-                status[table] = self.db.get_table_count(table)
-            else:
-                status[table] = 0
-        
-        return status
+        return self.verse_repo.get_all_counts(STATUS_TABLES)['tables']
 
 
 # ============================================================================
@@ -4,14 +4,18 @@
 Advanced batch processing with parallelization, resumption, and monitoring
 """
 
+import os
 import sys
 import time
 import json
+import zlib
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import threading
+import multiprocessing
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
@@ -21,7 +25,7 @@ import signal
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import config, LOGS_DIR
-from scripts.database import get_db, DatabaseManager
+from scripts.database import get_db, init_db, close_db, DatabaseManager
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +43,14 @@ class BatchStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# BatchConfig is read-only once built; on 3.10+ it also drops the
+# per-instance __dict__ (slots=True is unavailable on 3.9).
+_CONFIG_OPTIONS: Dict[str, bool] = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _CONFIG_OPTIONS['slots'] = True
+
+
+@dataclass(**_CONFIG_OPTIONS)
 class BatchConfig:
     """Configuration for batch processing"""
     batch_size: int = 100
@@ -110,12 +121,42 @@ class BatchProgress:
 # ============================================================================
 
 class CheckpointManager:
-    """Manage batch processing checkpoints for resumption"""
+    """
+    Manage batch processing checkpoints for resumption.
+    
+    Checkpoints are compact JSON followed by a CRC32 of the JSON bytes and
+    are written atomically, so a checkpoint torn by a crash is detected and
+    discarded on load instead of resuming from garbage. Checkpoints written
+    by older versions (plain ``.checkpoint.json``) are still read.
+    """
+    
+    SUFFIX = ".checkpoint"
+    LEGACY_SUFFIX = ".checkpoint.json"
     
     def __init__(self, checkpoint_dir: Path = None):
         self.checkpoint_dir = checkpoint_dir or (LOGS_DIR / "checkpoints")
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
     
+    def _paths(self, batch_id: str) -> List[Path]:
+        """Current and legacy checkpoint paths, in lookup order."""
+        return [self.checkpoint_dir / f"{batch_id}{self.SUFFIX}",
+                self.checkpoint_dir / f"{batch_id}{self.LEGACY_SUFFIX}"]
+    
+    def _read(self, path: Path) -> Optional[Dict]:
+        """Read and verify one checkpoint file; None if it is corrupt."""
+        try:
+            blob = path.read_bytes()
+            if path.name.endswith(self.LEGACY_SUFFIX):
+                return json.loads(blob)
+            payload, crc = blob[:-4], blob[-4:]
+            if len(blob) >= 4 and zlib.crc32(payload).to_bytes(4, 'big') == crc:
+                return json.loads(payload)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot read checkpoint {path}: {e}")
+            return None
+        logger.warning(f"Discarding corrupt checkpoint: {path}")
+        return None
+    
     def save_checkpoint(self, batch_id: str, progress: BatchProgress, 
                        processed_ids: List[int]):
         """Save checkpoint for later resumption"""
@@ -127,40 +168,46 @@ class CheckpointManager:
             'last_successful_id': processed_ids[-1] if processed_ids else None
         }
         
-        checkpoint_file = self.checkpoint_dir / f"{batch_id}.checkpoint.json"
-        with open(checkpoint_file, 'w') as f:
-            json.dump(checkpoint, f, indent=2)
+        payload = json.dumps(checkpoint, separators=(',', ':')).encode()
+        checkpoint_file, legacy_file = self._paths(batch_id)
+        tmp_file = checkpoint_file.with_name(checkpoint_file.name + ".tmp")
+        tmp_file.write_bytes(payload + zlib.crc32(payload).to_bytes(4, 'big'))
+        os.replace(tmp_file, checkpoint_file)
+        # The new checkpoint supersedes any one left by an older version
+        if legacy_file.exists():
+            legacy_file.unlink()
         
         logger.debug(f"Checkpoint saved: {checkpoint_file}")
     
     def load_checkpoint(self, batch_id: str) -> Optional[Dict]:
-        """Load checkpoint if exists"""
-        checkpoint_file = self.checkpoint_dir / f"{batch_id}.checkpoint.json"
-        
-        if checkpoint_file.exists():
-            with open(checkpoint_file, 'r') as f:
-                return json.load(f)
+        """Load checkpoint if it exists and is intact"""
+        for checkpoint_file in self._paths(batch_id):
+            if checkpoint_file.exists():
+                return self._read(checkpoint_file)
         return None
     
     def clear_checkpoint(self, batch_id: str):
         """Clear checkpoint after successful completion"""
-        checkpoint_file = self.checkpoint_dir / f"{batch_id}.checkpoint.json"
-        if checkpoint_file.exists():
-            checkpoint_file.unlink()
-            logger.debug(f"Checkpoint cleared: {checkpoint_file}")
+        for checkpoint_file in self._paths(batch_id):
+            if checkpoint_file.exists():
+                checkpoint_file.unlink()
+                logger.debug(f"Checkpoint cleared: {checkpoint_file}")
     
     def list_checkpoints(self) -> List[Dict]:
-        """List all available checkpoints"""
+        """List all available (intact) checkpoints"""
         checkpoints = []
-        for f in self.checkpoint_dir.glob("*.checkpoint.json"):
-            with open(f, 'r') as file:
-                data = json.load(file)
-                checkpoints.append({
-                    'batch_id': data['batch_id'],
-                    'timestamp': data['timestamp'],
-                    'processed': data['progress']['processed'],
-                    'total': data['progress']['total_items']
-                })
+        files = (list(self.checkpoint_dir.glob(f"*{self.SUFFIX}")) +
+                 list(self.checkpoint_dir.glob(f"*{self.LEGACY_SUFFIX}")))
+        for f in files:
+            data = self._read(f)
+            if data is None:
+                continue
+            checkpoints.append({
+                'batch_id': data['batch_id'],
+                'timestamp': data['timestamp'],
+                'processed': data['progress']['processed'],
+                'total': data['progress']['total_items']
+            })
         return checkpoints
 
 
@@ -495,6 +542,85 @@ class OrchestrationScheduler:
         
         results['finished_at'] = datetime.now().isoformat()
         return results
+    
+    def execute_plan_parallel(self, plan: List[Dict], batch_config: BatchConfig = None,
+                              processes: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Execute a processing plan across worker processes.
+        
+        Plan items are dealt round-robin into one shard per process, and
+        each shard runs execute_plan() in a spawned process with its own
+        connection pool, so verse processing is not serialized by the GIL.
+        """
+        config = batch_config or BatchConfig()
+        processes = max(1, min(processes or config.max_workers, len(plan)))
+        if processes == 1:
+            return self.execute_plan(plan, config)
+        
+        results = {
+            'started_at': datetime.now().isoformat(),
+            'plan_items': len(plan),
+            'completed': 0,
+            'failed': 0,
+            'details': []
+        }
+        shards = [plan[i::processes] for i in range(processes)]
+        # Split the thread budget between processes so --workers N keeps
+        # about N verses in flight in total, not N per process
+        shard_config = replace(config, max_workers=max(1, config.max_workers // processes))
+        
+        # spawn, not fork: children must never inherit the parent's open
+        # pool connections
+        context = multiprocessing.get_context('spawn')
+        # Children send their log records back here, to this process's handlers
+        log_queue = context.Queue()
+        root = logging.getLogger()
+        listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+        listener.start()
+        try:
+            with ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                                     initializer=_init_shard_logging,
+                                     initargs=(log_queue, root.getEffectiveLevel())) as executor:
+                futures = {executor.submit(_execute_plan_shard, shard, shard_config): shard
+                           for shard in shards}
+                for future in as_completed(futures):
+                    try:
+                        shard_results = future.result()
+                    except Exception as e:
+                        shard = futures[future]
+                        logger.error(f"Plan shard failed: {e}")
+                        results['failed'] += len(shard)
+                        results['details'].extend(
+                            {'item': item['name'], 'status': 'error', 'error': str(e)}
+                            for item in shard
+                        )
+                        continue
+                    results['completed'] += shard_results['completed']
+                    results['failed'] += shard_results['failed']
+                    results['details'].extend(shard_results['details'])
+        finally:
+            listener.stop()
+        
+        results['finished_at'] = datetime.now().isoformat()
+        return results
+
+
+def _init_shard_logging(log_queue, level: int) -> None:
+    """Worker-process initializer: route all logging to the parent's queue."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _execute_plan_shard(shard: List[Dict], batch_config: BatchConfig) -> Dict[str, Any]:
+    """Worker-process entry point for execute_plan_parallel()."""
+    # One connection per batch thread plus the coordinator, as in main.py
+    if not init_db(max_connections=batch_config.max_workers + 1):
+        raise ConnectionError("Failed to initialize database connection in worker process")
+    try:
+        return OrchestrationScheduler(get_db()).execute_plan(shard, batch_config)
+    finally:
+        close_db()
 
 
 # ============================================================================
@@ -14,6 +14,13 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import config, OUTPUT_DIR
@@ -22,6 +29,26 @@ from scripts.database import get_db, DatabaseManager
 logger = logging.getLogger(__name__)
 
 
+def json_bytes(obj: Any) -> bytes:
+    """
+    Serialize ``obj`` as indented UTF-8 JSON.
+    
+    Uses orjson when installed; values JSON cannot represent natively
+    (Decimal, date, ...) are written as strings either way. orjson's own
+    datetime and dataclass encodings are turned off so both paths produce
+    the same output.
+    """
+    if ORJSON_AVAILABLE:
+        options = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                   orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        return orjson.dumps(obj, default=str, option=options)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+# Ten-cell progress bars for 0%, 10%, ... 100%, built once
+_BARS = tuple('█' * i + '░' * (10 - i) for i in range(11))
+
+
 # ============================================================================
 # OUTPUT CONFIGURATION
 # ============================================================================
@@ -410,7 +437,7 @@ measured by proximity to the narrative surface."*
         
         completion_pct = stats['completion_percentage']
         
-        output = f"""# ΒΊΒΛΟΣ ΛΌΓΟΥ: Progress Dashboard
+        parts = [f"""# ΒΊΒΛΟΣ ΛΌΓΟΥ: Progress Dashboard
 
 ## Overall Status
 
@@ -422,18 +449,18 @@ measured by proximity to the narrative surface."*
 
 | Status | Count | Percentage |
 |--------|-------|------------|
-"""
+"""]
         
         for status, count in stats['status_breakdown'].items():
             pct = (count / stats['total_verses'] * 100) if stats['total_verses'] > 0 else 0
-            output += f"| {status} | {count:,} | {pct:.1f}% |\n"
+            parts.append(f"| {status} | {count:,} | {pct:.1f}% |\n")
         
-        output += f"| **Total** | **{stats['total_verses']:,}** | **100%** |\n"
+        parts.append(f"| **Total** | **{stats['total_verses']:,}** | **100%** |\n")
         
         # Progress bar
         bar_filled = int(completion_pct / 2)
         bar_empty = 50 - bar_filled
-        output += f"""
+        parts.append(f"""
 ### Completion Progress
 
 ```
@@ -446,16 +473,16 @@ measured by proximity to the narrative surface."*
 
 | Book | Total | Refined | Progress |
 |------|-------|---------|----------|
-"""
+""")
         
         for book in book_stats:
             total = book['total'] or 0
             refined = book['refined'] or 0
             pct = (refined / total * 100) if total > 0 else 0
-            bar = '█' * int(pct / 10) + '░' * (10 - int(pct / 10))
-            output += f"| {book['name']} | {total} | {refined} | {bar} {pct:.0f}% |\n"
+            bar = _BARS[min(10, int(pct / 10))]
+            parts.append(f"| {book['name']} | {total} | {refined} | {bar} {pct:.0f}% |\n")
         
-        output += """
+        parts.append("""
 
 ---
 
@@ -467,12 +494,12 @@ measured by proximity to the narrative surface."*
 4. Verify thread density at each 50-page interval
 5. Export completed books for review
 
-"""
+""")
         
         output_file = self.config.output_dir / "Progress_Dashboard.md"
         
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(output)
+            f.write(''.join(parts))
         
         logger.info(f"Exported progress dashboard to {output_file}")
         return output_file
@@ -525,8 +552,7 @@ class JSONGenerator(BaseOutputGenerator):
         safe_name = book_name.replace(' ', '_').replace(':', '')
         output_file = self.config.output_dir / f"{safe_name}_Commentary.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(json_bytes(output))
         
         logger.info(f"Exported {book_name} to {output_file}")
         return output_file
@@ -542,8 +568,7 @@ class JSONGenerator(BaseOutputGenerator):
         
         output_file = self.config.output_dir / "full_database_export.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False, default=str)
+        output_file.write_bytes(json_bytes(output))
         
         logger.info(f"Exported full database to {output_file}")
         return output_file
@@ -22,7 +22,10 @@ THE NARRATIVE ENDS AT THE CROSS.
 
 import sys
 import logging
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
@@ -33,6 +36,7 @@ from scripts.database import (
     get_db, DatabaseManager, VerseRepository, MotifRepository,
     DatabaseError, QueryError
 )
+from scripts.flat_combiner import Combiner
 
 # Import pre-computed data - O(1) lookups replace runtime calculations
 from data.precomputed import (
@@ -789,6 +793,15 @@ class VerseProcessor:
             'success': 0,
             'failed': 0
         }
+        self._stats_lock = threading.Lock()
+        # Set while run_continuous() is active; see _update_verse()
+        self._combiner: Optional[Combiner] = None
+    
+    def _record(self, success: bool) -> None:
+        """Count one processed verse; process_batch() calls this from worker threads."""
+        with self._stats_lock:
+            self.stats['processed'] += 1
+            self.stats['success' if success else 'failed'] += 1
     
     def process_verse(self, verse_id: int) -> bool:
         """Process a single verse through the complete pipeline"""
@@ -825,15 +838,13 @@ class VerseProcessor:
             # Update verse in database
             self._update_verse(verse_id, senses, matrix, tonal, refined)
             
-            self.stats['processed'] += 1
-            self.stats['success'] += 1
+            self._record(True)
             return True
             
         except Exception as e:
             logger.error(f"Error processing verse {verse_id}: {e}")
             self.verse_repo.update_verse_status(verse_id, 'failed', str(e))
-            self.stats['processed'] += 1
-            self.stats['failed'] += 1
+            self._record(False)
             return False
     
     def _generate_refined_explication(self, verse: Dict, senses: Dict, 
@@ -852,35 +863,40 @@ Looking toward the eschaton, we see how {senses['anagogical'].lower() if senses[
 Sensory {matrix['sensory_intensity']:.2f}, Register: {matrix['register_baseline']}]
         """.strip()
     
+    _UPDATE_VERSE_SQL = """
+        UPDATE verses SET
+            sense_literal = %s,
+            sense_allegorical = %s,
+            sense_tropological = %s,
+            sense_anagogical = %s,
+            emotional_valence = %s,
+            theological_weight = %s,
+            narrative_function = %s,
+            sensory_intensity = %s,
+            grammatical_complexity = %s,
+            lexical_rarity = %s,
+            breath_rhythm = %s,
+            register_baseline = %s,
+            tonal_weight = %s,
+            dread_amplification = %s,
+            local_emotional_honesty = %s,
+            temporal_dislocation_offset = %s,
+            refined_explication = %s,
+            status = 'refined',
+            last_processed_at = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = %s
+    """
+    
     def _update_verse(self, verse_id: int, senses: Dict, matrix: Dict, 
                       tonal: Dict, refined: str):
-        """Update verse with all calculated values"""
-        query = """
-            UPDATE verses SET
-                sense_literal = %s,
-                sense_allegorical = %s,
-                sense_tropological = %s,
-                sense_anagogical = %s,
-                emotional_valence = %s,
-                theological_weight = %s,
-                narrative_function = %s,
-                sensory_intensity = %s,
-                grammatical_complexity = %s,
-                lexical_rarity = %s,
-                breath_rhythm = %s,
-                register_baseline = %s,
-                tonal_weight = %s,
-                dread_amplification = %s,
-                local_emotional_honesty = %s,
-                temporal_dislocation_offset = %s,
-                refined_explication = %s,
-                status = 'refined',
-                last_processed_at = CURRENT_TIMESTAMP,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = %s
-        """
-        
-        self.db.execute(query, (
+        """
+        Update verse with all calculated values.
+        
+        During run_continuous() the update is handed to the combiner and
+        committed with others; otherwise it is written immediately.
+        """
+        params = (
             senses['literal'],
             senses['allegorical'],
             senses['tropological'],
@@ -899,37 +915,79 @@ Sensory {matrix['sensory_intensity']:.2f}, Register: {matrix['register_baseline'
             tonal['temporal_dislocation_offset'],
             refined,
             verse_id
-        ))
+        )
+        
+        if self._combiner is not None:
+            self._combiner.submit(params)
+        else:
+            self.db.execute(self._UPDATE_VERSE_SQL, params)
+    
+    def _deferred_update_failed(self, params: Tuple, error: Exception) -> None:
+        """Mark a verse failed when its combined update could not be written."""
+        verse_id = params[-1]
+        self.verse_repo.update_verse_status(verse_id, 'failed', str(error))
+        with self._stats_lock:
+            self.stats['success'] -= 1
+            self.stats['failed'] += 1
     
-    def process_batch(self, batch_size: int = None) -> Dict[str, int]:
-        """Process a batch of verses"""
+    def process_batch(self, batch_size: int = None, max_workers: int = None) -> Dict[str, int]:
+        """
+        Process a batch of verses.
+        
+        Up to ``max_workers`` verses are in flight at once, and the next
+        verse starts as soon as any one finishes, so a slow verse does not
+        hold the rest of the batch back.
+        """
         batch_size = batch_size or config.processing.batch_size
+        max_workers = max_workers or config.processing.max_workers
         
-        verses = self.verse_repo.get_unprocessed_verses(batch_size)
+        verses = iter(self.verse_repo.get_unprocessed_verses(batch_size))
         
-        for verse in verses:
-            self.process_verse(verse['id'])
-            time.sleep(0.01)  # Small delay to prevent overwhelming
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = {executor.submit(self.process_verse, verse['id'])
+                         for verse in islice(verses, max_workers)}
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Verse worker error: {e}")
+                    verse = next(verses, None)
+                    if verse is not None:
+                        in_flight.add(executor.submit(self.process_verse, verse['id']))
         
         logger.info(f"Batch complete: {self.stats['success']} success, {self.stats['failed']} failed")
         return self.stats.copy()
     
     def run_continuous(self, cooldown: int = 2):
-        """Run continuous processing"""
+        """
+        Run continuous processing.
+        
+        Verse updates go through a Combiner, which commits them in shared
+        transactions; it is flushed after every batch (and on interrupt)
+        so the next batch never re-selects a verse with a pending write.
+        """
         logger.info("Starting continuous verse processing...")
         
-        while True:
-            # Check remaining
-            stats = self.verse_repo.get_completion_stats()
-            unprocessed = stats.get('raw', 0) + stats.get('parsed', 0)
-            
-            if unprocessed == 0:
-                logger.info("All verses processed!")
-                break
-            
-            logger.info(f"Remaining unprocessed verses: {unprocessed}")
-            self.process_batch()
-            time.sleep(cooldown)
+        with Combiner(self.db, self._UPDATE_VERSE_SQL, on_error=self._deferred_update_failed) as combiner:
+            self._combiner = combiner
+            try:
+                while True:
+                    # Check remaining
+                    stats = self.verse_repo.get_completion_stats()
+                    unprocessed = stats.get('raw', 0) + stats.get('parsed', 0)
+                    
+                    if unprocessed == 0:
+                        logger.info("All verses processed!")
+                        break
+                    
+                    logger.info(f"Remaining unprocessed verses: {unprocessed}")
+                    self.process_batch()
+                    combiner.flush()
+                    time.sleep(cooldown)
+            finally:
+                self._combiner = None
         
         return self.stats
 
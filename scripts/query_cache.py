@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+ΒΊΒΛΟΣ ΛΌΓΟΥ Query Cache
+Short-lived memoization for expensive aggregate queries, in process
+(ttl_cache) and across invocations (read_json_cache / write_json_cache).
+"""
+
+import copy
+import json
+import os
+import time
+import threading
+import weakref
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def ttl_cache(seconds: float = 30.0, maxsize: int = 32) -> Callable[[F], F]:
+    """
+    Cache a method's results for ``seconds``.
+
+    Entries are stored per instance in a weak mapping, so the cache never
+    keeps an instance alive, and keyed on the remaining call arguments.
+    Each instance holds at most ``maxsize`` entries; expired entries are
+    evicted on every store. Calls with unhashable arguments are not
+    cached. Callers get a deep copy, so mutating a result cannot change
+    what later callers see. The wrapper exposes ``cache_clear()``.
+
+    Example:
+        @ttl_cache(seconds=30)
+        def generate_full_report(self) -> Dict[str, Any]:
+            ...
+    """
+    def decorator(fn: F) -> F:
+        caches: 'weakref.WeakKeyDictionary[Any, Dict[Hashable, Tuple[float, Any]]]' = \
+            weakref.WeakKeyDictionary()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return fn(self, *args, **kwargs)
+
+            now = time.monotonic()
+            with lock:
+                entry = caches.get(self, {}).get(key)
+            if entry is not None and now - entry[0] < seconds:
+                return copy.deepcopy(entry[1])
+
+            result = fn(self, *args, **kwargs)
+            with lock:
+                entries = caches.setdefault(self, {})
+                for stale in [k for k, (t, _) in entries.items() if now - t >= seconds]:
+                    del entries[stale]
+                if len(entries) >= maxsize:
+                    # Oldest first: dicts keep insertion order
+                    del entries[next(iter(entries))]
+                entries[key] = (now, copy.deepcopy(result))
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                caches.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def read_json_cache(path: Path, max_age: float) -> Optional[Any]:
+    """
+    Load a value stored by write_json_cache() if it is at most ``max_age``
+    seconds old.
+
+    Returns:
+        The cached value, or None if the file is missing, stale or unreadable.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_cache(path: Path, value: Any) -> None:
+    """Store ``value`` as JSON at ``path``, replacing any previous file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(value))
+    os.replace(tmp_path, path)
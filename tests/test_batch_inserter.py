@@ -0,0 +1,61 @@
+"""Tests for scripts.batch_inserter.BatchInserter."""
+
+from scripts.batch_inserter import BatchInserter
+
+
+class FakeDB:
+    """Records every (sql, args) pair passed to execute()."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql, args):
+        self.statements.append((sql, list(args)))
+        return len(args)
+
+
+def test_rows_per_statement_follows_max_params():
+    inserter = BatchInserter(FakeDB(), 't', ('a', 'b', 'c'), max_params=7)
+    assert inserter.rows_per_statement == 2
+    # A single row wider than max_params still gets a statement of its own
+    assert BatchInserter(FakeDB(), 't', ('a', 'b', 'c'), max_params=2).rows_per_statement == 1
+
+
+def test_inserts_are_chunked_at_max_params():
+    db = FakeDB()
+    with BatchInserter(db, 't', ('a', 'b', 'c'), max_params=7) as inserter:
+        for i in range(5):
+            inserter.insert((i, i, i))
+        # Two full statements went out as soon as they filled
+        assert len(db.statements) == 2
+
+    assert [len(args) for _, args in db.statements] == [6, 6, 3]
+    assert all(len(args) <= 7 for _, args in db.statements)
+    assert db.statements[0][0] == "INSERT INTO t (a, b, c) VALUES (%s, %s, %s), (%s, %s, %s)"
+    assert db.statements[2][0] == "INSERT INTO t (a, b, c) VALUES (%s, %s, %s)"
+    assert [v for _, args in db.statements for v in args[::3]] == list(range(5))
+    assert inserter.inserted == 5
+
+
+def test_suffix_is_appended_to_every_statement():
+    db = FakeDB()
+    suffix = "ON CONFLICT (a) DO UPDATE SET b = EXCLUDED.b"
+    with BatchInserter(db, 't', ('a', 'b'), max_params=4, suffix=suffix) as inserter:
+        inserter.insert_many((i, i) for i in range(3))
+
+    assert len(db.statements) == 2
+    for sql, _ in db.statements:
+        assert sql.endswith(") " + suffix)
+
+
+def test_mapping_rows_are_read_in_column_order():
+    db = FakeDB()
+    with BatchInserter(db, 't', ('a', 'b')) as inserter:
+        inserter.insert({'b': 2, 'a': 1, 'extra': 3})
+    assert db.statements == [("INSERT INTO t (a, b) VALUES (%s, %s)", [1, 2])]
+
+
+def test_flush_with_nothing_queued_executes_nothing():
+    db = FakeDB()
+    assert BatchInserter(db, 't', ('a',)).flush() == 0
+    assert db.statements == []
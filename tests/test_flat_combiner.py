@@ -0,0 +1,110 @@
+"""Tests for scripts.flat_combiner.Combiner."""
+
+import threading
+
+from scripts.database import QueryError
+from scripts.flat_combiner import Combiner
+
+
+class FakeDB:
+    """Records batched and single writes; rows listed in ``bad`` fail."""
+
+    def __init__(self, fail_batches=False, bad=()):
+        self.fail_batches = fail_batches
+        self.bad = set(bad)
+        self.batches = []
+        self.singles = []
+
+    def execute_batch(self, query, rows, page_size=1000):
+        if self.fail_batches:
+            raise QueryError("batch failed")
+        self.batches.append(list(rows))
+        return len(rows)
+
+    def execute(self, query, params):
+        if params in self.bad:
+            raise QueryError(f"bad row {params}")
+        self.singles.append(params)
+        return 1
+
+
+def test_flush_keeps_submission_order_per_worker():
+    db = FakeDB()
+    combiner = Combiner(db, "UPDATE t SET x = %s WHERE id = %s")
+    rows = [(i, i) for i in range(10)]
+    for row in rows:
+        combiner.submit(row)
+
+    assert combiner.flush() == 10
+    assert db.batches == [rows]
+    assert combiner.stats == {'committed': 10, 'failed': 0}
+
+
+def test_flush_splits_into_max_batch_transactions():
+    db = FakeDB()
+    combiner = Combiner(db, "q", max_batch=4)
+    for i in range(10):
+        combiner.submit((i,))
+
+    combiner.flush()
+    assert [len(batch) for batch in db.batches] == [4, 4, 2]
+    assert [row for batch in db.batches for row in batch] == [(i,) for i in range(10)]
+
+
+def test_rows_from_each_thread_stay_in_order():
+    db = FakeDB()
+    combiner = Combiner(db, "q")
+
+    def worker(n):
+        for i in range(50):
+            combiner.submit((n, i))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    combiner.flush()
+    written = [row for batch in db.batches for row in batch]
+    assert len(written) == 200
+    for n in range(4):
+        assert [i for w, i in written if w == n] == list(range(50))
+
+
+def test_failed_batch_falls_back_to_single_rows():
+    db = FakeDB(fail_batches=True, bad=[(2,)])
+    failures = []
+    combiner = Combiner(db, "q", on_error=lambda params, e: failures.append((params, str(e))))
+    for i in range(4):
+        combiner.submit((i,))
+
+    assert combiner.flush() == 3
+    assert db.singles == [(0,), (1,), (3,)]
+    assert failures == [((2,), "bad row (2,)")]
+    assert combiner.stats == {'committed': 3, 'failed': 1}
+
+
+def test_deques_of_exited_threads_are_pruned():
+    db = FakeDB()
+    combiner = Combiner(db, "q")
+
+    for n in range(5):
+        t = threading.Thread(target=combiner.submit, args=((n,),))
+        t.start()
+        t.join()
+    combiner.submit(('main',))
+    assert len(combiner._buffers) == 6
+
+    combiner.flush()
+    # Only the still-running (main) thread keeps its deque
+    assert [owner for owner, _ in combiner._buffers] == [threading.current_thread()]
+    written = {row for batch in db.batches for row in batch}
+    assert written == {(n,) for n in range(5)} | {('main',)}
+
+
+def test_close_writes_rows_still_buffered():
+    db = FakeDB()
+    with Combiner(db, "q", flush_ms=60_000) as combiner:
+        combiner.submit((1,))
+    assert db.batches == [[(1,)]]
@@ -0,0 +1,39 @@
+"""Tests for the phrase indexes behind find_echoes / find_plantings."""
+
+import pytest
+
+from data.narrative_order import NARRATIVE_ORDER, find_echoes, find_plantings
+
+
+def scan(attr, phrase):
+    """The original linear scan both lookups must agree with."""
+    return [e for e in NARRATIVE_ORDER
+            if getattr(e, attr) and phrase.lower() in getattr(e, attr).lower()]
+
+
+def queries(attr):
+    """Every stored phrase, some substrings and case variants, and misses."""
+    phrases = [getattr(e, attr) for e in NARRATIVE_ORDER if getattr(e, attr)]
+    out = set(phrases)
+    for p in phrases:
+        out.update({p.upper(), p[:3], p[len(p) // 2:], p[1:-1]})
+        words = p.split()
+        out.update(words)
+    out.update({'', 'e', ' ', 'no such phrase anywhere', 'a\0b', '\0'})
+    return sorted(out)
+
+
+@pytest.mark.parametrize('attr, lookup', [
+    ('echoes_phrase', find_echoes),
+    ('plants_phrase', find_plantings),
+])
+def test_index_matches_linear_scan(attr, lookup):
+    for query in queries(attr):
+        assert lookup(query) == scan(attr, query), repr(query)
+
+
+def test_results_are_fresh_lists():
+    phrase = next(e.echoes_phrase for e in NARRATIVE_ORDER if e.echoes_phrase)
+    first = find_echoes(phrase)
+    first.clear()
+    assert find_echoes(phrase) == scan('echoes_phrase', phrase)
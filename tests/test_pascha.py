@@ -0,0 +1,34 @@
+"""Tests for the closed-form Orthodox Pascha computation in data.precomputed."""
+
+import pytest
+
+from data.liturgical_calendar import calculate_orthodox_pascha
+from data.precomputed import ORTHODOX_PASCHA_DATES, get_pascha_date
+
+# 2042-2050 as corrected in the table (it used to hold Western Easter dates)
+CORRECTED_2042_2050 = {
+    2042: (4, 13), 2043: (5, 3), 2044: (4, 24), 2045: (4, 9), 2046: (4, 29),
+    2047: (4, 21), 2048: (4, 5), 2049: (4, 25), 2050: (4, 17),
+}
+
+
+@pytest.mark.parametrize('year, month_day', sorted(CORRECTED_2042_2050.items()))
+def test_closed_form_matches_corrected_dates(year, month_day):
+    assert get_pascha_date(year) == month_day
+    assert ORTHODOX_PASCHA_DATES[year] == month_day
+
+
+def test_closed_form_matches_reference_table():
+    for year, month_day in ORTHODOX_PASCHA_DATES.items():
+        assert get_pascha_date(year) == month_day, year
+
+
+def test_closed_form_matches_liturgical_calendar_1900_2099():
+    for year in range(1900, 2100):
+        pascha = calculate_orthodox_pascha(year)
+        assert get_pascha_date(year) == (pascha.month, pascha.day), year
+
+
+@pytest.mark.parametrize('year', [1899, 2100])
+def test_years_outside_supported_range(year):
+    assert get_pascha_date(year) is None
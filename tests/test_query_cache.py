@@ -0,0 +1,106 @@
+"""Tests for scripts.query_cache."""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from scripts import query_cache
+from scripts.query_cache import read_json_cache, ttl_cache, write_json_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's monotonic clock with a settable one."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(query_cache, 'time', SimpleNamespace(
+        monotonic=lambda: now.value, time=time.time))
+    return now
+
+
+class Report:
+    def __init__(self):
+        self.calls = 0
+
+    @ttl_cache(seconds=30, maxsize=2)
+    def build(self, key=0):
+        self.calls += 1
+        return {'key': key, 'rows': [self.calls]}
+
+
+def test_results_are_reused_until_they_expire(clock):
+    report = Report()
+    report.build()
+    clock.value += 29
+    report.build()
+    assert report.calls == 1
+
+    clock.value += 2
+    assert report.build()['rows'] == [2]
+    assert report.calls == 2
+
+
+def test_oldest_entry_is_evicted_at_maxsize(clock):
+    report = Report()
+    report.build(1)
+    report.build(2)
+    report.build(3)
+    assert report.calls == 3
+
+    report.build(3)
+    report.build(2)
+    assert report.calls == 3
+    report.build(1)
+    assert report.calls == 4
+
+
+def test_callers_get_isolated_copies(clock):
+    report = Report()
+    first = report.build()
+    first['rows'].append('mutated')
+    second = report.build()
+    second['rows'].append('again')
+
+    assert report.build() == {'key': 0, 'rows': [1]}
+    assert report.calls == 1
+
+
+def test_instances_have_separate_entries(clock):
+    a, b = Report(), Report()
+    a.build()
+    b.build()
+    assert (a.calls, b.calls) == (1, 1)
+
+
+def test_unhashable_arguments_bypass_the_cache(clock):
+    report = Report()
+    report.build([1])
+    report.build([1])
+    assert report.calls == 2
+
+
+def test_cache_clear_forces_recompute(clock):
+    report = Report()
+    report.build()
+    Report.build.cache_clear()
+    report.build()
+    assert report.calls == 2
+
+
+def test_json_cache_round_trip_and_expiry(tmp_path):
+    path = tmp_path / 'cache' / 'status.json'
+    assert read_json_cache(path, 30) is None
+
+    write_json_cache(path, {'tables': [['verses', 10]]})
+    assert read_json_cache(path, 30) == {'tables': [['verses', 10]]}
+
+    stale = time.time() - 60
+    os.utime(path, (stale, stale))
+    assert read_json_cache(path, 30) is None
+
+
+def test_json_cache_ignores_corrupt_files(tmp_path):
+    path = tmp_path / 'status.json'
+    path.write_text('{not json')
+    assert read_json_cache(path, 30) is None
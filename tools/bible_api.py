@@ -6,20 +6,30 @@ Fetch verse text from various Bible APIs.
 This module provides:
 - Integration with Bible API services
 - Offline-first architecture with caching
+- Shared keep-alive HTTP session and on-disk response cache
 - Automatic retry logic for transient failures
 """
 
 import sys
 import json
+import asyncio
 import logging
 import re
+import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urljoin
 import urllib.request
 import urllib.error
 
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import config, CANONICAL_ORDER
@@ -51,6 +61,70 @@ class VerseNotFoundError(BibleAPIError):
     pass
 
 
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class ResponseCache:
+    """
+    On-disk cache of successful API responses, keyed by endpoint.
+    
+    Verse text does not change, so entries never expire. The SQLite file is
+    opened on first use; if it cannot be opened the cache is disabled.
+    """
+    
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), check_same_thread=False,
+                                       isolation_level=None)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses (endpoint TEXT PRIMARY KEY, body TEXT NOT NULL)"
+                )
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache disabled: {e}")
+                self._disabled = True
+        return self._conn
+    
+    def get(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for endpoint, or None."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT body FROM responses WHERE endpoint = ?", (endpoint,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"Response cache read failed: {e}")
+                return None
+        return json.loads(row[0]) if row else None
+    
+    def put(self, endpoint: str, response: Dict[str, Any]) -> None:
+        """Store a successful response."""
+        body = json.dumps(response)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (endpoint, body) VALUES (?, ?)",
+                    (endpoint, body)
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Response cache write failed: {e}")
+
+
 # ============================================================================
 # BIBLE API CLIENT
 # ============================================================================
@@ -73,6 +147,11 @@ class BibleAPIClient:
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0
     
+    # Shared by every client in the process: one keep-alive session (so TLS
+    # setup is paid once) and one on-disk response cache.
+    _session: Optional[Any] = None
+    _response_cache: Optional[ResponseCache] = None
+    
     def __init__(self, api_key: Optional[str] = None) -> None:
         """
         Initialize the Bible API client.
@@ -89,6 +168,42 @@ class BibleAPIClient:
         """Check if the API key is configured."""
         return bool(self.api_key)
     
+    @classmethod
+    def _get_session(cls) -> Optional[Any]:
+        """Return the shared requests session, or None when requests is unavailable."""
+        if cls._session is None and REQUESTS_AVAILABLE:
+            cls._session = requests.Session()
+        return cls._session
+    
+    @classmethod
+    def _get_response_cache(cls) -> ResponseCache:
+        """Return the shared on-disk response cache."""
+        if cls._response_cache is None:
+            cls._response_cache = ResponseCache(config.api.bible_api_cache)
+        return cls._response_cache
+    
+    def _open(self, url: str, headers: Dict[str, str]) -> bytes:
+        """
+        GET a URL and return the body.
+        
+        Uses the shared session when requests is installed, urllib otherwise.
+        Failures are raised as urllib.error.HTTPError / URLError either way.
+        """
+        session = self._get_session()
+        if session is None:
+            request = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        
+        try:
+            response = session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise urllib.error.URLError(e) from e
+        if response.status_code >= 400:
+            raise urllib.error.HTTPError(url, response.status_code, response.reason,
+                                         response.headers, None)
+        return response.content
+    
     def _make_request(
         self, 
         endpoint: str, 
@@ -108,25 +223,30 @@ class BibleAPIClient:
             logger.warning("Bible API key not configured")
             return None
         
+        cache = self._get_response_cache()
+        cached = cache.get(endpoint)
+        if cached is not None:
+            return cached
+        
         url = urljoin(self.base_url + '/', endpoint)
         headers = {
             'api-key': self.api_key,
             'Accept': 'application/json'
         }
         
-        request = urllib.request.Request(url, headers=headers)
-        
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                return json.loads(response.read().decode('utf-8'))
+            result = json.loads(self._open(url, headers).decode('utf-8'))
+            cache.put(endpoint, result)
+            return result
         except urllib.error.HTTPError as e:
             if e.code == 401:
                 logger.error("Invalid API key")
             elif e.code == 404:
                 logger.debug(f"Resource not found: {endpoint}")
-            elif e.code >= 500 and retries < self.MAX_RETRIES:
-                logger.warning(f"Server error {e.code}, retrying...")
-                time.sleep(self.RETRY_DELAY * (retries + 1))
+            elif (e.code == 429 or e.code >= 500) and retries < self.MAX_RETRIES:
+                # Rate limited or server error: back off exponentially
+                logger.warning(f"HTTP error {e.code}, retrying...")
+                time.sleep(self.RETRY_DELAY * (2 ** retries))
                 return self._make_request(endpoint, retries + 1)
             else:
                 logger.error(f"HTTP error {e.code}: {e.reason}")
@@ -307,6 +427,7 @@ class VerseFetcher:
     """
     
     RATE_LIMIT_DELAY: float = 0.2  # Seconds between API calls
+    UPDATE_BATCH_SIZE: int = 500  # Verse texts written per UPDATE statement
     
     def __init__(self, db: Optional[Any] = None) -> None:
         """
@@ -372,7 +493,34 @@ class VerseFetcher:
         """
         if not book or chapter <= 0 or verse <= 0:
             return None
-            
+        
+        text = self._fetch_local(book, chapter, verse, version, use_cache)
+        if text:
+            return text
+        
+        # Layer 3: API fallback
+        text = self.api.get_verse(book, chapter, verse, version)
+        self._stats['api_calls'] += 1
+        
+        if text:
+            self._cache[f"{book}_{chapter}_{verse}_{version}"] = text
+        
+        return text
+    
+    def _fetch_local(
+        self, 
+        book: str, 
+        chapter: int, 
+        verse: int,
+        version: str = 'kjv', 
+        use_cache: bool = True
+    ) -> Optional[str]:
+        """
+        Look a verse up in the memory cache and offline database only.
+        
+        Returns:
+            Verse text, or None if it would need an API call.
+        """
         cache_key = f"{book}_{chapter}_{verse}_{version}"
         
         # Layer 1: Memory cache
@@ -391,14 +539,7 @@ class VerseFetcher:
             except Exception as e:
                 logger.warning(f"Offline provider error: {e}")
         
-        # Layer 3: API fallback
-        text = self.api.get_verse(book, chapter, verse, version)
-        self._stats['api_calls'] += 1
-        
-        if text:
-            self._cache[cache_key] = text
-        
-        return text
+        return None
     
     def get_fetch_statistics(self) -> Dict[str, Any]:
         """
@@ -446,29 +587,21 @@ class VerseFetcher:
         
         return verses or []
     
-    def populate_missing_verses(
+    def _missing_verses(
         self, 
-        book_name: Optional[str] = None, 
-        limit: int = 100
-    ) -> int:
+        book_name: Optional[str], 
+        limit: int
+    ) -> List[Dict[str, Any]]:
         """
-        Populate missing verse text in database.
+        Get up to ``limit`` verses whose text is missing from the database.
         
         Args:
             book_name: Optional book name to filter by.
-            limit: Maximum number of verses to populate.
+            limit: Maximum number of verses to return.
             
         Returns:
-            Number of verses updated.
+            Verse rows (id, verse_reference, book_name, chapter, verse_number).
         """
-        if not self.db:
-            logger.error("Database not configured")
-            return 0
-        
-        if limit <= 0:
-            return 0
-        
-        # Get verses without text
         query = """
             SELECT v.id, v.verse_reference, cb.name as book_name, v.chapter, v.verse_number
             FROM verses v
@@ -485,32 +618,181 @@ class VerseFetcher:
         params.append(limit)
         
         try:
-            verses = self.db.fetch_all(query, tuple(params))
+            return self.db.fetch_all(query, tuple(params))
         except Exception as e:
             logger.error(f"Failed to fetch verses: {e}")
+            return []
+    
+    def _populate_verse(self, verse: Dict[str, Any]) -> bool:
+        """
+        Fetch one verse's text and store it in the database.
+        
+        Args:
+            verse: Row from _missing_verses().
+            
+        Returns:
+            True if the verse was updated.
+        """
+        text = self.fetch_verse(
+            verse['book_name'], 
+            verse['chapter'], 
+            verse['verse_number']
+        )
+        
+        if text:
+            try:
+                self.db.execute(
+                    "UPDATE verses SET text_kjv = %s WHERE id = %s",
+                    (text, verse['id'])
+                )
+                logger.info(f"Updated: {verse['verse_reference']}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to update verse {verse['id']}: {e}")
+        return False
+    
+    def populate_missing_verses(
+        self, 
+        book_name: Optional[str] = None, 
+        limit: int = 100
+    ) -> int:
+        """
+        Populate missing verse text in database.
+        
+        Args:
+            book_name: Optional book name to filter by.
+            limit: Maximum number of verses to populate.
+            
+        Returns:
+            Number of verses updated.
+        """
+        if not self.db:
+            logger.error("Database not configured")
+            return 0
+        
+        if limit <= 0:
             return 0
         
         updated = 0
-        for verse in verses:
-            text = self.fetch_verse(
-                verse['book_name'], 
-                verse['chapter'], 
-                verse['verse_number']
-            )
+        for verse in self._missing_verses(book_name, limit):
+            if self._populate_verse(verse):
+                updated += 1
+            
+            time.sleep(self.RATE_LIMIT_DELAY)  # Rate limiting
+        
+        return updated
+    
+    async def populate_missing_verses_async(
+        self, 
+        book_name: Optional[str] = None, 
+        limit: int = 100,
+        concurrency: int = 32
+    ) -> int:
+        """
+        Populate missing verse text with up to ``concurrency`` API fetches in
+        flight.
+        
+        Verses found in the memory cache or offline database are resolved
+        immediately. Only API fetches are rate limited (one started per
+        RATE_LIMIT_DELAY) and run in worker threads, so their network latency
+        overlaps. Texts are written back UPDATE_BATCH_SIZE rows per statement
+        as soon as that many have been fetched; if a batch fails, its rows are
+        retried one at a time.
+        
+        Args:
+            book_name: Optional book name to filter by.
+            limit: Maximum number of verses to populate.
+            concurrency: Maximum number of API fetches at once.
             
+        Returns:
+            Number of verses updated.
+        """
+        if not self.db:
+            logger.error("Database not configured")
+            return 0
+        
+        if limit <= 0:
+            return 0
+        
+        verses = await asyncio.to_thread(self._missing_verses, book_name, limit)
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        throttle = asyncio.Lock()
+        next_start = loop.time()
+        
+        async def fetch(verse: Dict[str, Any]) -> Optional[str]:
+            nonlocal next_start
+            ref = (verse['book_name'], verse['chapter'], verse['verse_number'])
+            text = self._fetch_local(*ref)
             if text:
-                try:
-                    self.db.execute(
-                        "UPDATE verses SET text_kjv = %s WHERE id = %s",
-                        (text, verse['id'])
-                    )
-                    updated += 1
-                    logger.info(f"Updated: {verse['verse_reference']}")
-                except Exception as e:
-                    logger.error(f"Failed to update verse {verse['id']}: {e}")
+                return text
+            async with semaphore:
+                async with throttle:  # Rate limiting
+                    delay = next_start - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    next_start = loop.time() + self.RATE_LIMIT_DELAY
+                return await asyncio.to_thread(self.fetch_verse, *ref)
+        
+        async def fetch_pair(verse: Dict[str, Any]) -> Tuple[int, Optional[str]]:
+            return verse['id'], await fetch(verse)
+        
+        tasks = [asyncio.ensure_future(fetch_pair(v)) for v in verses]
+        updated = 0
+        bucket: List[Tuple[int, str]] = []
+        try:
+            # Write each bucket as soon as it fills, so an interrupted run
+            # keeps everything fetched before the last full bucket
+            for next_done in asyncio.as_completed(tasks):
+                verse_id, text = await next_done
+                if text:
+                    bucket.append((verse_id, text))
+                if len(bucket) >= self.UPDATE_BATCH_SIZE:
+                    updated += await asyncio.to_thread(self._update_verse_texts, bucket)
+                    bucket = []
+            if bucket:
+                updated += await asyncio.to_thread(self._update_verse_texts, bucket)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return updated
+    
+    def _update_verse_texts(self, updates: List[Tuple[int, str]]) -> int:
+        """
+        Store fetched texts with one UPDATE ... FROM (VALUES ...) statement.
+        
+        Args:
+            updates: (verse id, text) pairs.
             
-            time.sleep(self.RATE_LIMIT_DELAY)  # Rate limiting
+        Returns:
+            Number of verses updated.
+        """
+        values = ", ".join(["(%s, %s)"] * len(updates))
+        query = f"""
+            UPDATE verses AS v SET text_kjv = data.text
+            FROM (VALUES {values}) AS data(id, text)
+            WHERE v.id = data.id
+        """
+        try:
+            self.db.execute(query, [value for pair in updates for value in pair])
+        except Exception as e:
+            logger.warning(f"Batch update of {len(updates)} verses failed, retrying row by row: {e}")
+        else:
+            logger.info(f"Updated {len(updates)} verses")
+            return len(updates)
         
+        updated = 0
+        for verse_id, text in updates:
+            try:
+                self.db.execute(
+                    "UPDATE verses SET text_kjv = %s WHERE id = %s",
+                    (text, verse_id)
+                )
+                updated += 1
+            except Exception as e:
+                logger.error(f"Failed to update verse {verse_id}: {e}")
+        logger.info(f"Updated {updated} verses")
         return updated
 
 